@@ -2,12 +2,24 @@
 # -*- coding: utf-8 -*-
 # vim: tabstop=4 shiftwidth=4 expandtab filetype=python
 
+import io
 import os
 import re
 import sys
+import json
+import string
+import hashlib
+import threading
+import unicodedata
 from difflib import SequenceMatcher
 
+try:
+    unichr
+except NameError:  # py3
+    unichr = chr
+
 __version__ = '0.5.0'
+DATA_VERSION = '08380ace5d3b8020934e9062ceb2705b'
 
 DEBUG = False
 PURGE_QUERY = False
@@ -17,70 +29,506 @@ RATIO = 0.75
 FMT = '{title} - {vocals}, {year}'
 LIST_ALL = False
 SHOW_ENVS = False
+DATA_PATH = ''
+OUTPUT = 'text'  # text, jsonl, tsv, or alfred
+ALFRED_RERUN = ''  # seconds, 0.1 to 5.0
+ALFRED_CACHE = ''  # seconds, 5 to 86400
+CACHE_DIR = ''
+
+global_keys = [
+    'DEBUG', 'PURGE_QUERY', 'MODE', 'LIMIT', 'RATIO', 'FMT', 'LIST_ALL', 'SHOW_ENVS', 'DATA_PATH',
+    'OUTPUT', 'ALFRED_RERUN', 'ALFRED_CACHE', 'CACHE_DIR',
+]
+
+song_keys = ['title', 'album', 'songwriters', 'vocals', 'year', 'notes']
+
+outputs = ['text', 'jsonl', 'tsv', 'alfred']
 
-global_keys = ['DEBUG', 'PURGE_QUERY', 'MODE', 'LIMIT', 'RATIO', 'FMT', 'LIST_ALL', 'SHOW_ENVS']
+tsv_keys = ['title', 'album', 'songwriters', 'vocals', 'year', 'notes']
 
 re_brackets = re.compile(r'\([^()]+\)')
 
+re_fmt_field = re.compile(r'^\w+$')
+
+# footnotes like `[25]`, song names like `("Rip It Up")`, aliases like `(as Bernard Webb)`
+re_name_notes = re.compile(r'\[\w+\]|\("[^"]*"\)|\(a\.?[sk][^)]*\)')
+# `/` between names, but not in `N/A`
+# not a raw string, py2 re does not know `\u` escapes
+re_name_sep = re.compile(u'[\\n,\u2013()]|(?<=\\w\\w)/| and ')
+re_name_prefix = re.compile(r'^(?:with|and|arr\.)\s+')
+
+name_aliases = {
+    'John Lennon': 'Lennon',
+    'Paul McCartney': 'McCartney',
+    'George Harrison': 'Harrison',
+    'Ringo Starr': 'Starr',
+    'Starkey': 'Starr',
+}
+
+# `vocals` counts every singer of a song, backing ones included,
+# `lead_vocal` counts only the first one listed
+stats_keys = ['year', 'album', 'lead_vocal', 'vocals', 'songwriters']
+
+# fields that may contain more than one name
+multi_value_keys = ['vocals', 'songwriters']
+
+# number of similar and related songs precomputed for each song
+similar_limit = 5
+
+# closest song below this ratio is not worth a suggestion
+suggest_min_ratio = 0.5
+
 
 def debugp(s):
     if DEBUG:
         print('DEBUG: ' + s)
 
 
-def match_songs(query, mode):
-    # keep only alpha
-    sig = ''.join(i for i in query if i.isalpha()).lower()
+def build_normalize_table():
+    """
+    Translation table for signatures, covers latin characters and general punctuation:
+    letters with diacritics are folded to base letters in lower case,
+    characters that are not letters are deleted.
+    """
+    table = {}
+    for i in range(0x250):
+        ch = unichr(i)
+        if not ch.isalpha():
+            table[i] = None
+            continue
+        # `é` -> `e` + combining acute accent
+        folded = ''.join(j for j in unicodedata.normalize('NFKD', ch) if j.isalpha()).lower()
+        if folded != ch:
+            table[i] = folded
+    for i in range(0x2000, 0x2070):
+        table[i] = None
+    return table
+
+
+normalize_table = build_normalize_table()
+
+
+def normalize(s):
+    """
+    Signature of a song title or a query, e.g. `Bésame Mucho` -> `besamemucho`,
+    used by both converter.py and matching
+    """
+    # query from sys.argv is bytes in py2
+    if not isinstance(s, type(u'')):
+        s = s.decode('utf-8')
+    s = s.translate(normalize_table)
+    # characters out of the table
+    if not s.isalpha():
+        s = ''.join(i for i in s if i.isalpha())
+    return s.lower()
+
+
+class Catalog(object):
+    """
+    An immutable snapshot of the songs and everything built from them.
+    Reloading builds a new Catalog and swaps it in as a whole,
+    a Catalog is never modified in place except for filling in missing tables.
+    """
+
+    def __init__(self, songs, version, tables=None):
+        self.songs = songs
+        self.version = version
+        # precomputed tables are baked into the code and written next to
+        # the data file by converter.py, a missing one is built the first
+        # time it is used, so that a plain query never waits for it
+        self.tables = dict(tables or {})
+
+    def table(self, key):
+        t = self.tables.get(key)
+        if t is None:
+            debugp('build table: {}'.format(key))
+            # threads building the same table get equal ones, either may win
+            t = self.tables[key] = build_table(key, self.songs)
+        return t
+
+    def build_tables(self):
+        """
+        Build all the missing tables, before the catalog is written out or swapped in
+        """
+        for k in table_keys:
+            self.table(k)
+        return self.tables
+
+
+table_keys = ['stats', 'alfred', 'similar', 'related']
+
+
+def build_table(key, songs):
+    return {
+        'stats': build_stats,
+        'alfred': build_alfred_items,
+        'similar': build_similar,
+        'related': build_related,
+    }[key](songs)
+
+
+def split_names(s):
+    """
+    Split a vocals or songwriters field into names,
+    e.g. `Lennon, with McCartney and Harrison` -> `['Lennon', 'McCartney', 'Harrison']`
+    """
+    names = []
+    for i in re_name_sep.split(re_name_notes.sub('', s)):
+        i = re_name_prefix.sub('', i.strip())
+        i = name_aliases.get(i, i)
+        if i and i not in names:
+            names.append(i)
+    return names
+
+
+def song_values(s, key):
+    if key == 'lead_vocal':
+        return split_names(s['vocals'])[:1]
+    if key in multi_value_keys:
+        return split_names(s[key])
+    if s[key]:
+        return [s[key]]
+    return []
+
+
+def build_stats(songs):
+    """
+    Count songs grouped by each stats key, and by each pair of them:
+
+        {'year': {'1965': 10}, 'songwriters,year': {'Harrison': {'1965': 2}}}
+    """
+    stats = {}
+    for a in stats_keys:
+        stats[a] = {}
+        for b in stats_keys:
+            if b != a:
+                stats[a + ',' + b] = {}
+
+    for s in songs.values():
+        values = dict((k, song_values(s, k)) for k in stats_keys)
+        for a in stats_keys:
+            for va in values[a]:
+                stats[a][va] = stats[a].get(va, 0) + 1
+                for b in stats_keys:
+                    if b == a:
+                        continue
+                    t = stats[a + ',' + b].setdefault(va, {})
+                    for vb in values[b]:
+                        t[vb] = t.get(vb, 0) + 1
+    return stats
+
+
+def build_similar(songs):
+    """
+    Signatures of the most similar titles of each song, by the same ratio as rank match
+    """
+    sigs = list(songs)
+    scores = dict((k, []) for k in sigs)
+    sm = SequenceMatcher(None)
+    for i, a in enumerate(sigs):
+        # SequenceMatcher caches the analysis of seq2
+        sm.set_seq2(a)
+        for b in sigs[i + 1:]:
+            sm.set_seq1(b)
+            ratio = sm.ratio()
+            scores[a].append((-ratio, b))
+            scores[b].append((-ratio, a))
+    return dict((k, [i[1] for i in sorted(l)[:similar_limit]]) for k, l in scores.items())
+
+
+def build_related(songs):
+    """
+    Signatures of the songs sharing album or vocalists with each song, keyed by title
+    like the alfred table, songs from the same album come first
+    """
+    by_album = {}
+    by_vocalist = {}
+    for k, s in songs.items():
+        by_album.setdefault(s['album'], []).append(k)
+        for v in split_names(s['vocals']):
+            by_vocalist.setdefault(v, []).append(k)
+
+    related = {}
+    for k, s in songs.items():
+        scores = {}
+        for i in by_album[s['album']]:
+            scores[i] = scores.get(i, 0) + 10
+        for v in split_names(s['vocals']):
+            for i in by_vocalist[v]:
+                scores[i] = scores.get(i, 0) + 1
+        scores.pop(k)
+        l = sorted(scores.items(), key=lambda x: (-x[1], songs[x[0]]['title']))
+        related[s['title']] = [i[0] for i in l[:similar_limit]]
+    return related
+
+
+def related_songs(s, c=None):
+    if c is None:
+        c = get_catalog()
+    return [c.songs[i] for i in c.table('related').get(s['title'], [])]
+
+
+def query_stats(keys, value=None, c=None):
+    """
+    Return rows of `(value, count)` for one key, rows of `(value_a, value_b, count)`
+    for two keys, or rows of `(value_b, count)` if `value` of the first key is given
+    """
+    if c is None:
+        c = get_catalog()
+    stats = c.table('stats')
+    if keys not in stats:
+        raise ValueError('stats keys are not supported: ' + keys)
+    table = stats[keys]
+    if value is not None:
+        if ',' not in keys:
+            raise ValueError('stats value requires two keys: ' + keys)
+        table = table.get(value, {})
+        return sorted(table.items())
+
+    if ',' not in keys:
+        return sorted(table.items())
+    rows = []
+    for va, t in sorted(table.items()):
+        for vb, n in sorted(t.items()):
+            rows.append((va, vb, n))
+    return rows
+
+
+def get_catalog():
+    return catalog
+
+
+def swap_catalog(c):
+    # rebinding a module global is atomic, searches that already
+    # hold the old snapshot keep using it until they finish
+    global catalog
+    debugp('swap catalog: {} -> {}'.format(catalog.version, c.version))
+    catalog = c
+
+
+def load_catalog(path):
+    """
+    Load a Catalog from the json data file written by converter.py,
+    the version of the catalog is the md5 of the file content.
+    """
+    with io.open(path, 'rb') as f:
+        data = f.read()
+    songs = json.loads(data.decode('utf-8'))
+    validate_songs(songs)
+    version = hashlib.md5(data).hexdigest()
+    return Catalog(songs, version, load_tables(tables_path_of(path), version))
+
+
+def tables_path_of(path):
+    """
+    `data/songs.json` -> `data/songs.tables.json`
+    """
+    return os.path.splitext(path)[0] + '.tables.json'
+
+
+def load_tables(path, version):
+    """
+    Load the precomputed tables written by converter.py,
+    return None if they are missing or not built from the data of `version`
+    """
+    try:
+        with io.open(path, 'rb') as f:
+            d = json.loads(f.read().decode('utf-8'))
+    except (IOError, OSError, ValueError) as e:
+        debugp('tables not loaded: {}'.format(e))
+        return None
+    if not isinstance(d, dict) or d.get('data_version') != version:
+        debugp('tables are stale: {}'.format(path))
+        return None
+    tables = d.get('tables')
+    if not isinstance(tables, dict) or sorted(tables) != sorted(table_keys):
+        debugp('tables are incomplete: {}'.format(path))
+        return None
+    return tables
+
+
+def validate_songs(songs):
+    """
+    Raise ValueError if songs loaded from a data file are not
+    a dict of signature to song dict with all the song keys in strings
+    """
+    if not isinstance(songs, dict):
+        raise ValueError('songs data is not an object')
+    for k, s in songs.items():
+        if not isinstance(s, dict):
+            raise ValueError('song is not an object: {}'.format(k))
+        missing = [i for i in song_keys if i not in s]
+        if missing:
+            raise ValueError('song {} misses keys: {}'.format(k, ', '.join(missing)))
+        # json strings are unicode in both py2 and py3
+        invalid = [i for i in song_keys if not isinstance(s[i], type(u''))]
+        if invalid:
+            raise ValueError('song {} has non-string values: {}'.format(k, ', '.join(invalid)))
+
+
+class CatalogReloader(object):
+    """
+    Watch a json data file, rebuild the catalog in the background
+    and swap it in when the file changes.
+
+    Usage in a long-running process:
+
+        reloader = CatalogReloader('data/songs.json')
+        reloader.start()
+    """
+
+    def __init__(self, path, interval=10):
+        self.path = path
+        self.interval = interval
+        self._mtime = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def check(self):
+        """
+        Swap in a new catalog if the data file has changed,
+        return True if the swap happens
+        """
+        mtime = os.stat(self.path).st_mtime
+        if mtime == self._mtime:
+            return False
+        c = load_catalog(self.path)
+        self._mtime = mtime
+        # mtime changed but content is the same
+        if c.version == get_catalog().version:
+            debugp('catalog unchanged: {}'.format(c.version))
+            return False
+        # in the background, so that searches never build tables
+        c.build_tables()
+        swap_catalog(c)
+        return True
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            try:
+                self.check()
+            except Exception as e:
+                # keep serving the current catalog, retry on next tick
+                debugp('catalog reload failed: {}: {}'.format(type(e).__name__, e))
+            if self._stop.wait(self.interval):
+                return
+
+
+def to_alfred_item(s):
+    # %-format keeps the string type of the values, unicode or py2 bytes
+    subtitle = '%s / %s / %s' % (s['vocals'], s['year'], s['album'])
+    return {
+        'uid': s['title'],
+        'title': s['title'],
+        'subtitle': subtitle,
+        'arg': subtitle,
+        'autocomplete': s['title'],
+    }
+
+
+def build_alfred_items(songs):
+    """
+    Render Alfred Script Filter items as json once, keyed by title
+    """
+    items = {}
+    for s in songs.values():
+        items[s['title']] = json.dumps(to_alfred_item(s), ensure_ascii=False, sort_keys=True)
+    return items
+
+
+def format_alfred_output(matched, c):
+    """
+    Join the pre-rendered items of the matched songs into Alfred Script Filter json
+    """
+    items = c.table('alfred')
+    out = '{"items": [' + ', '.join(items[s['title']] for s in matched) + ']'
+    if ALFRED_RERUN:
+        out += ', "rerun": ' + json.dumps(ALFRED_RERUN)
+    if ALFRED_CACHE:
+        out += ', "cache": ' + json.dumps({'seconds': ALFRED_CACHE, 'loosereload': True}, sort_keys=True)
+    return out + '}'
+
+
+def match_songs(query, mode, c=None, suggestions=None):
+    """
+    If `suggestions` is a list, songs close to the query are added to it
+    when rank match has no result
+    """
+    # hold one catalog snapshot during the whole search
+    if c is None:
+        c = get_catalog()
+
+    sig = normalize(query)
     debugp('query={} sig={}'.format(repr(query), sig))
 
     results = []
     for m in mode.split(','):
-        results.extend(call_match_by_mode(m, sig))
+        results.extend(call_match_by_mode(m, sig, c, suggestions))
     return limit_list(results, LIMIT)
 
 
-def call_match_by_mode(mode, sig):
+def call_match_by_mode(mode, sig, c, suggestions=None):
     if mode == 'rank':
-        return rank_match(sig, RATIO, LIMIT)
+        return rank_match(sig, RATIO, LIMIT, c, suggestions)
     elif mode == 'fuzzy':
-        return fuzzy_match(sig, LIMIT)
+        return fuzzy_match(sig, LIMIT, c)
     else:
         raise ValueError('mode is not supported: ' + mode)
 
 
-def precise_match(sig):
-    return songs.get(sig)
+def precise_match(sig, c):
+    return c.songs.get(sig)
 
 
-def rank_match(sig, min_ratio, limit):
-    s = precise_match(sig)
+def rank_match(sig, min_ratio, limit, c, suggestions=None):
+    s = precise_match(sig, c)
     if s:
         return [s]
     debugp('precise match no result')
 
     compares = []
-    for k, s in songs.items():
+    for k, s in c.songs.items():
         ratio = SequenceMatcher(None, k, sig).ratio()
-        compares.append((ratio, s))
+        compares.append((ratio, k, s))
     compares = sorted(compares, key=lambda x: x[0], reverse=True)
 
     candidates = []
-    for ratio, s in compares:
+    for ratio, k, s in compares:
         if ratio > min_ratio:
             debugp('rank match candidate: {} {}'.format(ratio, s))
             candidates.append(s)
     if not candidates:
-        debugp('rank match no candidates, closest match: {}'.format(compares[0]))
+        if not compares:
+            return candidates
+        ratio, k, s = compares[0]
+        debugp('rank match no candidates, closest match: {} {}'.format(ratio, s))
+        # the closest song and the songs similar to it, from the precomputed table
+        if suggestions is not None and ratio > suggest_min_ratio:
+            suggestions.append(s)
+            for i in c.table('similar').get(k, [])[:similar_limit - 1]:
+                suggestions.append(c.songs[i])
         return candidates
 
     debugp('rank match: total={} limit={}'.format(len(candidates), limit))
     return limit_list(candidates, limit)
 
 
-def fuzzy_match(sig, limit):
+def fuzzy_match(sig, limit, c):
     c_starts = []
     c_in = []
-    for k, s in songs.items():
+    for k, s in c.songs.items():
         if k.startswith(sig):
             c_starts.append(s)
             continue
@@ -108,10 +556,103 @@ def limit_list(l, limit):
     return l
 
 
-# seems py3 will fail on this function if LC_ALL is not UTF-8,
-# so running this script in subprocess must ensure all envs are inherited
-def format_output_line(s):
-    return FMT.format(**s)
+def compile_fmt(fmt):
+    """
+    Compile FMT into a function that formats a song. A FMT of plain `{key}` fields
+    becomes a %-format string, which is much faster than `fmt.format(**s)`
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(fmt):
+        parts.append(literal.replace('%', '%%'))
+        if field is None:
+            continue
+        if spec or conversion or not re_fmt_field.match(field):
+            return lambda s: fmt.format(**s)
+        parts.append('%(' + field + ')s')
+    tmpl = ''.join(parts)
+    return lambda s: tmpl % s
+
+
+def format_jsonl_line(s):
+    return json.dumps(s, ensure_ascii=False, sort_keys=True)
+
+
+def escape_tsv(v):
+    # str.replace works on both unicode and py2 byte strings
+    return v.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def format_tsv_line(s):
+    return '\t'.join(escape_tsv(s[k]) for k in tsv_keys)
+
+
+def render_output(matched, c):
+    """
+    Render the matched songs in OUTPUT format as one string
+    """
+    if OUTPUT == 'alfred':
+        return format_alfred_output(matched, c) + '\n'
+    if OUTPUT == 'jsonl':
+        lines = [format_jsonl_line(s) for s in matched]
+    elif OUTPUT == 'tsv':
+        lines = ['\t'.join(tsv_keys)] + [format_tsv_line(s) for s in matched]
+    else:
+        lines = list(map(compile_fmt(FMT), matched))
+    return '\n'.join(lines) + '\n'
+
+
+render_cache = {}
+
+
+def render_all(c):
+    """
+    Render all songs as bytes, cached in memory and in CACHE_DIR if it is set,
+    by catalog version and output settings
+    """
+    key = hashlib.md5(json.dumps(
+        [__version__, c.version, OUTPUT, FMT, ALFRED_RERUN, ALFRED_CACHE]
+    ).encode('utf-8')).hexdigest()
+    if key in render_cache:
+        return render_cache[key]
+
+    path = None
+    if CACHE_DIR:
+        path = os.path.join(CACHE_DIR, 'list_all.{}.{}'.format(key, OUTPUT))
+        if os.path.exists(path):
+            debugp('list all from cache: {}'.format(path))
+            with io.open(path, 'rb') as f:
+                data = f.read()
+            render_cache[key] = data
+            return data
+
+    data = to_utf8(render_output(list(c.songs.values()), c))
+    if path:
+        if not os.path.isdir(CACHE_DIR):
+            os.makedirs(CACHE_DIR)
+        # rename is atomic, other processes never read a half written cache
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+        with io.open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.rename(tmp_path, path)
+    render_cache[key] = data
+    return data
+
+
+def to_utf8(s):
+    # song values are byte strings already in py2
+    if isinstance(s, bytes):
+        return s
+    return s.encode('utf-8')
+
+
+def write_output(data):
+    """
+    Write utf-8 bytes to stdout in one call, regardless of the locale
+    """
+    sys.stdout.flush()
+    out = getattr(sys.stdout, 'buffer', sys.stdout)
+    out.write(data)
+    out.flush()
 
 
 def purge_query(s):
@@ -122,6 +663,29 @@ def purge_query(s):
     return s
 
 
+def parse_env_number(key, convert, min_value, max_value):
+    """
+    Convert the global var of `key` to a number in range,
+    print the error and exit if it is not
+    """
+    value = globals()[key]
+    try:
+        n = convert(value)
+    except ValueError:
+        n = None
+    if n is None or not min_value <= n <= max_value:
+        print('BS_{} must be a number from {} to {}: {}'.format(key, min_value, max_value, value))
+        sys.exit(1)
+    globals()[key] = n
+
+
+usage = """\
+Usage: beatles_song.py [--related] <query>
+       beatles_song.py --stats <key>[,<key>] [<value>]
+
+stats keys: {}""".format(', '.join(stats_keys))
+
+
 def main():
     # update global vars by env
     for i in global_keys:
@@ -139,16 +703,51 @@ def main():
             print('  BS_{:20}{}'.format(i, globals()[i]))
         return
 
+    if OUTPUT not in outputs:
+        print('output is not supported: ' + OUTPUT)
+        sys.exit(1)
+    # ranges accepted by Alfred
+    if ALFRED_RERUN:
+        parse_env_number('ALFRED_RERUN', float, 0.1, 5.0)
+    if ALFRED_CACHE:
+        parse_env_number('ALFRED_CACHE', int, 5, 86400)
+
+    # use data file instead of the built-in songs
+    if DATA_PATH:
+        try:
+            swap_catalog(load_catalog(DATA_PATH))
+        except (IOError, OSError, ValueError) as e:
+            print('data file is not loaded: {}'.format(e))
+            sys.exit(1)
+    c = get_catalog()
+
     # list all
     if LIST_ALL:
-        for s in songs.values():
-            print(format_output_line(s))
+        write_output(render_all(c))
+        return
+
+    # stats
+    if sys.argv[1:2] == ['--stats']:
+        if not 3 <= len(sys.argv) <= 4:
+            print(usage)
+            sys.exit(1)
+        try:
+            rows = query_stats(*sys.argv[2:4])
+        except ValueError as e:
+            print(str(e))
+            print(usage)
+            sys.exit(1)
+        write_output(to_utf8(''.join('\t'.join('%s' % i for i in row) + '\n' for row in rows)))
         return
 
+    args = sys.argv[1:]
+    related = args[:1] == ['--related']
+    if related:
+        args = args[1:]
     try:
-        query = sys.argv[1]
+        query = args[0]
     except IndexError:
-        print('Usage: beatles_song.py <query>')
+        print(usage)
         sys.exit(1)
     if PURGE_QUERY:
         query = purge_query(query)
@@ -157,16 +756,24 @@ def main():
         MODE, RATIO, LIMIT, FMT,
     ))
     # match songs
+    suggestions = []
     try:
-        matched = match_songs(query, MODE)
+        matched = match_songs(query, MODE, c, suggestions)
     except ValueError as e:
         print(str(e))
         sys.exit(1)
 
-    if not matched:
+    if related and matched:
+        matched = limit_list(related_songs(matched[0], c), LIMIT)
+
+    if not matched and suggestions:
+        sys.stderr.write('Did you mean: {}?\n'.format(', '.join(s['title'] for s in suggestions)))
+        # shown as items in alfred
+        matched = suggestions if OUTPUT == 'alfred' else []
+    # alfred shows its fallback searches for empty items
+    if not matched and OUTPUT != 'alfred':
         sys.exit(1)
-    for s in matched:
-        print(format_output_line(s))
+    write_output(to_utf8(render_output(matched, c)))
 
 
 songs = {
@@ -203,7 +810,7 @@ songs = {
 "blackbird": {"album": "The Beatles", "notes": "", "songwriters": "McCartney", "title": "Blackbird", "vocals": "McCartney", "year": "1968"},
 "bluejayway": {"album": "Magical Mystery Tour", "notes": "", "songwriters": "Harrison", "title": "Blue Jay Way", "vocals": "Harrison", "year": "1967"},
 "boys": {"album": "UK: Please Please Me US: The Early Beatles", "notes": "Cover", "songwriters": "Luther Dixon\nWes Farrell", "title": "Boys", "vocals": "Starr", "year": "1963"},
-"bésamemucho": {"album": "Anthology 1", "notes": "Cover", "songwriters": "Consuelo Velázquez\nSunny Skylar", "title": "Bésame Mucho", "vocals": "McCartney", "year": "1962"},
+"besamemucho": {"album": "Anthology 1", "notes": "Cover", "songwriters": "Consuelo Velázquez\nSunny Skylar", "title": "Bésame Mucho", "vocals": "McCartney", "year": "1962"},
 "cantbuymelove": {"album": "UK: A Hard Day's Night US: Hey Jude", "notes": "", "songwriters": "McCartney", "title": "Can't Buy Me Love", "vocals": "McCartney, with Lennon", "year": "1964"},
 "carol": {"album": "Live at the BBC", "notes": "Cover", "songwriters": "Chuck Berry", "title": "Carol", "vocals": "Lennon", "year": "1963"},
 "carrythatweight": {"album": "Abbey Road", "notes": "", "songwriters": "McCartney[32]", "title": "Carry That Weight", "vocals": "McCartney, with Lennon, Harrison, and Starr", "year": "1969"},
@@ -474,9 +1081,8692 @@ songs = {
 "youvegottohideyourloveaway": {"album": "Help!", "notes": "", "songwriters": "Lennon", "title": "You've Got to Hide Your Love Away", "vocals": "Lennon", "year": "1965"},
 "youvereallygotaholdonme": {"album": "UK: With the Beatles US: The Beatles Second Album", "notes": "Cover", "songwriters": "Smokey Robinson", "title": "You've Really Got a Hold on Me", "vocals": "Lennon and Harrison", "year": "1963"},
 "youngblood": {"album": "Live at the BBC", "notes": "Cover", "songwriters": "Jerry Leiber and Mike Stoller", "title": "Young Blood", "vocals": "Harrison", "year": "1963"},
-"yourmothershouldknow": {"album": "Magical Mystery Tour", "notes": "", "songwriters": "McCartney", "title": "Your Mother Should Know", "vocals": "McCartney", "year": "1967"},
+"yourmothershouldknow": {"album": "Magical Mystery Tour", "notes": "", "songwriters": "McCartney", "title": "Your Mother Should Know", "vocals": "McCartney", "year": "1967"}
 }
 
+tables = {
+ "alfred": {
+  "12-Bar Original": "{\"arg\": \"Instrumental / 1965 / Anthology 2\", \"autocomplete\": \"12-Bar Original\", \"subtitle\": \"Instrumental / 1965 / Anthology 2\", \"title\": \"12-Bar Original\", \"uid\": \"12-Bar Original\"}",
+  "A Day in the Life": "{\"arg\": \"Lennon, McCartney / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"A Day in the Life\", \"subtitle\": \"Lennon, McCartney / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"A Day in the Life\", \"uid\": \"A Day in the Life\"}",
+  "A Hard Day's Night": "{\"arg\": \"Lennon, with McCartney / 1964 / UK: A Hard Day's Night US: 1962–1966\", \"autocomplete\": \"A Hard Day's Night\", \"subtitle\": \"Lennon, with McCartney / 1964 / UK: A Hard Day's Night US: 1962–1966\", \"title\": \"A Hard Day's Night\", \"uid\": \"A Hard Day's Night\"}",
+  "A Shot of Rhythm and Blues": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"A Shot of Rhythm and Blues\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"A Shot of Rhythm and Blues\", \"uid\": \"A Shot of Rhythm and Blues\"}",
+  "A Taste of Honey": "{\"arg\": \"McCartney / 1963 / UK: Please Please Me US: The Early Beatles\", \"autocomplete\": \"A Taste of Honey\", \"subtitle\": \"McCartney / 1963 / UK: Please Please Me US: The Early Beatles\", \"title\": \"A Taste of Honey\", \"uid\": \"A Taste of Honey\"}",
+  "Across the Universe": "{\"arg\": \"Lennon / 1968 / Let It Be\", \"autocomplete\": \"Across the Universe\", \"subtitle\": \"Lennon / 1968 / Let It Be\", \"title\": \"Across the Universe\", \"uid\": \"Across the Universe\"}",
+  "Act Naturally": "{\"arg\": \"Starr / 1965 / UK: Help! US: Yesterday and Today\", \"autocomplete\": \"Act Naturally\", \"subtitle\": \"Starr / 1965 / UK: Help! US: Yesterday and Today\", \"title\": \"Act Naturally\", \"uid\": \"Act Naturally\"}",
+  "Ain't She Sweet": "{\"arg\": \"Lennon / 1961 / Anthology 1\", \"autocomplete\": \"Ain't She Sweet\", \"subtitle\": \"Lennon / 1961 / Anthology 1\", \"title\": \"Ain't She Sweet\", \"uid\": \"Ain't She Sweet\"}",
+  "All I've Got to Do": "{\"arg\": \"Lennon / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"autocomplete\": \"All I've Got to Do\", \"subtitle\": \"Lennon / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"title\": \"All I've Got to Do\", \"uid\": \"All I've Got to Do\"}",
+  "All My Loving": "{\"arg\": \"McCartney / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"autocomplete\": \"All My Loving\", \"subtitle\": \"McCartney / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"title\": \"All My Loving\", \"uid\": \"All My Loving\"}",
+  "All Things Must Pass": "{\"arg\": \"Harrison / 1969 / Anthology 3\", \"autocomplete\": \"All Things Must Pass\", \"subtitle\": \"Harrison / 1969 / Anthology 3\", \"title\": \"All Things Must Pass\", \"uid\": \"All Things Must Pass\"}",
+  "All Together Now": "{\"arg\": \"McCartney / 1967 / Yellow Submarine\", \"autocomplete\": \"All Together Now\", \"subtitle\": \"McCartney / 1967 / Yellow Submarine\", \"title\": \"All Together Now\", \"uid\": \"All Together Now\"}",
+  "All You Need Is Love": "{\"arg\": \"Lennon / 1967 / Magical Mystery Tour\", \"autocomplete\": \"All You Need Is Love\", \"subtitle\": \"Lennon / 1967 / Magical Mystery Tour\", \"title\": \"All You Need Is Love\", \"uid\": \"All You Need Is Love\"}",
+  "And I Love Her": "{\"arg\": \"McCartney / 1964 / UK: A Hard Day's Night US: Something New\", \"autocomplete\": \"And I Love Her\", \"subtitle\": \"McCartney / 1964 / UK: A Hard Day's Night US: Something New\", \"title\": \"And I Love Her\", \"uid\": \"And I Love Her\"}",
+  "And Your Bird Can Sing": "{\"arg\": \"Lennon / 1966 / UK: Revolver US: Yesterday and Today\", \"autocomplete\": \"And Your Bird Can Sing\", \"subtitle\": \"Lennon / 1966 / UK: Revolver US: Yesterday and Today\", \"title\": \"And Your Bird Can Sing\", \"uid\": \"And Your Bird Can Sing\"}",
+  "Anna (Go to Him)": "{\"arg\": \"Lennon / 1963 / UK: Please Please Me US: The Early Beatles\", \"autocomplete\": \"Anna (Go to Him)\", \"subtitle\": \"Lennon / 1963 / UK: Please Please Me US: The Early Beatles\", \"title\": \"Anna (Go to Him)\", \"uid\": \"Anna (Go to Him)\"}",
+  "Another Girl": "{\"arg\": \"McCartney / 1965 / Help!\", \"autocomplete\": \"Another Girl\", \"subtitle\": \"McCartney / 1965 / Help!\", \"title\": \"Another Girl\", \"uid\": \"Another Girl\"}",
+  "Any Time at All": "{\"arg\": \"Lennon / 1964 / UK: A Hard Day's Night US: Something New\", \"autocomplete\": \"Any Time at All\", \"subtitle\": \"Lennon / 1964 / UK: A Hard Day's Night US: Something New\", \"title\": \"Any Time at All\", \"uid\": \"Any Time at All\"}",
+  "Ask Me Why": "{\"arg\": \"Lennon / 1962 / UK: Please Please Me US: The Early Beatles\", \"autocomplete\": \"Ask Me Why\", \"subtitle\": \"Lennon / 1962 / UK: Please Please Me US: The Early Beatles\", \"title\": \"Ask Me Why\", \"uid\": \"Ask Me Why\"}",
+  "Baby It's You": "{\"arg\": \"Lennon / 1963 / UK: Please Please Me US: The Early Beatles\", \"autocomplete\": \"Baby It's You\", \"subtitle\": \"Lennon / 1963 / UK: Please Please Me US: The Early Beatles\", \"title\": \"Baby It's You\", \"uid\": \"Baby It's You\"}",
+  "Baby's in Black": "{\"arg\": \"Lennon, McCartney / 1964 / UK: Beatles for Sale US: Beatles '65\", \"autocomplete\": \"Baby's in Black\", \"subtitle\": \"Lennon, McCartney / 1964 / UK: Beatles for Sale US: Beatles '65\", \"title\": \"Baby's in Black\", \"uid\": \"Baby's in Black\"}",
+  "Baby, You're a Rich Man": "{\"arg\": \"Lennon / 1967 / Magical Mystery Tour\", \"autocomplete\": \"Baby, You're a Rich Man\", \"subtitle\": \"Lennon / 1967 / Magical Mystery Tour\", \"title\": \"Baby, You're a Rich Man\", \"uid\": \"Baby, You're a Rich Man\"}",
+  "Back in the U.S.S.R.": "{\"arg\": \"McCartney / 1968 / The Beatles\", \"autocomplete\": \"Back in the U.S.S.R.\", \"subtitle\": \"McCartney / 1968 / The Beatles\", \"title\": \"Back in the U.S.S.R.\", \"uid\": \"Back in the U.S.S.R.\"}",
+  "Bad Boy": "{\"arg\": \"Lennon / 1965 / UK: A Collection of Beatles Oldies US: Beatles VI\", \"autocomplete\": \"Bad Boy\", \"subtitle\": \"Lennon / 1965 / UK: A Collection of Beatles Oldies US: Beatles VI\", \"title\": \"Bad Boy\", \"uid\": \"Bad Boy\"}",
+  "Bad to Me": "{\"arg\": \"Lennon / 1963 / The Beatles Bootleg Recordings 1963\", \"autocomplete\": \"Bad to Me\", \"subtitle\": \"Lennon / 1963 / The Beatles Bootleg Recordings 1963\", \"title\": \"Bad to Me\", \"uid\": \"Bad to Me\"}",
+  "Beautiful Dreamer": "{\"arg\": \"McCartney / 1963 / On Air – Live at the BBC Volume 2\", \"autocomplete\": \"Beautiful Dreamer\", \"subtitle\": \"McCartney / 1963 / On Air – Live at the BBC Volume 2\", \"title\": \"Beautiful Dreamer\", \"uid\": \"Beautiful Dreamer\"}",
+  "Because": "{\"arg\": \"Lennon, McCartney, Harrison / 1969 / Abbey Road\", \"autocomplete\": \"Because\", \"subtitle\": \"Lennon, McCartney, Harrison / 1969 / Abbey Road\", \"title\": \"Because\", \"uid\": \"Because\"}",
+  "Because I Know You Love Me So": "{\"arg\": \"Lennon, McCartney / 1969 / Let It Be... Naked - Fly on the Wall bonus disc\", \"autocomplete\": \"Because I Know You Love Me So\", \"subtitle\": \"Lennon, McCartney / 1969 / Let It Be... Naked - Fly on the Wall bonus disc\", \"title\": \"Because I Know You Love Me So\", \"uid\": \"Because I Know You Love Me So\"}",
+  "Being for the Benefit of Mr. Kite!": "{\"arg\": \"Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"Being for the Benefit of Mr. Kite!\", \"subtitle\": \"Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"Being for the Benefit of Mr. Kite!\", \"uid\": \"Being for the Benefit of Mr. Kite!\"}",
+  "Birthday": "{\"arg\": \"McCartney, with Lennon / 1968 / The Beatles\", \"autocomplete\": \"Birthday\", \"subtitle\": \"McCartney, with Lennon / 1968 / The Beatles\", \"title\": \"Birthday\", \"uid\": \"Birthday\"}",
+  "Blackbird": "{\"arg\": \"McCartney / 1968 / The Beatles\", \"autocomplete\": \"Blackbird\", \"subtitle\": \"McCartney / 1968 / The Beatles\", \"title\": \"Blackbird\", \"uid\": \"Blackbird\"}",
+  "Blue Jay Way": "{\"arg\": \"Harrison / 1967 / Magical Mystery Tour\", \"autocomplete\": \"Blue Jay Way\", \"subtitle\": \"Harrison / 1967 / Magical Mystery Tour\", \"title\": \"Blue Jay Way\", \"uid\": \"Blue Jay Way\"}",
+  "Boys": "{\"arg\": \"Starr / 1963 / UK: Please Please Me US: The Early Beatles\", \"autocomplete\": \"Boys\", \"subtitle\": \"Starr / 1963 / UK: Please Please Me US: The Early Beatles\", \"title\": \"Boys\", \"uid\": \"Boys\"}",
+  "Bésame Mucho": "{\"arg\": \"McCartney / 1962 / Anthology 1\", \"autocomplete\": \"Bésame Mucho\", \"subtitle\": \"McCartney / 1962 / Anthology 1\", \"title\": \"Bésame Mucho\", \"uid\": \"Bésame Mucho\"}",
+  "Can't Buy Me Love": "{\"arg\": \"McCartney, with Lennon / 1964 / UK: A Hard Day's Night US: Hey Jude\", \"autocomplete\": \"Can't Buy Me Love\", \"subtitle\": \"McCartney, with Lennon / 1964 / UK: A Hard Day's Night US: Hey Jude\", \"title\": \"Can't Buy Me Love\", \"uid\": \"Can't Buy Me Love\"}",
+  "Carol": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"Carol\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"Carol\", \"uid\": \"Carol\"}",
+  "Carry That Weight": "{\"arg\": \"McCartney, with Lennon, Harrison, and Starr / 1969 / Abbey Road\", \"autocomplete\": \"Carry That Weight\", \"subtitle\": \"McCartney, with Lennon, Harrison, and Starr / 1969 / Abbey Road\", \"title\": \"Carry That Weight\", \"uid\": \"Carry That Weight\"}",
+  "Catswalk": "{\"arg\": \"N/A / 1962 / N/A\", \"autocomplete\": \"Catswalk\", \"subtitle\": \"N/A / 1962 / N/A\", \"title\": \"Catswalk\", \"uid\": \"Catswalk\"}",
+  "Cayenne": "{\"arg\": \"Instrumental / 1960 / Anthology 1\", \"autocomplete\": \"Cayenne\", \"subtitle\": \"Instrumental / 1960 / Anthology 1\", \"title\": \"Cayenne\", \"uid\": \"Cayenne\"}",
+  "Chains": "{\"arg\": \"Harrison, (with Lennon, McCartney) / 1963 / UK: Please Please Me US: The Early Beatles\", \"autocomplete\": \"Chains\", \"subtitle\": \"Harrison, (with Lennon, McCartney) / 1963 / UK: Please Please Me US: The Early Beatles\", \"title\": \"Chains\", \"uid\": \"Chains\"}",
+  "Child of Nature": "{\"arg\": \"Lennon / 1968 / Let It Be... Naked - Fly on the Wall bonus disc\", \"autocomplete\": \"Child of Nature\", \"subtitle\": \"Lennon / 1968 / Let It Be... Naked - Fly on the Wall bonus disc\", \"title\": \"Child of Nature\", \"uid\": \"Child of Nature\"}",
+  "Christmas Time (Is Here Again)": "{\"arg\": \"Lennon, McCartney, Harrison, Starr / 1967 / The Beatles' Christmas Album\", \"autocomplete\": \"Christmas Time (Is Here Again)\", \"subtitle\": \"Lennon, McCartney, Harrison, Starr / 1967 / The Beatles' Christmas Album\", \"title\": \"Christmas Time (Is Here Again)\", \"uid\": \"Christmas Time (Is Here Again)\"}",
+  "Circles": "{\"arg\": \"Harrison / 1968 / \", \"autocomplete\": \"Circles\", \"subtitle\": \"Harrison / 1968 / \", \"title\": \"Circles\", \"uid\": \"Circles\"}",
+  "Clarabella": "{\"arg\": \"McCartney / 1963 / Live at the BBC\", \"autocomplete\": \"Clarabella\", \"subtitle\": \"McCartney / 1963 / Live at the BBC\", \"title\": \"Clarabella\", \"uid\": \"Clarabella\"}",
+  "Come Together": "{\"arg\": \"Lennon / 1969 / Abbey Road\", \"autocomplete\": \"Come Together\", \"subtitle\": \"Lennon / 1969 / Abbey Road\", \"title\": \"Come Together\", \"uid\": \"Come Together\"}",
+  "Come and Get It": "{\"arg\": \"McCartney / 1969 / Anthology 3\", \"autocomplete\": \"Come and Get It\", \"subtitle\": \"McCartney / 1969 / Anthology 3\", \"title\": \"Come and Get It\", \"uid\": \"Come and Get It\"}",
+  "Cry Baby Cry": "{\"arg\": \"Lennon, with McCartney / 1968 / The Beatles\", \"autocomplete\": \"Cry Baby Cry\", \"subtitle\": \"Lennon, with McCartney / 1968 / The Beatles\", \"title\": \"Cry Baby Cry\", \"uid\": \"Cry Baby Cry\"}",
+  "Cry for a Shadow": "{\"arg\": \"Instrumental / 1961 / Anthology 1\", \"autocomplete\": \"Cry for a Shadow\", \"subtitle\": \"Instrumental / 1961 / Anthology 1\", \"title\": \"Cry for a Shadow\", \"uid\": \"Cry for a Shadow\"}",
+  "Crying, Waiting, Hoping": "{\"arg\": \"Harrison / 1963 / Live at the BBC\", \"autocomplete\": \"Crying, Waiting, Hoping\", \"subtitle\": \"Harrison / 1963 / Live at the BBC\", \"title\": \"Crying, Waiting, Hoping\", \"uid\": \"Crying, Waiting, Hoping\"}",
+  "Day Tripper": "{\"arg\": \"Lennon, McCartney / 1965 / UK: A Collection of Beatles Oldies US: Yesterday and Today\", \"autocomplete\": \"Day Tripper\", \"subtitle\": \"Lennon, McCartney / 1965 / UK: A Collection of Beatles Oldies US: Yesterday and Today\", \"title\": \"Day Tripper\", \"uid\": \"Day Tripper\"}",
+  "Dear Prudence": "{\"arg\": \"Lennon / 1968 / The Beatles\", \"autocomplete\": \"Dear Prudence\", \"subtitle\": \"Lennon / 1968 / The Beatles\", \"title\": \"Dear Prudence\", \"uid\": \"Dear Prudence\"}",
+  "Devil in Her Heart": "{\"arg\": \"Harrison / 1963 / UK: With the Beatles US: The Beatles' Second Album\", \"autocomplete\": \"Devil in Her Heart\", \"subtitle\": \"Harrison / 1963 / UK: With the Beatles US: The Beatles' Second Album\", \"title\": \"Devil in Her Heart\", \"uid\": \"Devil in Her Heart\"}",
+  "Dig It": "{\"arg\": \"Lennon / 1969 / Let It Be\", \"autocomplete\": \"Dig It\", \"subtitle\": \"Lennon / 1969 / Let It Be\", \"title\": \"Dig It\", \"uid\": \"Dig It\"}",
+  "Dig a Pony": "{\"arg\": \"Lennon / 1969 / Let It Be\", \"autocomplete\": \"Dig a Pony\", \"subtitle\": \"Lennon / 1969 / Let It Be\", \"title\": \"Dig a Pony\", \"uid\": \"Dig a Pony\"}",
+  "Dizzy, Miss Lizzy": "{\"arg\": \"Lennon / 1965 / UK: Help! US: Beatles VI\", \"autocomplete\": \"Dizzy, Miss Lizzy\", \"subtitle\": \"Lennon / 1965 / UK: Help! US: Beatles VI\", \"title\": \"Dizzy, Miss Lizzy\", \"uid\": \"Dizzy, Miss Lizzy\"}",
+  "Do You Want to Know a Secret?": "{\"arg\": \"Harrison / 1963 / UK: Please Please Me US: The Early Beatles\", \"autocomplete\": \"Do You Want to Know a Secret?\", \"subtitle\": \"Harrison / 1963 / UK: Please Please Me US: The Early Beatles\", \"title\": \"Do You Want to Know a Secret?\", \"uid\": \"Do You Want to Know a Secret?\"}",
+  "Doctor Robert": "{\"arg\": \"Lennon / 1966 / UK: Revolver US: Yesterday and Today\", \"autocomplete\": \"Doctor Robert\", \"subtitle\": \"Lennon / 1966 / UK: Revolver US: Yesterday and Today\", \"title\": \"Doctor Robert\", \"uid\": \"Doctor Robert\"}",
+  "Don't Bother Me": "{\"arg\": \"Harrison / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"autocomplete\": \"Don't Bother Me\", \"subtitle\": \"Harrison / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"title\": \"Don't Bother Me\", \"uid\": \"Don't Bother Me\"}",
+  "Don't Ever Change": "{\"arg\": \"Harrison and McCartney / 1963 / Live at the BBC\", \"autocomplete\": \"Don't Ever Change\", \"subtitle\": \"Harrison and McCartney / 1963 / Live at the BBC\", \"title\": \"Don't Ever Change\", \"uid\": \"Don't Ever Change\"}",
+  "Don't Let Me Down": "{\"arg\": \"Lennon (with McCartney) / 1969 / UK: 1967–1970 US: Hey Jude\", \"autocomplete\": \"Don't Let Me Down\", \"subtitle\": \"Lennon (with McCartney) / 1969 / UK: 1967–1970 US: Hey Jude\", \"title\": \"Don't Let Me Down\", \"uid\": \"Don't Let Me Down\"}",
+  "Don't Pass Me By": "{\"arg\": \"Starr / 1968 / The Beatles\", \"autocomplete\": \"Don't Pass Me By\", \"subtitle\": \"Starr / 1968 / The Beatles\", \"title\": \"Don't Pass Me By\", \"uid\": \"Don't Pass Me By\"}",
+  "Drive My Car": "{\"arg\": \"McCartney, with Lennon / 1965 / UK: Rubber Soul US: Yesterday and Today\", \"autocomplete\": \"Drive My Car\", \"subtitle\": \"McCartney, with Lennon / 1965 / UK: Rubber Soul US: Yesterday and Today\", \"title\": \"Drive My Car\", \"uid\": \"Drive My Car\"}",
+  "Eight Days a Week": "{\"arg\": \"Lennon, with McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"autocomplete\": \"Eight Days a Week\", \"subtitle\": \"Lennon, with McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"title\": \"Eight Days a Week\", \"uid\": \"Eight Days a Week\"}",
+  "Eleanor Rigby": "{\"arg\": \"McCartney / 1966 / Revolver\", \"autocomplete\": \"Eleanor Rigby\", \"subtitle\": \"McCartney / 1966 / Revolver\", \"title\": \"Eleanor Rigby\", \"uid\": \"Eleanor Rigby\"}",
+  "Etcetera": "{\"arg\": \"McCartney / 1968 / Unreleased\", \"autocomplete\": \"Etcetera\", \"subtitle\": \"McCartney / 1968 / Unreleased\", \"title\": \"Etcetera\", \"uid\": \"Etcetera\"}",
+  "Every Little Thing": "{\"arg\": \"Lennon, with McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"autocomplete\": \"Every Little Thing\", \"subtitle\": \"Lennon, with McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"title\": \"Every Little Thing\", \"uid\": \"Every Little Thing\"}",
+  "Everybody's Got Something to Hide Except Me and My Monkey": "{\"arg\": \"Lennon / 1968 / The Beatles\", \"autocomplete\": \"Everybody's Got Something to Hide Except Me and My Monkey\", \"subtitle\": \"Lennon / 1968 / The Beatles\", \"title\": \"Everybody's Got Something to Hide Except Me and My Monkey\", \"uid\": \"Everybody's Got Something to Hide Except Me and My Monkey\"}",
+  "Everybody's Trying to Be My Baby": "{\"arg\": \"Harrison / 1964 / UK: Beatles for Sale US: Beatles '65\", \"autocomplete\": \"Everybody's Trying to Be My Baby\", \"subtitle\": \"Harrison / 1964 / UK: Beatles for Sale US: Beatles '65\", \"title\": \"Everybody's Trying to Be My Baby\", \"uid\": \"Everybody's Trying to Be My Baby\"}",
+  "Fancy My Chances with You": "{\"arg\": \"Lennon, McCartney / 1969 / Let It Be... Naked - Fly on the Wall bonus disc\", \"autocomplete\": \"Fancy My Chances with You\", \"subtitle\": \"Lennon, McCartney / 1969 / Let It Be... Naked - Fly on the Wall bonus disc\", \"title\": \"Fancy My Chances with You\", \"uid\": \"Fancy My Chances with You\"}",
+  "Fixing a Hole": "{\"arg\": \"McCartney / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"Fixing a Hole\", \"subtitle\": \"McCartney / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"Fixing a Hole\", \"uid\": \"Fixing a Hole\"}",
+  "Flying": "{\"arg\": \"Instrumental / 1967 / Magical Mystery Tour\", \"autocomplete\": \"Flying\", \"subtitle\": \"Instrumental / 1967 / Magical Mystery Tour\", \"title\": \"Flying\", \"uid\": \"Flying\"}",
+  "For No One": "{\"arg\": \"McCartney / 1966 / Revolver\", \"autocomplete\": \"For No One\", \"subtitle\": \"McCartney / 1966 / Revolver\", \"title\": \"For No One\", \"uid\": \"For No One\"}",
+  "For You Blue": "{\"arg\": \"Harrison / 1969 / Let It Be\", \"autocomplete\": \"For You Blue\", \"subtitle\": \"Harrison / 1969 / Let It Be\", \"title\": \"For You Blue\", \"uid\": \"For You Blue\"}",
+  "Free as a Bird": "{\"arg\": \"Lennon, McCartney and Harrison / 1977 / Anthology 1\", \"autocomplete\": \"Free as a Bird\", \"subtitle\": \"Lennon, McCartney and Harrison / 1977 / Anthology 1\", \"title\": \"Free as a Bird\", \"uid\": \"Free as a Bird\"}",
+  "From Me to You": "{\"arg\": \"Lennon, McCartney / 1963 / UK: A Collection of Beatles Oldies US: 1962–1966\", \"autocomplete\": \"From Me to You\", \"subtitle\": \"Lennon, McCartney / 1963 / UK: A Collection of Beatles Oldies US: 1962–1966\", \"title\": \"From Me to You\", \"uid\": \"From Me to You\"}",
+  "From Us to You": "{\"arg\": \"Lennon, McCartney / 1963 / Live at the BBC\", \"autocomplete\": \"From Us to You\", \"subtitle\": \"Lennon, McCartney / 1963 / Live at the BBC\", \"title\": \"From Us to You\", \"uid\": \"From Us to You\"}",
+  "Get Back": "{\"arg\": \"McCartney / 1969 / Let It Be\", \"autocomplete\": \"Get Back\", \"subtitle\": \"McCartney / 1969 / Let It Be\", \"title\": \"Get Back\", \"uid\": \"Get Back\"}",
+  "Getting Better": "{\"arg\": \"McCartney, with Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"Getting Better\", \"subtitle\": \"McCartney, with Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"Getting Better\", \"uid\": \"Getting Better\"}",
+  "Girl": "{\"arg\": \"Lennon / 1965 / Rubber Soul\", \"autocomplete\": \"Girl\", \"subtitle\": \"Lennon / 1965 / Rubber Soul\", \"title\": \"Girl\", \"uid\": \"Girl\"}",
+  "Glad All Over": "{\"arg\": \"Harrison / 1963 / Live at the BBC\", \"autocomplete\": \"Glad All Over\", \"subtitle\": \"Harrison / 1963 / Live at the BBC\", \"title\": \"Glad All Over\", \"uid\": \"Glad All Over\"}",
+  "Glass Onion": "{\"arg\": \"Lennon / 1968 / The Beatles\", \"autocomplete\": \"Glass Onion\", \"subtitle\": \"Lennon / 1968 / The Beatles\", \"title\": \"Glass Onion\", \"uid\": \"Glass Onion\"}",
+  "Golden Slumbers": "{\"arg\": \"McCartney / 1969 / Abbey Road\", \"autocomplete\": \"Golden Slumbers\", \"subtitle\": \"McCartney / 1969 / Abbey Road\", \"title\": \"Golden Slumbers\", \"uid\": \"Golden Slumbers\"}",
+  "Good Day Sunshine": "{\"arg\": \"McCartney / 1966 / Revolver\", \"autocomplete\": \"Good Day Sunshine\", \"subtitle\": \"McCartney / 1966 / Revolver\", \"title\": \"Good Day Sunshine\", \"uid\": \"Good Day Sunshine\"}",
+  "Good Morning Good Morning": "{\"arg\": \"Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"Good Morning Good Morning\", \"subtitle\": \"Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"Good Morning Good Morning\", \"uid\": \"Good Morning Good Morning\"}",
+  "Good Night": "{\"arg\": \"Starr / 1968 / The Beatles\", \"autocomplete\": \"Good Night\", \"subtitle\": \"Starr / 1968 / The Beatles\", \"title\": \"Good Night\", \"uid\": \"Good Night\"}",
+  "Goodbye": "{\"arg\": \"McCartney / 1969 / \", \"autocomplete\": \"Goodbye\", \"subtitle\": \"McCartney / 1969 / \", \"title\": \"Goodbye\", \"uid\": \"Goodbye\"}",
+  "Got to Get You into My Life": "{\"arg\": \"McCartney / 1966 / Revolver\", \"autocomplete\": \"Got to Get You into My Life\", \"subtitle\": \"McCartney / 1966 / Revolver\", \"title\": \"Got to Get You into My Life\", \"uid\": \"Got to Get You into My Life\"}",
+  "Hallelujah, I Love Her So": "{\"arg\": \"McCartney / 1960 / Anthology 1\", \"autocomplete\": \"Hallelujah, I Love Her So\", \"subtitle\": \"McCartney / 1960 / Anthology 1\", \"title\": \"Hallelujah, I Love Her So\", \"uid\": \"Hallelujah, I Love Her So\"}",
+  "Happiness Is a Warm Gun": "{\"arg\": \"Lennon / 1968 / The Beatles\", \"autocomplete\": \"Happiness Is a Warm Gun\", \"subtitle\": \"Lennon / 1968 / The Beatles\", \"title\": \"Happiness Is a Warm Gun\", \"uid\": \"Happiness Is a Warm Gun\"}",
+  "Heather": "{\"arg\": \"McCartney / 1968 / \", \"autocomplete\": \"Heather\", \"subtitle\": \"McCartney / 1968 / \", \"title\": \"Heather\", \"uid\": \"Heather\"}",
+  "Hello Little Girl": "{\"arg\": \"Lennon / 1962 / Anthology 1\", \"autocomplete\": \"Hello Little Girl\", \"subtitle\": \"Lennon / 1962 / Anthology 1\", \"title\": \"Hello Little Girl\", \"uid\": \"Hello Little Girl\"}",
+  "Hello, Goodbye": "{\"arg\": \"McCartney / 1967 / Magical Mystery Tour\", \"autocomplete\": \"Hello, Goodbye\", \"subtitle\": \"McCartney / 1967 / Magical Mystery Tour\", \"title\": \"Hello, Goodbye\", \"uid\": \"Hello, Goodbye\"}",
+  "Help!": "{\"arg\": \"Lennon / 1965 / Help!\", \"autocomplete\": \"Help!\", \"subtitle\": \"Lennon / 1965 / Help!\", \"title\": \"Help!\", \"uid\": \"Help!\"}",
+  "Helter Skelter": "{\"arg\": \"McCartney / 1968 / The Beatles\", \"autocomplete\": \"Helter Skelter\", \"subtitle\": \"McCartney / 1968 / The Beatles\", \"title\": \"Helter Skelter\", \"uid\": \"Helter Skelter\"}",
+  "Her Majesty": "{\"arg\": \"McCartney / 1969 / Abbey Road\", \"autocomplete\": \"Her Majesty\", \"subtitle\": \"McCartney / 1969 / Abbey Road\", \"title\": \"Her Majesty\", \"uid\": \"Her Majesty\"}",
+  "Here Comes the Sun": "{\"arg\": \"Harrison / 1969 / Abbey Road\", \"autocomplete\": \"Here Comes the Sun\", \"subtitle\": \"Harrison / 1969 / Abbey Road\", \"title\": \"Here Comes the Sun\", \"uid\": \"Here Comes the Sun\"}",
+  "Here, There and Everywhere": "{\"arg\": \"McCartney / 1966 / Revolver\", \"autocomplete\": \"Here, There and Everywhere\", \"subtitle\": \"McCartney / 1966 / Revolver\", \"title\": \"Here, There and Everywhere\", \"uid\": \"Here, There and Everywhere\"}",
+  "Hey Bulldog": "{\"arg\": \"Lennon, with McCartney / 1968 / Yellow Submarine\", \"autocomplete\": \"Hey Bulldog\", \"subtitle\": \"Lennon, with McCartney / 1968 / Yellow Submarine\", \"title\": \"Hey Bulldog\", \"uid\": \"Hey Bulldog\"}",
+  "Hey Jude": "{\"arg\": \"McCartney / 1968 / UK: 1967–1970 US: Hey Jude\", \"autocomplete\": \"Hey Jude\", \"subtitle\": \"McCartney / 1968 / UK: 1967–1970 US: Hey Jude\", \"title\": \"Hey Jude\", \"uid\": \"Hey Jude\"}",
+  "Hippy Hippy Shake": "{\"arg\": \"McCartney / 1963 / Live at the BBC\", \"autocomplete\": \"Hippy Hippy Shake\", \"subtitle\": \"McCartney / 1963 / Live at the BBC\", \"title\": \"Hippy Hippy Shake\", \"uid\": \"Hippy Hippy Shake\"}",
+  "Hold Me Tight": "{\"arg\": \"McCartney / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"autocomplete\": \"Hold Me Tight\", \"subtitle\": \"McCartney / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"title\": \"Hold Me Tight\", \"uid\": \"Hold Me Tight\"}",
+  "Honey Don't": "{\"arg\": \"Starr / 1964 / UK: Beatles for Sale US: Beatles '65\", \"autocomplete\": \"Honey Don't\", \"subtitle\": \"Starr / 1964 / UK: Beatles for Sale US: Beatles '65\", \"title\": \"Honey Don't\", \"uid\": \"Honey Don't\"}",
+  "Honey Pie": "{\"arg\": \"McCartney / 1968 / The Beatles\", \"autocomplete\": \"Honey Pie\", \"subtitle\": \"McCartney / 1968 / The Beatles\", \"title\": \"Honey Pie\", \"uid\": \"Honey Pie\"}",
+  "How Do You Do It?": "{\"arg\": \"Lennon / 1962 / Anthology 1\", \"autocomplete\": \"How Do You Do It?\", \"subtitle\": \"Lennon / 1962 / Anthology 1\", \"title\": \"How Do You Do It?\", \"uid\": \"How Do You Do It?\"}",
+  "I Am the Walrus": "{\"arg\": \"Lennon / 1967 / Magical Mystery Tour\", \"autocomplete\": \"I Am the Walrus\", \"subtitle\": \"Lennon / 1967 / Magical Mystery Tour\", \"title\": \"I Am the Walrus\", \"uid\": \"I Am the Walrus\"}",
+  "I Call Your Name": "{\"arg\": \"Lennon / 1964 / UK: \\\"Long Tall Sally\\\" EP US: The Beatles' Second Album\", \"autocomplete\": \"I Call Your Name\", \"subtitle\": \"Lennon / 1964 / UK: \\\"Long Tall Sally\\\" EP US: The Beatles' Second Album\", \"title\": \"I Call Your Name\", \"uid\": \"I Call Your Name\"}",
+  "I Don't Want to Spoil the Party": "{\"arg\": \"Lennon, with McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"autocomplete\": \"I Don't Want to Spoil the Party\", \"subtitle\": \"Lennon, with McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"title\": \"I Don't Want to Spoil the Party\", \"uid\": \"I Don't Want to Spoil the Party\"}",
+  "I Feel Fine": "{\"arg\": \"Lennon / 1964 / UK: A Collection of Beatles Oldies US: Beatles '65\", \"autocomplete\": \"I Feel Fine\", \"subtitle\": \"Lennon / 1964 / UK: A Collection of Beatles Oldies US: Beatles '65\", \"title\": \"I Feel Fine\", \"uid\": \"I Feel Fine\"}",
+  "I Forgot to Remember to Forget": "{\"arg\": \"Harrison / 1964 / Live at the BBC\", \"autocomplete\": \"I Forgot to Remember to Forget\", \"subtitle\": \"Harrison / 1964 / Live at the BBC\", \"title\": \"I Forgot to Remember to Forget\", \"uid\": \"I Forgot to Remember to Forget\"}",
+  "I Got a Woman": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"I Got a Woman\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"I Got a Woman\", \"uid\": \"I Got a Woman\"}",
+  "I Got to Find My Baby": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"I Got to Find My Baby\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"I Got to Find My Baby\", \"uid\": \"I Got to Find My Baby\"}",
+  "I Just Don't Understand": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"I Just Don't Understand\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"I Just Don't Understand\", \"uid\": \"I Just Don't Understand\"}",
+  "I Lost My Little Girl": "{\"arg\": \"Lennon / 1962 / \", \"autocomplete\": \"I Lost My Little Girl\", \"subtitle\": \"Lennon / 1962 / \", \"title\": \"I Lost My Little Girl\", \"uid\": \"I Lost My Little Girl\"}",
+  "I Me Mine": "{\"arg\": \"Harrison / 1970 / Let It Be\", \"autocomplete\": \"I Me Mine\", \"subtitle\": \"Harrison / 1970 / Let It Be\", \"title\": \"I Me Mine\", \"uid\": \"I Me Mine\"}",
+  "I Need You": "{\"arg\": \"Harrison / 1965 / Help!\", \"autocomplete\": \"I Need You\", \"subtitle\": \"Harrison / 1965 / Help!\", \"title\": \"I Need You\", \"uid\": \"I Need You\"}",
+  "I Saw Her Standing There": "{\"arg\": \"McCartney, with Lennon / 1963 / UK: Please Please Me US: Meet the Beatles!\", \"autocomplete\": \"I Saw Her Standing There\", \"subtitle\": \"McCartney, with Lennon / 1963 / UK: Please Please Me US: Meet the Beatles!\", \"title\": \"I Saw Her Standing There\", \"uid\": \"I Saw Her Standing There\"}",
+  "I Should Have Known Better": "{\"arg\": \"Lennon / 1964 / UK: A Hard Day's Night US: Hey Jude\", \"autocomplete\": \"I Should Have Known Better\", \"subtitle\": \"Lennon / 1964 / UK: A Hard Day's Night US: Hey Jude\", \"title\": \"I Should Have Known Better\", \"uid\": \"I Should Have Known Better\"}",
+  "I Wanna Be Your Man": "{\"arg\": \"Starr / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"autocomplete\": \"I Wanna Be Your Man\", \"subtitle\": \"Starr / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"title\": \"I Wanna Be Your Man\", \"uid\": \"I Wanna Be Your Man\"}",
+  "I Want You (She's So Heavy)": "{\"arg\": \"Lennon / 1969 / Abbey Road\", \"autocomplete\": \"I Want You (She's So Heavy)\", \"subtitle\": \"Lennon / 1969 / Abbey Road\", \"title\": \"I Want You (She's So Heavy)\", \"uid\": \"I Want You (She's So Heavy)\"}",
+  "I Want to Hold Your Hand": "{\"arg\": \"Lennon, McCartney / 1963 / UK: A Collection of Beatles Oldies US: Meet the Beatles!\", \"autocomplete\": \"I Want to Hold Your Hand\", \"subtitle\": \"Lennon, McCartney / 1963 / UK: A Collection of Beatles Oldies US: Meet the Beatles!\", \"title\": \"I Want to Hold Your Hand\", \"uid\": \"I Want to Hold Your Hand\"}",
+  "I Want to Tell You": "{\"arg\": \"Harrison / 1966 / Revolver\", \"autocomplete\": \"I Want to Tell You\", \"subtitle\": \"Harrison / 1966 / Revolver\", \"title\": \"I Want to Tell You\", \"uid\": \"I Want to Tell You\"}",
+  "I Will": "{\"arg\": \"McCartney / 1968 / The Beatles\", \"autocomplete\": \"I Will\", \"subtitle\": \"McCartney / 1968 / The Beatles\", \"title\": \"I Will\", \"uid\": \"I Will\"}",
+  "I'll Be Back": "{\"arg\": \"Lennon and McCartney) / 1964 / UK: A Hard Day's Night US: Beatles '65\", \"autocomplete\": \"I'll Be Back\", \"subtitle\": \"Lennon and McCartney) / 1964 / UK: A Hard Day's Night US: Beatles '65\", \"title\": \"I'll Be Back\", \"uid\": \"I'll Be Back\"}",
+  "I'll Be on My Way": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"I'll Be on My Way\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"I'll Be on My Way\", \"uid\": \"I'll Be on My Way\"}",
+  "I'll Cry Instead": "{\"arg\": \"Lennon / 1964 / UK: A Hard Day's Night US: Something New\", \"autocomplete\": \"I'll Cry Instead\", \"subtitle\": \"Lennon / 1964 / UK: A Hard Day's Night US: Something New\", \"title\": \"I'll Cry Instead\", \"uid\": \"I'll Cry Instead\"}",
+  "I'll Follow the Sun": "{\"arg\": \"McCartney, with Lennon / 1964 / UK: Beatles for Sale US: Beatles '65\", \"autocomplete\": \"I'll Follow the Sun\", \"subtitle\": \"McCartney, with Lennon / 1964 / UK: Beatles for Sale US: Beatles '65\", \"title\": \"I'll Follow the Sun\", \"uid\": \"I'll Follow the Sun\"}",
+  "I'll Get You": "{\"arg\": \"Lennon, with McCartney / 1963 / UK: Past Masters Volume 1 US: The Beatles' Second Album\", \"autocomplete\": \"I'll Get You\", \"subtitle\": \"Lennon, with McCartney / 1963 / UK: Past Masters Volume 1 US: The Beatles' Second Album\", \"title\": \"I'll Get You\", \"uid\": \"I'll Get You\"}",
+  "I'm Down": "{\"arg\": \"McCartney / 1965 / Rock 'n' Roll Music\", \"autocomplete\": \"I'm Down\", \"subtitle\": \"McCartney / 1965 / Rock 'n' Roll Music\", \"title\": \"I'm Down\", \"uid\": \"I'm Down\"}",
+  "I'm Gonna Sit Right Down and Cry (Over You)": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"I'm Gonna Sit Right Down and Cry (Over You)\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"I'm Gonna Sit Right Down and Cry (Over You)\", \"uid\": \"I'm Gonna Sit Right Down and Cry (Over You)\"}",
+  "I'm Happy Just to Dance with You": "{\"arg\": \"Harrison / 1964 / UK: A Hard Day's Night US: Something New\", \"autocomplete\": \"I'm Happy Just to Dance with You\", \"subtitle\": \"Harrison / 1964 / UK: A Hard Day's Night US: Something New\", \"title\": \"I'm Happy Just to Dance with You\", \"uid\": \"I'm Happy Just to Dance with You\"}",
+  "I'm In Love": "{\"arg\": \"Lennon / 1963 / The Beatles Bootleg Recordings 1963\", \"autocomplete\": \"I'm In Love\", \"subtitle\": \"Lennon / 1963 / The Beatles Bootleg Recordings 1963\", \"title\": \"I'm In Love\", \"uid\": \"I'm In Love\"}",
+  "I'm Looking Through You": "{\"arg\": \"McCartney, with Lennon / 1965 / Rubber Soul\", \"autocomplete\": \"I'm Looking Through You\", \"subtitle\": \"McCartney, with Lennon / 1965 / Rubber Soul\", \"title\": \"I'm Looking Through You\", \"uid\": \"I'm Looking Through You\"}",
+  "I'm Only Sleeping": "{\"arg\": \"Lennon / 1966 / UK: Revolver US: Yesterday and Today\", \"autocomplete\": \"I'm Only Sleeping\", \"subtitle\": \"Lennon / 1966 / UK: Revolver US: Yesterday and Today\", \"title\": \"I'm Only Sleeping\", \"uid\": \"I'm Only Sleeping\"}",
+  "I'm So Tired": "{\"arg\": \"Lennon / 1968 / The Beatles\", \"autocomplete\": \"I'm So Tired\", \"subtitle\": \"Lennon / 1968 / The Beatles\", \"title\": \"I'm So Tired\", \"uid\": \"I'm So Tired\"}",
+  "I'm Talking About You": "{\"arg\": \"Lennon / 1962 / Live! at the Star-Club in Hamburg, Germany; 1962\", \"autocomplete\": \"I'm Talking About You\", \"subtitle\": \"Lennon / 1962 / Live! at the Star-Club in Hamburg, Germany; 1962\", \"title\": \"I'm Talking About You\", \"uid\": \"I'm Talking About You\"}",
+  "I'm a Loser": "{\"arg\": \"Lennon / 1964 / UK: Beatles for Sale US: Beatles '65\", \"autocomplete\": \"I'm a Loser\", \"subtitle\": \"Lennon / 1964 / UK: Beatles for Sale US: Beatles '65\", \"title\": \"I'm a Loser\", \"uid\": \"I'm a Loser\"}",
+  "I've Got a Feeling": "{\"arg\": \"McCartney, with Lennon / 1969 / Let It Be\", \"autocomplete\": \"I've Got a Feeling\", \"subtitle\": \"McCartney, with Lennon / 1969 / Let It Be\", \"title\": \"I've Got a Feeling\", \"uid\": \"I've Got a Feeling\"}",
+  "I've Just Seen a Face": "{\"arg\": \"McCartney / 1965 / UK: Help! US: Rubber Soul\", \"autocomplete\": \"I've Just Seen a Face\", \"subtitle\": \"McCartney / 1965 / UK: Help! US: Rubber Soul\", \"title\": \"I've Just Seen a Face\", \"uid\": \"I've Just Seen a Face\"}",
+  "If I Fell": "{\"arg\": \"Lennon, with McCartney / 1964 / UK: A Hard Day's Night US: Something New\", \"autocomplete\": \"If I Fell\", \"subtitle\": \"Lennon, with McCartney / 1964 / UK: A Hard Day's Night US: Something New\", \"title\": \"If I Fell\", \"uid\": \"If I Fell\"}",
+  "If I Needed Someone": "{\"arg\": \"Harrison / 1965 / UK: Rubber Soul US: Yesterday and Today\", \"autocomplete\": \"If I Needed Someone\", \"subtitle\": \"Harrison / 1965 / UK: Rubber Soul US: Yesterday and Today\", \"title\": \"If I Needed Someone\", \"uid\": \"If I Needed Someone\"}",
+  "If You've Got Trouble": "{\"arg\": \"Starr / 1965 / Anthology 2\", \"autocomplete\": \"If You've Got Trouble\", \"subtitle\": \"Starr / 1965 / Anthology 2\", \"title\": \"If You've Got Trouble\", \"uid\": \"If You've Got Trouble\"}",
+  "In My Life": "{\"arg\": \"Lennon / 1965 / Rubber Soul\", \"autocomplete\": \"In My Life\", \"subtitle\": \"Lennon / 1965 / Rubber Soul\", \"title\": \"In My Life\", \"uid\": \"In My Life\"}",
+  "In Spite of All the Danger": "{\"arg\": \"Lennon / 1958 / Anthology 1\", \"autocomplete\": \"In Spite of All the Danger\", \"subtitle\": \"Lennon / 1958 / Anthology 1\", \"title\": \"In Spite of All the Danger\", \"uid\": \"In Spite of All the Danger\"}",
+  "It Won't Be Long": "{\"arg\": \"Lennon / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"autocomplete\": \"It Won't Be Long\", \"subtitle\": \"Lennon / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"title\": \"It Won't Be Long\", \"uid\": \"It Won't Be Long\"}",
+  "It's All Too Much": "{\"arg\": \"Harrison / 1967 / Yellow Submarine\", \"autocomplete\": \"It's All Too Much\", \"subtitle\": \"Harrison / 1967 / Yellow Submarine\", \"title\": \"It's All Too Much\", \"uid\": \"It's All Too Much\"}",
+  "It's Only Love": "{\"arg\": \"Lennon / 1965 / UK: Help! US: Rubber Soul\", \"autocomplete\": \"It's Only Love\", \"subtitle\": \"Lennon / 1965 / UK: Help! US: Rubber Soul\", \"title\": \"It's Only Love\", \"uid\": \"It's Only Love\"}",
+  "Jazz Piano Song": "{\"arg\": \"McCartney / 1969 / Let it Be film\", \"autocomplete\": \"Jazz Piano Song\", \"subtitle\": \"McCartney / 1969 / Let it Be film\", \"title\": \"Jazz Piano Song\", \"uid\": \"Jazz Piano Song\"}",
+  "Jessie's Dream": "{\"arg\": \"Instrumental / 1967 / Magical Mystery Tour\", \"autocomplete\": \"Jessie's Dream\", \"subtitle\": \"Instrumental / 1967 / Magical Mystery Tour\", \"title\": \"Jessie's Dream\", \"uid\": \"Jessie's Dream\"}",
+  "Johnny B. Goode": "{\"arg\": \"Lennon / 1964 / Live at the BBC\", \"autocomplete\": \"Johnny B. Goode\", \"subtitle\": \"Lennon / 1964 / Live at the BBC\", \"title\": \"Johnny B. Goode\", \"uid\": \"Johnny B. Goode\"}",
+  "Julia": "{\"arg\": \"Lennon / 1968 / The Beatles\", \"autocomplete\": \"Julia\", \"subtitle\": \"Lennon / 1968 / The Beatles\", \"title\": \"Julia\", \"uid\": \"Julia\"}",
+  "Junk": "{\"arg\": \"McCartney / 1968 / Anthology 3\", \"autocomplete\": \"Junk\", \"subtitle\": \"McCartney / 1968 / Anthology 3\", \"title\": \"Junk\", \"uid\": \"Junk\"}",
+  "Kansas City/Hey-Hey-Hey-Hey!": "{\"arg\": \"McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"autocomplete\": \"Kansas City/Hey-Hey-Hey-Hey!\", \"subtitle\": \"McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"title\": \"Kansas City/Hey-Hey-Hey-Hey!\", \"uid\": \"Kansas City/Hey-Hey-Hey-Hey!\"}",
+  "Keep Your Hands Off My Baby": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"Keep Your Hands Off My Baby\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"Keep Your Hands Off My Baby\", \"uid\": \"Keep Your Hands Off My Baby\"}",
+  "Komm, gib mir deine Hand": "{\"arg\": \"Lennon, McCartney / 1964 / UK: Rarities US: Something New\", \"autocomplete\": \"Komm, gib mir deine Hand\", \"subtitle\": \"Lennon, McCartney / 1964 / UK: Rarities US: Something New\", \"title\": \"Komm, gib mir deine Hand\", \"uid\": \"Komm, gib mir deine Hand\"}",
+  "Lady Madonna": "{\"arg\": \"McCartney / 1968 / UK: 1967-1970 US: Hey Jude\", \"autocomplete\": \"Lady Madonna\", \"subtitle\": \"McCartney / 1968 / UK: 1967-1970 US: Hey Jude\", \"title\": \"Lady Madonna\", \"uid\": \"Lady Madonna\"}",
+  "Leave My Kitten Alone": "{\"arg\": \"Lennon / 1964 / Anthology 1\", \"autocomplete\": \"Leave My Kitten Alone\", \"subtitle\": \"Lennon / 1964 / Anthology 1\", \"title\": \"Leave My Kitten Alone\", \"uid\": \"Leave My Kitten Alone\"}",
+  "Lend Me Your Comb": "{\"arg\": \"Lennon, McCartney / 1963 / Anthology 1\", \"autocomplete\": \"Lend Me Your Comb\", \"subtitle\": \"Lennon, McCartney / 1963 / Anthology 1\", \"title\": \"Lend Me Your Comb\", \"uid\": \"Lend Me Your Comb\"}",
+  "Let It Be": "{\"arg\": \"McCartney / 1969 / Let It Be\", \"autocomplete\": \"Let It Be\", \"subtitle\": \"McCartney / 1969 / Let It Be\", \"title\": \"Let It Be\", \"uid\": \"Let It Be\"}",
+  "Like Dreamers Do": "{\"arg\": \"McCartney / 1962 / Anthology 1\", \"autocomplete\": \"Like Dreamers Do\", \"subtitle\": \"McCartney / 1962 / Anthology 1\", \"title\": \"Like Dreamers Do\", \"uid\": \"Like Dreamers Do\"}",
+  "Little Child": "{\"arg\": \"Lennon, McCartney / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"autocomplete\": \"Little Child\", \"subtitle\": \"Lennon, McCartney / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"title\": \"Little Child\", \"uid\": \"Little Child\"}",
+  "Lonesome Tears in My Eyes": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"Lonesome Tears in My Eyes\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"Lonesome Tears in My Eyes\", \"uid\": \"Lonesome Tears in My Eyes\"}",
+  "Long Tall Sally": "{\"arg\": \"McCartney / 1964 / UK: Long Tall Sally EP US: The Beatles' Second Album\", \"autocomplete\": \"Long Tall Sally\", \"subtitle\": \"McCartney / 1964 / UK: Long Tall Sally EP US: The Beatles' Second Album\", \"title\": \"Long Tall Sally\", \"uid\": \"Long Tall Sally\"}",
+  "Long, Long, Long": "{\"arg\": \"Harrison / 1968 / The Beatles\", \"autocomplete\": \"Long, Long, Long\", \"subtitle\": \"Harrison / 1968 / The Beatles\", \"title\": \"Long, Long, Long\", \"uid\": \"Long, Long, Long\"}",
+  "Looking Glass": "{\"arg\": \"McCartney / 1962 / \", \"autocomplete\": \"Looking Glass\", \"subtitle\": \"McCartney / 1962 / \", \"title\": \"Looking Glass\", \"uid\": \"Looking Glass\"}",
+  "Love Me Do": "{\"arg\": \"McCartney, with Lennon / 1962 / UK: Please Please Me US: The Early Beatles\", \"autocomplete\": \"Love Me Do\", \"subtitle\": \"McCartney, with Lennon / 1962 / UK: Please Please Me US: The Early Beatles\", \"title\": \"Love Me Do\", \"uid\": \"Love Me Do\"}",
+  "Love You To": "{\"arg\": \"Harrison / 1966 / Revolver\", \"autocomplete\": \"Love You To\", \"subtitle\": \"Harrison / 1966 / Revolver\", \"title\": \"Love You To\", \"uid\": \"Love You To\"}",
+  "Love of the Loved": "{\"arg\": \"McCartney / 1962 / \", \"autocomplete\": \"Love of the Loved\", \"subtitle\": \"McCartney / 1962 / \", \"title\": \"Love of the Loved\", \"uid\": \"Love of the Loved\"}",
+  "Lovely Rita": "{\"arg\": \"McCartney / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"Lovely Rita\", \"subtitle\": \"McCartney / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"Lovely Rita\", \"uid\": \"Lovely Rita\"}",
+  "Lucille": "{\"arg\": \"McCartney / 1963 / Live at the BBC\", \"autocomplete\": \"Lucille\", \"subtitle\": \"McCartney / 1963 / Live at the BBC\", \"title\": \"Lucille\", \"uid\": \"Lucille\"}",
+  "Lucy in the Sky with Diamonds": "{\"arg\": \"Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"Lucy in the Sky with Diamonds\", \"subtitle\": \"Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"Lucy in the Sky with Diamonds\", \"uid\": \"Lucy in the Sky with Diamonds\"}",
+  "Madman": "{\"arg\": \"Lennon / 1969 / N/A\", \"autocomplete\": \"Madman\", \"subtitle\": \"Lennon / 1969 / N/A\", \"title\": \"Madman\", \"uid\": \"Madman\"}",
+  "Maggie Mae": "{\"arg\": \"Lennon, with McCartney / 1969 / Let It Be\", \"autocomplete\": \"Maggie Mae\", \"subtitle\": \"Lennon, with McCartney / 1969 / Let It Be\", \"title\": \"Maggie Mae\", \"uid\": \"Maggie Mae\"}",
+  "Magical Mystery Tour": "{\"arg\": \"McCartney, with Lennon / 1967 / Magical Mystery Tour\", \"autocomplete\": \"Magical Mystery Tour\", \"subtitle\": \"McCartney, with Lennon / 1967 / Magical Mystery Tour\", \"title\": \"Magical Mystery Tour\", \"uid\": \"Magical Mystery Tour\"}",
+  "Mailman, Bring Me No More Blues": "{\"arg\": \"Lennon / 1969 / Anthology 3\", \"autocomplete\": \"Mailman, Bring Me No More Blues\", \"subtitle\": \"Lennon / 1969 / Anthology 3\", \"title\": \"Mailman, Bring Me No More Blues\", \"uid\": \"Mailman, Bring Me No More Blues\"}",
+  "Martha My Dear": "{\"arg\": \"McCartney / 1968 / The Beatles\", \"autocomplete\": \"Martha My Dear\", \"subtitle\": \"McCartney / 1968 / The Beatles\", \"title\": \"Martha My Dear\", \"uid\": \"Martha My Dear\"}",
+  "Matchbox": "{\"arg\": \"Starr / 1964 / UK: \\\"Long Tall Sally\\\" EP US: Something New\", \"autocomplete\": \"Matchbox\", \"subtitle\": \"Starr / 1964 / UK: \\\"Long Tall Sally\\\" EP US: Something New\", \"title\": \"Matchbox\", \"uid\": \"Matchbox\"}",
+  "Maxwell's Silver Hammer": "{\"arg\": \"McCartney / 1969 / Abbey Road\", \"autocomplete\": \"Maxwell's Silver Hammer\", \"subtitle\": \"McCartney / 1969 / Abbey Road\", \"title\": \"Maxwell's Silver Hammer\", \"uid\": \"Maxwell's Silver Hammer\"}",
+  "Mean Mr. Mustard": "{\"arg\": \"Lennon, with McCartney / 1969 / Abbey Road\", \"autocomplete\": \"Mean Mr. Mustard\", \"subtitle\": \"Lennon, with McCartney / 1969 / Abbey Road\", \"title\": \"Mean Mr. Mustard\", \"uid\": \"Mean Mr. Mustard\"}",
+  "Memphis, Tennessee": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"Memphis, Tennessee\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"Memphis, Tennessee\", \"uid\": \"Memphis, Tennessee\"}",
+  "Michelle": "{\"arg\": \"McCartney / 1965 / Rubber Soul\", \"autocomplete\": \"Michelle\", \"subtitle\": \"McCartney / 1965 / Rubber Soul\", \"title\": \"Michelle\", \"uid\": \"Michelle\"}",
+  "Misery": "{\"arg\": \"Lennon and McCartney / 1963 / UK: Please Please Me US: Introducing… The Beatles\", \"autocomplete\": \"Misery\", \"subtitle\": \"Lennon and McCartney / 1963 / UK: Please Please Me US: Introducing… The Beatles\", \"title\": \"Misery\", \"uid\": \"Misery\"}",
+  "Money (That's What I Want)": "{\"arg\": \"Lennon / 1963 / UK: With the Beatles US: The Beatles Second Album\", \"autocomplete\": \"Money (That's What I Want)\", \"subtitle\": \"Lennon / 1963 / UK: With the Beatles US: The Beatles Second Album\", \"title\": \"Money (That's What I Want)\", \"uid\": \"Money (That's What I Want)\"}",
+  "Moonlight Bay": "{\"arg\": \"Lennon, McCartney, Harrison, Eric Morecambe, Ernie Wise / 1963 / Anthology 1\", \"autocomplete\": \"Moonlight Bay\", \"subtitle\": \"Lennon, McCartney, Harrison, Eric Morecambe, Ernie Wise / 1963 / Anthology 1\", \"title\": \"Moonlight Bay\", \"uid\": \"Moonlight Bay\"}",
+  "Mother Nature's Son": "{\"arg\": \"McCartney / 1968 / The Beatles\", \"autocomplete\": \"Mother Nature's Son\", \"subtitle\": \"McCartney / 1968 / The Beatles\", \"title\": \"Mother Nature's Son\", \"uid\": \"Mother Nature's Son\"}",
+  "Mr. Moonlight": "{\"arg\": \"Lennon / 1964 / UK: Beatles for Sale US: Beatles '65\", \"autocomplete\": \"Mr. Moonlight\", \"subtitle\": \"Lennon / 1964 / UK: Beatles for Sale US: Beatles '65\", \"title\": \"Mr. Moonlight\", \"uid\": \"Mr. Moonlight\"}",
+  "No Reply": "{\"arg\": \"Lennon, with McCartney / 1964 / UK: Beatles for Sale US: Beatles '65\", \"autocomplete\": \"No Reply\", \"subtitle\": \"Lennon, with McCartney / 1964 / UK: Beatles for Sale US: Beatles '65\", \"title\": \"No Reply\", \"uid\": \"No Reply\"}",
+  "Norwegian Wood (This Bird Has Flown)": "{\"arg\": \"Lennon / 1965 / Rubber Soul\", \"autocomplete\": \"Norwegian Wood (This Bird Has Flown)\", \"subtitle\": \"Lennon / 1965 / Rubber Soul\", \"title\": \"Norwegian Wood (This Bird Has Flown)\", \"uid\": \"Norwegian Wood (This Bird Has Flown)\"}",
+  "Not Guilty": "{\"arg\": \"Harrison / 1968 / Anthology 3\", \"autocomplete\": \"Not Guilty\", \"subtitle\": \"Harrison / 1968 / Anthology 3\", \"title\": \"Not Guilty\", \"uid\": \"Not Guilty\"}",
+  "Not a Second Time": "{\"arg\": \"Lennon / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"autocomplete\": \"Not a Second Time\", \"subtitle\": \"Lennon / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"title\": \"Not a Second Time\", \"uid\": \"Not a Second Time\"}",
+  "Nothin' Shakin' (But the Leaves on the Trees)": "{\"arg\": \"Harrison / 1963 / Live at the BBC\", \"autocomplete\": \"Nothin' Shakin' (But the Leaves on the Trees)\", \"subtitle\": \"Harrison / 1963 / Live at the BBC\", \"title\": \"Nothin' Shakin' (But the Leaves on the Trees)\", \"uid\": \"Nothin' Shakin' (But the Leaves on the Trees)\"}",
+  "Nowhere Man": "{\"arg\": \"Lennon, with McCartney and Harrison / 1965 / UK: Rubber Soul US: Yesterday and Today\", \"autocomplete\": \"Nowhere Man\", \"subtitle\": \"Lennon, with McCartney and Harrison / 1965 / UK: Rubber Soul US: Yesterday and Today\", \"title\": \"Nowhere Man\", \"uid\": \"Nowhere Man\"}",
+  "Ob-La-Di, Ob-La-Da": "{\"arg\": \"McCartney / 1968 / The Beatles\", \"autocomplete\": \"Ob-La-Di, Ob-La-Da\", \"subtitle\": \"McCartney / 1968 / The Beatles\", \"title\": \"Ob-La-Di, Ob-La-Da\", \"uid\": \"Ob-La-Di, Ob-La-Da\"}",
+  "Octopus's Garden": "{\"arg\": \"Starr / 1969 / Abbey Road\", \"autocomplete\": \"Octopus's Garden\", \"subtitle\": \"Starr / 1969 / Abbey Road\", \"title\": \"Octopus's Garden\", \"uid\": \"Octopus's Garden\"}",
+  "Oh! Darling": "{\"arg\": \"McCartney / 1969 / Abbey Road\", \"autocomplete\": \"Oh! Darling\", \"subtitle\": \"McCartney / 1969 / Abbey Road\", \"title\": \"Oh! Darling\", \"uid\": \"Oh! Darling\"}",
+  "Old Brown Shoe": "{\"arg\": \"Harrison / 1969 / UK: 1967–1970 US: Hey Jude\", \"autocomplete\": \"Old Brown Shoe\", \"subtitle\": \"Harrison / 1969 / UK: 1967–1970 US: Hey Jude\", \"title\": \"Old Brown Shoe\", \"uid\": \"Old Brown Shoe\"}",
+  "One After 909": "{\"arg\": \"Lennon, with McCartney / 1969 / Let It Be\", \"autocomplete\": \"One After 909\", \"subtitle\": \"Lennon, with McCartney / 1969 / Let It Be\", \"title\": \"One After 909\", \"uid\": \"One After 909\"}",
+  "One and One Is Two": "{\"arg\": \"McCartney / 1964 / \", \"autocomplete\": \"One and One Is Two\", \"subtitle\": \"McCartney / 1964 / \", \"title\": \"One and One Is Two\", \"uid\": \"One and One Is Two\"}",
+  "Only a Northern Song": "{\"arg\": \"Harrison / 1967 / Yellow Submarine\", \"autocomplete\": \"Only a Northern Song\", \"subtitle\": \"Harrison / 1967 / Yellow Submarine\", \"title\": \"Only a Northern Song\", \"uid\": \"Only a Northern Song\"}",
+  "Ooh! My Soul": "{\"arg\": \"McCartney / 1963 / Live at the BBC\", \"autocomplete\": \"Ooh! My Soul\", \"subtitle\": \"McCartney / 1963 / Live at the BBC\", \"title\": \"Ooh! My Soul\", \"uid\": \"Ooh! My Soul\"}",
+  "P.S. I Love You": "{\"arg\": \"McCartney / 1962 / UK: Please Please Me US: The Early Beatles\", \"autocomplete\": \"P.S. I Love You\", \"subtitle\": \"McCartney / 1962 / UK: Please Please Me US: The Early Beatles\", \"title\": \"P.S. I Love You\", \"uid\": \"P.S. I Love You\"}",
+  "Paperback Writer": "{\"arg\": \"McCartney / 1966 / UK: A Collection of Beatles Oldies US: Hey Jude\", \"autocomplete\": \"Paperback Writer\", \"subtitle\": \"McCartney / 1966 / UK: A Collection of Beatles Oldies US: Hey Jude\", \"title\": \"Paperback Writer\", \"uid\": \"Paperback Writer\"}",
+  "Penny Lane": "{\"arg\": \"McCartney / 1966 / Magical Mystery Tour\", \"autocomplete\": \"Penny Lane\", \"subtitle\": \"McCartney / 1966 / Magical Mystery Tour\", \"title\": \"Penny Lane\", \"uid\": \"Penny Lane\"}",
+  "Piggies": "{\"arg\": \"Harrison / 1968 / The Beatles\", \"autocomplete\": \"Piggies\", \"subtitle\": \"Harrison / 1968 / The Beatles\", \"title\": \"Piggies\", \"uid\": \"Piggies\"}",
+  "Please Mr. Postman": "{\"arg\": \"Lennon / 1963 / UK: With the Beatles US: The Beatles' Second Album\", \"autocomplete\": \"Please Mr. Postman\", \"subtitle\": \"Lennon / 1963 / UK: With the Beatles US: The Beatles' Second Album\", \"title\": \"Please Mr. Postman\", \"uid\": \"Please Mr. Postman\"}",
+  "Please Please Me": "{\"arg\": \"Lennon and McCartney / 1962 / UK: Please Please Me US: The Early Beatles\", \"autocomplete\": \"Please Please Me\", \"subtitle\": \"Lennon and McCartney / 1962 / UK: Please Please Me US: The Early Beatles\", \"title\": \"Please Please Me\", \"uid\": \"Please Please Me\"}",
+  "Polythene Pam": "{\"arg\": \"Lennon / 1969 / Abbey Road\", \"autocomplete\": \"Polythene Pam\", \"subtitle\": \"Lennon / 1969 / Abbey Road\", \"title\": \"Polythene Pam\", \"uid\": \"Polythene Pam\"}",
+  "Rain": "{\"arg\": \"Lennon / 1966 / UK: Rarities US: Hey Jude\", \"autocomplete\": \"Rain\", \"subtitle\": \"Lennon / 1966 / UK: Rarities US: Hey Jude\", \"title\": \"Rain\", \"uid\": \"Rain\"}",
+  "Real Love": "{\"arg\": \"Lennon / 1980 / Anthology 2\", \"autocomplete\": \"Real Love\", \"subtitle\": \"Lennon / 1980 / Anthology 2\", \"title\": \"Real Love\", \"uid\": \"Real Love\"}",
+  "Revolution 9": "{\"arg\": \"Sound Collage / 1968 / The Beatles\", \"autocomplete\": \"Revolution 9\", \"subtitle\": \"Sound Collage / 1968 / The Beatles\", \"title\": \"Revolution 9\", \"uid\": \"Revolution 9\"}",
+  "Rip It Up / Shake, Rattle, and Roll / Blue Suede Shoes": "{\"arg\": \"Lennon, McCartney / 1969 / Anthology 3\", \"autocomplete\": \"Rip It Up / Shake, Rattle, and Roll / Blue Suede Shoes\", \"subtitle\": \"Lennon, McCartney / 1969 / Anthology 3\", \"title\": \"Rip It Up / Shake, Rattle, and Roll / Blue Suede Shoes\", \"uid\": \"Rip It Up / Shake, Rattle, and Roll / Blue Suede Shoes\"}",
+  "Rock and Roll Music": "{\"arg\": \"Lennon / 1964 / UK: Beatles for Sale US: Beatles '65\", \"autocomplete\": \"Rock and Roll Music\", \"subtitle\": \"Lennon / 1964 / UK: Beatles for Sale US: Beatles '65\", \"title\": \"Rock and Roll Music\", \"uid\": \"Rock and Roll Music\"}",
+  "Rocky Raccoon": "{\"arg\": \"McCartney / 1968 / The Beatles\", \"autocomplete\": \"Rocky Raccoon\", \"subtitle\": \"McCartney / 1968 / The Beatles\", \"title\": \"Rocky Raccoon\", \"uid\": \"Rocky Raccoon\"}",
+  "Roll Over Beethoven": "{\"arg\": \"Harrison / 1963 / UK: With the Beatles US: The Beatles' Second Album\", \"autocomplete\": \"Roll Over Beethoven\", \"subtitle\": \"Harrison / 1963 / UK: With the Beatles US: The Beatles' Second Album\", \"title\": \"Roll Over Beethoven\", \"uid\": \"Roll Over Beethoven\"}",
+  "Run for Your Life": "{\"arg\": \"Lennon / 1965 / Rubber Soul\", \"autocomplete\": \"Run for Your Life\", \"subtitle\": \"Lennon / 1965 / Rubber Soul\", \"title\": \"Run for Your Life\", \"uid\": \"Run for Your Life\"}",
+  "Savoy Truffle": "{\"arg\": \"Harrison / 1968 / The Beatles\", \"autocomplete\": \"Savoy Truffle\", \"subtitle\": \"Harrison / 1968 / The Beatles\", \"title\": \"Savoy Truffle\", \"uid\": \"Savoy Truffle\"}",
+  "Searchin'": "{\"arg\": \"McCartney / 1962 / Anthology 1\", \"autocomplete\": \"Searchin'\", \"subtitle\": \"McCartney / 1962 / Anthology 1\", \"title\": \"Searchin'\", \"uid\": \"Searchin'\"}",
+  "September in the Rain": "{\"arg\": \"McCartney / 1962 / \", \"autocomplete\": \"September in the Rain\", \"subtitle\": \"McCartney / 1962 / \", \"title\": \"September in the Rain\", \"uid\": \"September in the Rain\"}",
+  "Sexy Sadie": "{\"arg\": \"Lennon / 1968 / The Beatles\", \"autocomplete\": \"Sexy Sadie\", \"subtitle\": \"Lennon / 1968 / The Beatles\", \"title\": \"Sexy Sadie\", \"uid\": \"Sexy Sadie\"}",
+  "Sgt. Pepper's Lonely Hearts Club Band": "{\"arg\": \"McCartney, with Lennon, Harrison and Starr / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"Sgt. Pepper's Lonely Hearts Club Band\", \"subtitle\": \"McCartney, with Lennon, Harrison and Starr / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"Sgt. Pepper's Lonely Hearts Club Band\", \"uid\": \"Sgt. Pepper's Lonely Hearts Club Band\"}",
+  "Sgt. Pepper's Lonely Hearts Club Band (Reprise)": "{\"arg\": \"McCartney, Lennon, Harrison, Starr / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"Sgt. Pepper's Lonely Hearts Club Band (Reprise)\", \"subtitle\": \"McCartney, Lennon, Harrison, Starr / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"Sgt. Pepper's Lonely Hearts Club Band (Reprise)\", \"uid\": \"Sgt. Pepper's Lonely Hearts Club Band (Reprise)\"}",
+  "Shakin' in the Sixties": "{\"arg\": \"Lennon / 1969 / Unreleased\", \"autocomplete\": \"Shakin' in the Sixties\", \"subtitle\": \"Lennon / 1969 / Unreleased\", \"title\": \"Shakin' in the Sixties\", \"uid\": \"Shakin' in the Sixties\"}",
+  "She Came in Through the Bathroom Window": "{\"arg\": \"McCartney / 1969 / Abbey Road\", \"autocomplete\": \"She Came in Through the Bathroom Window\", \"subtitle\": \"McCartney / 1969 / Abbey Road\", \"title\": \"She Came in Through the Bathroom Window\", \"uid\": \"She Came in Through the Bathroom Window\"}",
+  "She Loves You": "{\"arg\": \"Lennon, McCartney / 1963 / UK: A Collection of Beatles Oldies US: The Beatles Second Album\", \"autocomplete\": \"She Loves You\", \"subtitle\": \"Lennon, McCartney / 1963 / UK: A Collection of Beatles Oldies US: The Beatles Second Album\", \"title\": \"She Loves You\", \"uid\": \"She Loves You\"}",
+  "She Said She Said": "{\"arg\": \"Lennon / 1966 / Revolver\", \"autocomplete\": \"She Said She Said\", \"subtitle\": \"Lennon / 1966 / Revolver\", \"title\": \"She Said She Said\", \"uid\": \"She Said She Said\"}",
+  "She's Leaving Home": "{\"arg\": \"McCartney, with Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"She's Leaving Home\", \"subtitle\": \"McCartney, with Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"She's Leaving Home\", \"uid\": \"She's Leaving Home\"}",
+  "She's a Woman": "{\"arg\": \"McCartney / 1964 / UK: Rarities US: Beatles '65\", \"autocomplete\": \"She's a Woman\", \"subtitle\": \"McCartney / 1964 / UK: Rarities US: Beatles '65\", \"title\": \"She's a Woman\", \"uid\": \"She's a Woman\"}",
+  "Shout": "{\"arg\": \"Lennon, McCartney, Harrison, Starr / 1964 / Anthology 1\", \"autocomplete\": \"Shout\", \"subtitle\": \"Lennon, McCartney, Harrison, Starr / 1964 / Anthology 1\", \"title\": \"Shout\", \"uid\": \"Shout\"}",
+  "Sie liebt dich": "{\"arg\": \"Lennon, McCartney / 1964 / UK: Rarities US: Rarities\", \"autocomplete\": \"Sie liebt dich\", \"subtitle\": \"Lennon, McCartney / 1964 / UK: Rarities US: Rarities\", \"title\": \"Sie liebt dich\", \"uid\": \"Sie liebt dich\"}",
+  "Slow Down": "{\"arg\": \"Lennon / 1964 / UK: \\\"Long Tall Sally\\\" EP US: Something New\", \"autocomplete\": \"Slow Down\", \"subtitle\": \"Lennon / 1964 / UK: \\\"Long Tall Sally\\\" EP US: Something New\", \"title\": \"Slow Down\", \"uid\": \"Slow Down\"}",
+  "So How Come (No One Loves Me)": "{\"arg\": \"Harrison / 1963 / Live at the BBC\", \"autocomplete\": \"So How Come (No One Loves Me)\", \"subtitle\": \"Harrison / 1963 / Live at the BBC\", \"title\": \"So How Come (No One Loves Me)\", \"uid\": \"So How Come (No One Loves Me)\"}",
+  "Soldier of Love (Lay Down Your Arms)": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"Soldier of Love (Lay Down Your Arms)\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"Soldier of Love (Lay Down Your Arms)\", \"uid\": \"Soldier of Love (Lay Down Your Arms)\"}",
+  "Some Other Guy": "{\"arg\": \"Lennon, McCartney / 1963 / Live at the BBC\", \"autocomplete\": \"Some Other Guy\", \"subtitle\": \"Lennon, McCartney / 1963 / Live at the BBC\", \"title\": \"Some Other Guy\", \"uid\": \"Some Other Guy\"}",
+  "Something": "{\"arg\": \"Harrison / 1969 / Abbey Road\", \"autocomplete\": \"Something\", \"subtitle\": \"Harrison / 1969 / Abbey Road\", \"title\": \"Something\", \"uid\": \"Something\"}",
+  "Sour Milk Sea": "{\"arg\": \"Harrison / 1968 / Unreleased\", \"autocomplete\": \"Sour Milk Sea\", \"subtitle\": \"Harrison / 1968 / Unreleased\", \"title\": \"Sour Milk Sea\", \"uid\": \"Sour Milk Sea\"}",
+  "Step Inside Love/Los Paranoias": "{\"arg\": \"McCartney / 1968 / Anthology 3\", \"autocomplete\": \"Step Inside Love/Los Paranoias\", \"subtitle\": \"McCartney / 1968 / Anthology 3\", \"title\": \"Step Inside Love/Los Paranoias\", \"uid\": \"Step Inside Love/Los Paranoias\"}",
+  "Strawberry Fields Forever": "{\"arg\": \"Lennon / 1966 / Magical Mystery Tour\", \"autocomplete\": \"Strawberry Fields Forever\", \"subtitle\": \"Lennon / 1966 / Magical Mystery Tour\", \"title\": \"Strawberry Fields Forever\", \"uid\": \"Strawberry Fields Forever\"}",
+  "Sun King": "{\"arg\": \"Lennon, with McCartney and Harrison / 1969 / Abbey Road\", \"autocomplete\": \"Sun King\", \"subtitle\": \"Lennon, with McCartney and Harrison / 1969 / Abbey Road\", \"title\": \"Sun King\", \"uid\": \"Sun King\"}",
+  "Sure to Fall (in Love with You)": "{\"arg\": \"McCartney / 1963 / Live at the BBC\", \"autocomplete\": \"Sure to Fall (in Love with You)\", \"subtitle\": \"McCartney / 1963 / Live at the BBC\", \"title\": \"Sure to Fall (in Love with You)\", \"uid\": \"Sure to Fall (in Love with You)\"}",
+  "Sweet Little Sixteen": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"Sweet Little Sixteen\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"Sweet Little Sixteen\", \"uid\": \"Sweet Little Sixteen\"}",
+  "Take Good Care of My Baby": "{\"arg\": \"Harrison / 1962 / \", \"autocomplete\": \"Take Good Care of My Baby\", \"subtitle\": \"Harrison / 1962 / \", \"title\": \"Take Good Care of My Baby\", \"uid\": \"Take Good Care of My Baby\"}",
+  "Taking a Trip to Carolina": "{\"arg\": \"Starr / 1969 / Let It Be... Naked - Fly on the Wall bonus disc\", \"autocomplete\": \"Taking a Trip to Carolina\", \"subtitle\": \"Starr / 1969 / Let It Be... Naked - Fly on the Wall bonus disc\", \"title\": \"Taking a Trip to Carolina\", \"uid\": \"Taking a Trip to Carolina\"}",
+  "Taxman": "{\"arg\": \"Harrison, with Lennon and McCartney / 1966 / Revolver\", \"autocomplete\": \"Taxman\", \"subtitle\": \"Harrison, with Lennon and McCartney / 1966 / Revolver\", \"title\": \"Taxman\", \"uid\": \"Taxman\"}",
+  "Teddy Boy": "{\"arg\": \"McCartney / 1969 / Anthology 3\", \"autocomplete\": \"Teddy Boy\", \"subtitle\": \"McCartney / 1969 / Anthology 3\", \"title\": \"Teddy Boy\", \"uid\": \"Teddy Boy\"}",
+  "Tell Me What You See": "{\"arg\": \"McCartney, with Lennon / 1965 / UK: Help! US: Beatles VI\", \"autocomplete\": \"Tell Me What You See\", \"subtitle\": \"McCartney, with Lennon / 1965 / UK: Help! US: Beatles VI\", \"title\": \"Tell Me What You See\", \"uid\": \"Tell Me What You See\"}",
+  "Tell Me Why": "{\"arg\": \"Lennon / 1964 / UK: A Hard Day's Night US: Something New\", \"autocomplete\": \"Tell Me Why\", \"subtitle\": \"Lennon / 1964 / UK: A Hard Day's Night US: Something New\", \"title\": \"Tell Me Why\", \"uid\": \"Tell Me Why\"}",
+  "Thank You Girl": "{\"arg\": \"Lennon, McCartney / 1963 / UK: Rarities US: The Beatles Second Album\", \"autocomplete\": \"Thank You Girl\", \"subtitle\": \"Lennon, McCartney / 1963 / UK: Rarities US: The Beatles Second Album\", \"title\": \"Thank You Girl\", \"uid\": \"Thank You Girl\"}",
+  "That Means a Lot": "{\"arg\": \"McCartney / 1965 / Anthology 2\", \"autocomplete\": \"That Means a Lot\", \"subtitle\": \"McCartney / 1965 / Anthology 2\", \"title\": \"That Means a Lot\", \"uid\": \"That Means a Lot\"}",
+  "That'll Be the Day": "{\"arg\": \"Lennon / 1958 / Anthology 1\", \"autocomplete\": \"That'll Be the Day\", \"subtitle\": \"Lennon / 1958 / Anthology 1\", \"title\": \"That'll Be the Day\", \"uid\": \"That'll Be the Day\"}",
+  "That’s All Right (Mama)": "{\"arg\": \"McCartney / 1963 / Live at the BBC\", \"autocomplete\": \"That’s All Right (Mama)\", \"subtitle\": \"McCartney / 1963 / Live at the BBC\", \"title\": \"That’s All Right (Mama)\", \"uid\": \"That’s All Right (Mama)\"}",
+  "The Ballad of John and Yoko": "{\"arg\": \"Lennon, with McCartney / 1969 / UK: 1967–1970 US: Hey Jude\", \"autocomplete\": \"The Ballad of John and Yoko\", \"subtitle\": \"Lennon, with McCartney / 1969 / UK: 1967–1970 US: Hey Jude\", \"title\": \"The Ballad of John and Yoko\", \"uid\": \"The Ballad of John and Yoko\"}",
+  "The Continuing Story of Bungalow Bill": "{\"arg\": \"Lennon / 1968 / The Beatles\", \"autocomplete\": \"The Continuing Story of Bungalow Bill\", \"subtitle\": \"Lennon / 1968 / The Beatles\", \"title\": \"The Continuing Story of Bungalow Bill\", \"uid\": \"The Continuing Story of Bungalow Bill\"}",
+  "The End": "{\"arg\": \"McCartney / 1969 / Abbey Road\", \"autocomplete\": \"The End\", \"subtitle\": \"McCartney / 1969 / Abbey Road\", \"title\": \"The End\", \"uid\": \"The End\"}",
+  "The Fool on the Hill": "{\"arg\": \"McCartney / 1967 / Magical Mystery Tour\", \"autocomplete\": \"The Fool on the Hill\", \"subtitle\": \"McCartney / 1967 / Magical Mystery Tour\", \"title\": \"The Fool on the Hill\", \"uid\": \"The Fool on the Hill\"}",
+  "The Honeymoon Song": "{\"arg\": \"McCartney / 1963 / Live at the BBC\", \"autocomplete\": \"The Honeymoon Song\", \"subtitle\": \"McCartney / 1963 / Live at the BBC\", \"title\": \"The Honeymoon Song\", \"uid\": \"The Honeymoon Song\"}",
+  "The Inner Light": "{\"arg\": \"Harrison / 1968 / UK: Rarities US: Rarities\", \"autocomplete\": \"The Inner Light\", \"subtitle\": \"Harrison / 1968 / UK: Rarities US: Rarities\", \"title\": \"The Inner Light\", \"uid\": \"The Inner Light\"}",
+  "The Long and Winding Road": "{\"arg\": \"McCartney / 1969 / Let It Be\", \"autocomplete\": \"The Long and Winding Road\", \"subtitle\": \"McCartney / 1969 / Let It Be\", \"title\": \"The Long and Winding Road\", \"uid\": \"The Long and Winding Road\"}",
+  "The Night Before": "{\"arg\": \"McCartney / 1965 / Help!\", \"autocomplete\": \"The Night Before\", \"subtitle\": \"McCartney / 1965 / Help!\", \"title\": \"The Night Before\", \"uid\": \"The Night Before\"}",
+  "The Sheik of Araby": "{\"arg\": \"Harrison / 1962 / Anthology 1\", \"autocomplete\": \"The Sheik of Araby\", \"subtitle\": \"Harrison / 1962 / Anthology 1\", \"title\": \"The Sheik of Araby\", \"uid\": \"The Sheik of Araby\"}",
+  "The Word": "{\"arg\": \"Lennon, with McCartney and Harrison / 1965 / Rubber Soul\", \"autocomplete\": \"The Word\", \"subtitle\": \"Lennon, with McCartney and Harrison / 1965 / Rubber Soul\", \"title\": \"The Word\", \"uid\": \"The Word\"}",
+  "There's a Place": "{\"arg\": \"Lennon, McCartney / 1963 / UK: Please Please Me US: Rarities\", \"autocomplete\": \"There's a Place\", \"subtitle\": \"Lennon, McCartney / 1963 / UK: Please Please Me US: Rarities\", \"title\": \"There's a Place\", \"uid\": \"There's a Place\"}",
+  "Things We Said Today": "{\"arg\": \"McCartney / 1964 / UK: A Hard Day's Night US: Something New\", \"autocomplete\": \"Things We Said Today\", \"subtitle\": \"McCartney / 1964 / UK: A Hard Day's Night US: Something New\", \"title\": \"Things We Said Today\", \"uid\": \"Things We Said Today\"}",
+  "Think for Yourself": "{\"arg\": \"Harrison / 1965 / Rubber Soul\", \"autocomplete\": \"Think for Yourself\", \"subtitle\": \"Harrison / 1965 / Rubber Soul\", \"title\": \"Think for Yourself\", \"uid\": \"Think for Yourself\"}",
+  "This Boy": "{\"arg\": \"Lennon, with McCartney and Harrison / 1963 / UK: Rarities US: Meet the Beatles!\", \"autocomplete\": \"This Boy\", \"subtitle\": \"Lennon, with McCartney and Harrison / 1963 / UK: Rarities US: Meet the Beatles!\", \"title\": \"This Boy\", \"uid\": \"This Boy\"}",
+  "Three Cool Cats": "{\"arg\": \"Harrison / 1962 / Anthology 1\", \"autocomplete\": \"Three Cool Cats\", \"subtitle\": \"Harrison / 1962 / Anthology 1\", \"title\": \"Three Cool Cats\", \"uid\": \"Three Cool Cats\"}",
+  "Ticket to Ride": "{\"arg\": \"Lennon, with McCartney / 1965 / Help!\", \"autocomplete\": \"Ticket to Ride\", \"subtitle\": \"Lennon, with McCartney / 1965 / Help!\", \"title\": \"Ticket to Ride\", \"uid\": \"Ticket to Ride\"}",
+  "Till There Was You": "{\"arg\": \"McCartney / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"autocomplete\": \"Till There Was You\", \"subtitle\": \"McCartney / 1963 / UK: With the Beatles US: Meet the Beatles!\", \"title\": \"Till There Was You\", \"uid\": \"Till There Was You\"}",
+  "Tip of My Tongue": "{\"arg\": \"Lennon, McCartney /  / Unreleased\", \"autocomplete\": \"Tip of My Tongue\", \"subtitle\": \"Lennon, McCartney /  / Unreleased\", \"title\": \"Tip of My Tongue\", \"uid\": \"Tip of My Tongue\"}",
+  "To Know Her is to Love Her": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"To Know Her is to Love Her\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"To Know Her is to Love Her\", \"uid\": \"To Know Her is to Love Her\"}",
+  "Tomorrow Never Knows": "{\"arg\": \"Lennon / 1966 / Revolver\", \"autocomplete\": \"Tomorrow Never Knows\", \"subtitle\": \"Lennon / 1966 / Revolver\", \"title\": \"Tomorrow Never Knows\", \"uid\": \"Tomorrow Never Knows\"}",
+  "Too Much Monkey Business": "{\"arg\": \"Lennon / 1963 / Live at the BBC\", \"autocomplete\": \"Too Much Monkey Business\", \"subtitle\": \"Lennon / 1963 / Live at the BBC\", \"title\": \"Too Much Monkey Business\", \"uid\": \"Too Much Monkey Business\"}",
+  "Twist and Shout": "{\"arg\": \"Lennon / 1963 / UK: Please Please Me US: The Early Beatles\", \"autocomplete\": \"Twist and Shout\", \"subtitle\": \"Lennon / 1963 / UK: Please Please Me US: The Early Beatles\", \"title\": \"Twist and Shout\", \"uid\": \"Twist and Shout\"}",
+  "Two of Us": "{\"arg\": \"McCartney, with Lennon / 1969 / Let It Be\", \"autocomplete\": \"Two of Us\", \"subtitle\": \"McCartney, with Lennon / 1969 / Let It Be\", \"title\": \"Two of Us\", \"uid\": \"Two of Us\"}",
+  "Wait": "{\"arg\": \"McCartney and Lennon / 1965 / Rubber Soul\", \"autocomplete\": \"Wait\", \"subtitle\": \"McCartney and Lennon / 1965 / Rubber Soul\", \"title\": \"Wait\", \"uid\": \"Wait\"}",
+  "Watching Rainbows": "{\"arg\": \"Lennon / 1969 / \", \"autocomplete\": \"Watching Rainbows\", \"subtitle\": \"Lennon / 1969 / \", \"title\": \"Watching Rainbows\", \"uid\": \"Watching Rainbows\"}",
+  "We Can Work It Out": "{\"arg\": \"McCartney, with Lennon / 1965 / UK: A Collection of Beatles Oldies US: Yesterday and Today\", \"autocomplete\": \"We Can Work It Out\", \"subtitle\": \"McCartney, with Lennon / 1965 / UK: A Collection of Beatles Oldies US: Yesterday and Today\", \"title\": \"We Can Work It Out\", \"uid\": \"We Can Work It Out\"}",
+  "What Goes On": "{\"arg\": \"Starr / 1965 / UK: Rubber Soul US: Yesterday and Today\", \"autocomplete\": \"What Goes On\", \"subtitle\": \"Starr / 1965 / UK: Rubber Soul US: Yesterday and Today\", \"title\": \"What Goes On\", \"uid\": \"What Goes On\"}",
+  "What You're Doing": "{\"arg\": \"McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"autocomplete\": \"What You're Doing\", \"subtitle\": \"McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"title\": \"What You're Doing\", \"uid\": \"What You're Doing\"}",
+  "What's The New Mary Jane": "{\"arg\": \"Lennon / 1968 / Anthology 3\", \"autocomplete\": \"What's The New Mary Jane\", \"subtitle\": \"Lennon / 1968 / Anthology 3\", \"title\": \"What's The New Mary Jane\", \"uid\": \"What's The New Mary Jane\"}",
+  "When I Get Home": "{\"arg\": \"Lennon / 1964 / UK: A Hard Day's Night US: Something New\", \"autocomplete\": \"When I Get Home\", \"subtitle\": \"Lennon / 1964 / UK: A Hard Day's Night US: Something New\", \"title\": \"When I Get Home\", \"uid\": \"When I Get Home\"}",
+  "When I'm Sixty-Four": "{\"arg\": \"McCartney / 1966 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"When I'm Sixty-Four\", \"subtitle\": \"McCartney / 1966 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"When I'm Sixty-Four\", \"uid\": \"When I'm Sixty-Four\"}",
+  "While My Guitar Gently Weeps": "{\"arg\": \"Harrison / 1968 / The Beatles\", \"autocomplete\": \"While My Guitar Gently Weeps\", \"subtitle\": \"Harrison / 1968 / The Beatles\", \"title\": \"While My Guitar Gently Weeps\", \"uid\": \"While My Guitar Gently Weeps\"}",
+  "Why Don't We Do It in the Road?": "{\"arg\": \"McCartney / 1968 / The Beatles\", \"autocomplete\": \"Why Don't We Do It in the Road?\", \"subtitle\": \"McCartney / 1968 / The Beatles\", \"title\": \"Why Don't We Do It in the Road?\", \"uid\": \"Why Don't We Do It in the Road?\"}",
+  "Wild Honey Pie": "{\"arg\": \"McCartney / 1968 / The Beatles\", \"autocomplete\": \"Wild Honey Pie\", \"subtitle\": \"McCartney / 1968 / The Beatles\", \"title\": \"Wild Honey Pie\", \"uid\": \"Wild Honey Pie\"}",
+  "With a Little Help from My Friends": "{\"arg\": \"Starr, with Lennon and McCartney / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"With a Little Help from My Friends\", \"subtitle\": \"Starr, with Lennon and McCartney / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"With a Little Help from My Friends\", \"uid\": \"With a Little Help from My Friends\"}",
+  "Within You Without You": "{\"arg\": \"Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"autocomplete\": \"Within You Without You\", \"subtitle\": \"Lennon / 1967 / Sgt. Pepper's Lonely Hearts Club Band\", \"title\": \"Within You Without You\", \"uid\": \"Within You Without You\"}",
+  "Woman": "{\"arg\": \"McCartney / 1965 / Let It Be film\", \"autocomplete\": \"Woman\", \"subtitle\": \"McCartney / 1965 / Let It Be film\", \"title\": \"Woman\", \"uid\": \"Woman\"}",
+  "Words of Love": "{\"arg\": \"Lennon, McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"autocomplete\": \"Words of Love\", \"subtitle\": \"Lennon, McCartney / 1964 / UK: Beatles for Sale US: Beatles VI\", \"title\": \"Words of Love\", \"uid\": \"Words of Love\"}",
+  "Yellow Submarine": "{\"arg\": \"Starr / 1966 / Revolver\", \"autocomplete\": \"Yellow Submarine\", \"subtitle\": \"Starr / 1966 / Revolver\", \"title\": \"Yellow Submarine\", \"uid\": \"Yellow Submarine\"}",
+  "Yer Blues": "{\"arg\": \"Lennon / 1968 / The Beatles\", \"autocomplete\": \"Yer Blues\", \"subtitle\": \"Lennon / 1968 / The Beatles\", \"title\": \"Yer Blues\", \"uid\": \"Yer Blues\"}",
+  "Yes It Is": "{\"arg\": \"Lennon, McCartney and Harrison / 1965 / UK: Rarities US: Beatles VI\", \"autocomplete\": \"Yes It Is\", \"subtitle\": \"Lennon, McCartney and Harrison / 1965 / UK: Rarities US: Beatles VI\", \"title\": \"Yes It Is\", \"uid\": \"Yes It Is\"}",
+  "Yesterday": "{\"arg\": \"McCartney / 1965 / UK: Help! US: Yesterday and Today\", \"autocomplete\": \"Yesterday\", \"subtitle\": \"McCartney / 1965 / UK: Help! US: Yesterday and Today\", \"title\": \"Yesterday\", \"uid\": \"Yesterday\"}",
+  "You Can't Do That": "{\"arg\": \"Lennon / 1964 / UK: A Hard Day's Night US: The Beatles Second Album\", \"autocomplete\": \"You Can't Do That\", \"subtitle\": \"Lennon / 1964 / UK: A Hard Day's Night US: The Beatles Second Album\", \"title\": \"You Can't Do That\", \"uid\": \"You Can't Do That\"}",
+  "You Know My Name (Look Up the Number)": "{\"arg\": \"Lennon, McCartney / 1967 / UK: Rarities US: Rarities\", \"autocomplete\": \"You Know My Name (Look Up the Number)\", \"subtitle\": \"Lennon, McCartney / 1967 / UK: Rarities US: Rarities\", \"title\": \"You Know My Name (Look Up the Number)\", \"uid\": \"You Know My Name (Look Up the Number)\"}",
+  "You Know What to Do": "{\"arg\": \"Harrison / 1964 / Anthology 1\", \"autocomplete\": \"You Know What to Do\", \"subtitle\": \"Harrison / 1964 / Anthology 1\", \"title\": \"You Know What to Do\", \"uid\": \"You Know What to Do\"}",
+  "You Like Me Too Much": "{\"arg\": \"Harrison / 1965 / UK: Help! US: Beatles VI\", \"autocomplete\": \"You Like Me Too Much\", \"subtitle\": \"Harrison / 1965 / UK: Help! US: Beatles VI\", \"title\": \"You Like Me Too Much\", \"uid\": \"You Like Me Too Much\"}",
+  "You Never Give Me Your Money": "{\"arg\": \"McCartney / 1969 / Abbey Road\", \"autocomplete\": \"You Never Give Me Your Money\", \"subtitle\": \"McCartney / 1969 / Abbey Road\", \"title\": \"You Never Give Me Your Money\", \"uid\": \"You Never Give Me Your Money\"}",
+  "You Won't See Me": "{\"arg\": \"McCartney / 1965 / Rubber Soul\", \"autocomplete\": \"You Won't See Me\", \"subtitle\": \"McCartney / 1965 / Rubber Soul\", \"title\": \"You Won't See Me\", \"uid\": \"You Won't See Me\"}",
+  "You'll Be Mine": "{\"arg\": \"McCartney / 1960 / Anthology 1\", \"autocomplete\": \"You'll Be Mine\", \"subtitle\": \"McCartney / 1960 / Anthology 1\", \"title\": \"You'll Be Mine\", \"uid\": \"You'll Be Mine\"}",
+  "You're Going to Lose That Girl": "{\"arg\": \"Lennon / 1965 / Help!\", \"autocomplete\": \"You're Going to Lose That Girl\", \"subtitle\": \"Lennon / 1965 / Help!\", \"title\": \"You're Going to Lose That Girl\", \"uid\": \"You're Going to Lose That Girl\"}",
+  "You've Got to Hide Your Love Away": "{\"arg\": \"Lennon / 1965 / Help!\", \"autocomplete\": \"You've Got to Hide Your Love Away\", \"subtitle\": \"Lennon / 1965 / Help!\", \"title\": \"You've Got to Hide Your Love Away\", \"uid\": \"You've Got to Hide Your Love Away\"}",
+  "You've Really Got a Hold on Me": "{\"arg\": \"Lennon and Harrison / 1963 / UK: With the Beatles US: The Beatles Second Album\", \"autocomplete\": \"You've Really Got a Hold on Me\", \"subtitle\": \"Lennon and Harrison / 1963 / UK: With the Beatles US: The Beatles Second Album\", \"title\": \"You've Really Got a Hold on Me\", \"uid\": \"You've Really Got a Hold on Me\"}",
+  "Young Blood": "{\"arg\": \"Harrison / 1963 / Live at the BBC\", \"autocomplete\": \"Young Blood\", \"subtitle\": \"Harrison / 1963 / Live at the BBC\", \"title\": \"Young Blood\", \"uid\": \"Young Blood\"}",
+  "Your Mother Should Know": "{\"arg\": \"McCartney / 1967 / Magical Mystery Tour\", \"autocomplete\": \"Your Mother Should Know\", \"subtitle\": \"McCartney / 1967 / Magical Mystery Tour\", \"title\": \"Your Mother Should Know\", \"uid\": \"Your Mother Should Know\"}"
+ },
+ "related": {
+  "12-Bar Original": [
+   "ifyouvegottrouble",
+   "reallove",
+   "thatmeansalot",
+   "cayenne",
+   "cryforashadow"
+  ],
+  "A Day in the Life": [
+   "gettingbetter",
+   "sgtpepperslonelyheartsclubband",
+   "sgtpepperslonelyheartsclubbandreprise",
+   "shesleavinghome",
+   "withalittlehelpfrommyfriends"
+  ],
+  "A Hard Day's Night": [
+   "adayinthelife",
+   "babysinblack",
+   "because",
+   "becauseiknowyoulovemeso",
+   "birthday"
+  ],
+  "A Shot of Rhythm and Blues": [
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby",
+   "ijustdontunderstand"
+  ],
+  "A Taste of Honey": [
+   "chains",
+   "lovemedo",
+   "psiloveyou",
+   "pleasepleaseme",
+   "annagotohim"
+  ],
+  "Across the Universe": [
+   "digit",
+   "digapony",
+   "ivegotafeeling",
+   "maggiemae",
+   "oneafter"
+  ],
+  "Act Naturally": [
+   "yesterday",
+   "boys",
+   "carrythatweight",
+   "christmastimeishereagain",
+   "dontpassmeby"
+  ],
+  "Ain't She Sweet": [
+   "freeasabird",
+   "hellolittlegirl",
+   "howdoyoudoit",
+   "inspiteofallthedanger",
+   "leavemykittenalone"
+  ],
+  "All I've Got to Do": [
+   "itwontbelong",
+   "littlechild",
+   "notasecondtime",
+   "allmyloving",
+   "dontbotherme"
+  ],
+  "All My Loving": [
+   "holdmetight",
+   "littlechild",
+   "tilltherewasyou",
+   "allivegottodo",
+   "dontbotherme"
+  ],
+  "All Things Must Pass": [
+   "notguilty",
+   "comeandgetit",
+   "junk",
+   "mailmanbringmenomoreblues",
+   "ripitupshakerattleandrollbluesuedeshoes"
+  ],
+  "All Together Now": [
+   "heybulldog",
+   "itsalltoomuch",
+   "onlyanorthernsong",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "All You Need Is Love": [
+   "babyyourearichman",
+   "iamthewalrus",
+   "magicalmysterytour",
+   "strawberryfieldsforever",
+   "bluejayway"
+  ],
+  "And I Love Her": [
+   "ififell",
+   "thingswesaidtoday",
+   "anytimeatall",
+   "illcryinstead",
+   "imhappyjusttodancewithyou"
+  ],
+  "And Your Bird Can Sing": [
+   "doctorrobert",
+   "imonlysleeping",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues"
+  ],
+  "Anna (Go to Him)": [
+   "askmewhy",
+   "babyitsyou",
+   "chains",
+   "lovemedo",
+   "pleasepleaseme"
+  ],
+  "Another Girl": [
+   "thenightbefore",
+   "tickettoride",
+   "help",
+   "ineedyou",
+   "youregoingtolosethatgirl"
+  ],
+  "Any Time at All": [
+   "illcryinstead",
+   "ififell",
+   "tellmewhy",
+   "whenigethome",
+   "andiloveher"
+  ],
+  "Ask Me Why": [
+   "annagotohim",
+   "babyitsyou",
+   "chains",
+   "lovemedo",
+   "pleasepleaseme"
+  ],
+  "Baby It's You": [
+   "annagotohim",
+   "askmewhy",
+   "chains",
+   "lovemedo",
+   "pleasepleaseme"
+  ],
+  "Baby's in Black": [
+   "illfollowthesun",
+   "noreply",
+   "imaloser",
+   "mrmoonlight",
+   "rockandrollmusic"
+  ],
+  "Baby, You're a Rich Man": [
+   "allyouneedislove",
+   "iamthewalrus",
+   "magicalmysterytour",
+   "strawberryfieldsforever",
+   "bluejayway"
+  ],
+  "Back in the U.S.S.R.": [
+   "birthday",
+   "blackbird",
+   "crybabycry",
+   "helterskelter",
+   "honeypie"
+  ],
+  "Bad Boy": [
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse",
+   "aintshesweet"
+  ],
+  "Bad to Me": [
+   "iminlove",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse"
+  ],
+  "Beautiful Dreamer": [
+   "adayinthelife",
+   "aharddaysnight",
+   "atasteofhoney",
+   "allmyloving",
+   "alltogethernow"
+  ],
+  "Because": [
+   "carrythatweight",
+   "sunking",
+   "meanmrmustard",
+   "cometogether",
+   "goldenslumbers"
+  ],
+  "Because I Know You Love Me So": [
+   "fancymychanceswithyou",
+   "childofnature",
+   "takingatriptocarolina",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "Being for the Benefit of Mr. Kite!": [
+   "adayinthelife",
+   "gettingbetter",
+   "goodmorninggoodmorning",
+   "lucyintheskywithdiamonds",
+   "sgtpepperslonelyheartsclubband"
+  ],
+  "Birthday": [
+   "crybabycry",
+   "backintheussr",
+   "blackbird",
+   "dearprudence",
+   "everybodysgotsomethingtohideexceptmeandmymonkey"
+  ],
+  "Blackbird": [
+   "backintheussr",
+   "birthday",
+   "crybabycry",
+   "helterskelter",
+   "honeypie"
+  ],
+  "Blue Jay Way": [
+   "allyouneedislove",
+   "babyyourearichman",
+   "flying",
+   "hellogoodbye",
+   "iamthewalrus"
+  ],
+  "Boys": [
+   "atasteofhoney",
+   "annagotohim",
+   "askmewhy",
+   "babyitsyou",
+   "chains"
+  ],
+  "Bésame Mucho": [
+   "freeasabird",
+   "hallelujahiloveherso",
+   "lendmeyourcomb",
+   "likedreamersdo",
+   "moonlightbay"
+  ],
+  "Can't Buy Me Love": [
+   "ishouldhaveknownbetter",
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because"
+  ],
+  "Carol": [
+   "ashotofrhythmandblues",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby",
+   "ijustdontunderstand"
+  ],
+  "Carry That Weight": [
+   "because",
+   "sunking",
+   "meanmrmustard",
+   "cometogether",
+   "goldenslumbers"
+  ],
+  "Catswalk": [
+   "madman"
+  ],
+  "Cayenne": [
+   "cryforashadow",
+   "aintshesweet",
+   "besamemucho",
+   "freeasabird",
+   "hallelujahiloveherso"
+  ],
+  "Chains": [
+   "lovemedo",
+   "pleasepleaseme",
+   "atasteofhoney",
+   "annagotohim",
+   "askmewhy"
+  ],
+  "Child of Nature": [
+   "becauseiknowyoulovemeso",
+   "fancymychanceswithyou",
+   "takingatriptocarolina",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "Christmas Time (Is Here Again)": [
+   "carrythatweight",
+   "sgtpepperslonelyheartsclubband",
+   "sgtpepperslonelyheartsclubbandreprise",
+   "shout",
+   "because"
+  ],
+  "Circles": [
+   "takegoodcareofmybaby",
+   "goodbye",
+   "heather",
+   "ilostmylittlegirl",
+   "lookingglass"
+  ],
+  "Clarabella": [
+   "donteverchange",
+   "fromustoyou",
+   "hippyhippyshake",
+   "lucille",
+   "oohmysoul"
+  ],
+  "Come Together": [
+   "because",
+   "carrythatweight",
+   "iwantyoushessoheavy",
+   "meanmrmustard",
+   "polythenepam"
+  ],
+  "Come and Get It": [
+   "junk",
+   "ripitupshakerattleandrollbluesuedeshoes",
+   "stepinsidelovelosparanoias",
+   "teddyboy",
+   "allthingsmustpass"
+  ],
+  "Cry Baby Cry": [
+   "birthday",
+   "backintheussr",
+   "blackbird",
+   "dearprudence",
+   "everybodysgotsomethingtohideexceptmeandmymonkey"
+  ],
+  "Cry for a Shadow": [
+   "cayenne",
+   "aintshesweet",
+   "besamemucho",
+   "freeasabird",
+   "hallelujahiloveherso"
+  ],
+  "Crying, Waiting, Hoping": [
+   "donteverchange",
+   "gladallover",
+   "iforgottoremembertoforget",
+   "nothinshakinbuttheleavesonthetrees",
+   "sohowcomenoonelovesme"
+  ],
+  "Day Tripper": [
+   "wecanworkitout",
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because"
+  ],
+  "Dear Prudence": [
+   "birthday",
+   "crybabycry",
+   "everybodysgotsomethingtohideexceptmeandmymonkey",
+   "glassonion",
+   "happinessisawarmgun"
+  ],
+  "Devil in Her Heart": [
+   "rolloverbeethoven",
+   "pleasemrpostman",
+   "allthingsmustpass",
+   "because",
+   "bluejayway"
+  ],
+  "Dig It": [
+   "acrosstheuniverse",
+   "digapony",
+   "ivegotafeeling",
+   "maggiemae",
+   "oneafter"
+  ],
+  "Dig a Pony": [
+   "acrosstheuniverse",
+   "digit",
+   "ivegotafeeling",
+   "maggiemae",
+   "oneafter"
+  ],
+  "Dizzy, Miss Lizzy": [
+   "tellmewhatyousee",
+   "youlikemetoomuch",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues"
+  ],
+  "Do You Want to Know a Secret?": [
+   "chains",
+   "atasteofhoney",
+   "annagotohim",
+   "askmewhy",
+   "babyitsyou"
+  ],
+  "Doctor Robert": [
+   "andyourbirdcansing",
+   "imonlysleeping",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues"
+  ],
+  "Don't Bother Me": [
+   "allivegottodo",
+   "allmyloving",
+   "holdmetight",
+   "iwannabeyourman",
+   "itwontbelong"
+  ],
+  "Don't Ever Change": [
+   "clarabella",
+   "cryingwaitinghoping",
+   "fromustoyou",
+   "gladallover",
+   "hippyhippyshake"
+  ],
+  "Don't Let Me Down": [
+   "theballadofjohnandyoko",
+   "heyjude",
+   "oldbrownshoe",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "Don't Pass Me By": [
+   "goodnight",
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry"
+  ],
+  "Drive My Car": [
+   "nowhereman",
+   "ifineededsomeone",
+   "whatgoeson",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "Eight Days a Week": [
+   "everylittlething",
+   "idontwanttospoiltheparty",
+   "wordsoflove",
+   "kansascityheyheyheyhey",
+   "whatyouredoing"
+  ],
+  "Eleanor Rigby": [
+   "fornoone",
+   "gooddaysunshine",
+   "gottogetyouintomylife",
+   "herethereandeverywhere",
+   "taxman"
+  ],
+  "Etcetera": [
+   "tipofmytongue",
+   "shakininthesixties",
+   "sourmilksea",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "Every Little Thing": [
+   "eightdaysaweek",
+   "idontwanttospoiltheparty",
+   "wordsoflove",
+   "kansascityheyheyheyhey",
+   "whatyouredoing"
+  ],
+  "Everybody's Got Something to Hide Except Me and My Monkey": [
+   "birthday",
+   "crybabycry",
+   "dearprudence",
+   "glassonion",
+   "happinessisawarmgun"
+  ],
+  "Everybody's Trying to Be My Baby": [
+   "babysinblack",
+   "honeydont",
+   "illfollowthesun",
+   "imaloser",
+   "mrmoonlight"
+  ],
+  "Fancy My Chances with You": [
+   "becauseiknowyoulovemeso",
+   "childofnature",
+   "takingatriptocarolina",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "Fixing a Hole": [
+   "adayinthelife",
+   "gettingbetter",
+   "lovelyrita",
+   "sgtpepperslonelyheartsclubband",
+   "sgtpepperslonelyheartsclubbandreprise"
+  ],
+  "Flying": [
+   "jessiesdream",
+   "allyouneedislove",
+   "babyyourearichman",
+   "bluejayway",
+   "hellogoodbye"
+  ],
+  "For No One": [
+   "eleanorrigby",
+   "gooddaysunshine",
+   "gottogetyouintomylife",
+   "herethereandeverywhere",
+   "taxman"
+  ],
+  "For You Blue": [
+   "imemine",
+   "acrosstheuniverse",
+   "digit",
+   "digapony",
+   "getback"
+  ],
+  "Free as a Bird": [
+   "moonlightbay",
+   "shout",
+   "lendmeyourcomb",
+   "aintshesweet",
+   "besamemucho"
+  ],
+  "From Me to You": [
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because",
+   "becauseiknowyoulovemeso"
+  ],
+  "From Us to You": [
+   "someotherguy",
+   "ashotofrhythmandblues",
+   "carol",
+   "clarabella",
+   "donteverchange"
+  ],
+  "Get Back": [
+   "ivegotafeeling",
+   "letitbe",
+   "maggiemae",
+   "oneafter",
+   "thelongandwindingroad"
+  ],
+  "Getting Better": [
+   "adayinthelife",
+   "sgtpepperslonelyheartsclubband",
+   "sgtpepperslonelyheartsclubbandreprise",
+   "shesleavinghome",
+   "withalittlehelpfrommyfriends"
+  ],
+  "Girl": [
+   "imlookingthroughyou",
+   "inmylife",
+   "norwegianwoodthisbirdhasflown",
+   "runforyourlife",
+   "theword"
+  ],
+  "Glad All Over": [
+   "cryingwaitinghoping",
+   "donteverchange",
+   "iforgottoremembertoforget",
+   "nothinshakinbuttheleavesonthetrees",
+   "sohowcomenoonelovesme"
+  ],
+  "Glass Onion": [
+   "birthday",
+   "crybabycry",
+   "dearprudence",
+   "everybodysgotsomethingtohideexceptmeandmymonkey",
+   "happinessisawarmgun"
+  ],
+  "Golden Slumbers": [
+   "because",
+   "carrythatweight",
+   "hermajesty",
+   "maxwellssilverhammer",
+   "meanmrmustard"
+  ],
+  "Good Day Sunshine": [
+   "eleanorrigby",
+   "fornoone",
+   "gottogetyouintomylife",
+   "herethereandeverywhere",
+   "taxman"
+  ],
+  "Good Morning Good Morning": [
+   "adayinthelife",
+   "beingforthebenefitofmrkite",
+   "gettingbetter",
+   "lucyintheskywithdiamonds",
+   "sgtpepperslonelyheartsclubband"
+  ],
+  "Good Night": [
+   "dontpassmeby",
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry"
+  ],
+  "Goodbye": [
+   "heather",
+   "lookingglass",
+   "loveoftheloved",
+   "oneandoneistwo",
+   "septemberintherain"
+  ],
+  "Got to Get You into My Life": [
+   "eleanorrigby",
+   "fornoone",
+   "gooddaysunshine",
+   "herethereandeverywhere",
+   "taxman"
+  ],
+  "Hallelujah, I Love Her So": [
+   "besamemucho",
+   "freeasabird",
+   "lendmeyourcomb",
+   "likedreamersdo",
+   "moonlightbay"
+  ],
+  "Happiness Is a Warm Gun": [
+   "birthday",
+   "crybabycry",
+   "dearprudence",
+   "everybodysgotsomethingtohideexceptmeandmymonkey",
+   "glassonion"
+  ],
+  "Heather": [
+   "goodbye",
+   "lookingglass",
+   "loveoftheloved",
+   "oneandoneistwo",
+   "septemberintherain"
+  ],
+  "Hello Little Girl": [
+   "aintshesweet",
+   "freeasabird",
+   "howdoyoudoit",
+   "inspiteofallthedanger",
+   "leavemykittenalone"
+  ],
+  "Hello, Goodbye": [
+   "magicalmysterytour",
+   "pennylane",
+   "thefoolonthehill",
+   "yourmothershouldknow",
+   "allyouneedislove"
+  ],
+  "Help!": [
+   "tickettoride",
+   "youregoingtolosethatgirl",
+   "youvegottohideyourloveaway",
+   "anothergirl",
+   "ineedyou"
+  ],
+  "Helter Skelter": [
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry",
+   "honeypie"
+  ],
+  "Her Majesty": [
+   "because",
+   "carrythatweight",
+   "goldenslumbers",
+   "maxwellssilverhammer",
+   "meanmrmustard"
+  ],
+  "Here Comes the Sun": [
+   "because",
+   "carrythatweight",
+   "something",
+   "sunking",
+   "cometogether"
+  ],
+  "Here, There and Everywhere": [
+   "eleanorrigby",
+   "fornoone",
+   "gooddaysunshine",
+   "gottogetyouintomylife",
+   "taxman"
+  ],
+  "Hey Bulldog": [
+   "alltogethernow",
+   "itsalltoomuch",
+   "onlyanorthernsong",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "Hey Jude": [
+   "dontletmedown",
+   "theballadofjohnandyoko",
+   "oldbrownshoe",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "Hippy Hippy Shake": [
+   "clarabella",
+   "donteverchange",
+   "fromustoyou",
+   "lucille",
+   "oohmysoul"
+  ],
+  "Hold Me Tight": [
+   "allmyloving",
+   "littlechild",
+   "tilltherewasyou",
+   "allivegottodo",
+   "dontbotherme"
+  ],
+  "Honey Don't": [
+   "babysinblack",
+   "everybodystryingtobemybaby",
+   "illfollowthesun",
+   "imaloser",
+   "mrmoonlight"
+  ],
+  "Honey Pie": [
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry",
+   "helterskelter"
+  ],
+  "How Do You Do It?": [
+   "aintshesweet",
+   "freeasabird",
+   "hellolittlegirl",
+   "inspiteofallthedanger",
+   "leavemykittenalone"
+  ],
+  "I Am the Walrus": [
+   "allyouneedislove",
+   "babyyourearichman",
+   "magicalmysterytour",
+   "strawberryfieldsforever",
+   "bluejayway"
+  ],
+  "I Call Your Name": [
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse",
+   "aintshesweet"
+  ],
+  "I Don't Want to Spoil the Party": [
+   "eightdaysaweek",
+   "everylittlething",
+   "wordsoflove",
+   "kansascityheyheyheyhey",
+   "whatyouredoing"
+  ],
+  "I Feel Fine": [
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse",
+   "aintshesweet"
+  ],
+  "I Forgot to Remember to Forget": [
+   "cryingwaitinghoping",
+   "donteverchange",
+   "gladallover",
+   "nothinshakinbuttheleavesonthetrees",
+   "sohowcomenoonelovesme"
+  ],
+  "I Got a Woman": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igottofindmybaby",
+   "ijustdontunderstand"
+  ],
+  "I Got to Find My Baby": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "ijustdontunderstand"
+  ],
+  "I Just Don't Understand": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby"
+  ],
+  "I Lost My Little Girl": [
+   "watchingrainbows",
+   "circles",
+   "goodbye",
+   "heather",
+   "lookingglass"
+  ],
+  "I Me Mine": [
+   "foryoublue",
+   "acrosstheuniverse",
+   "digit",
+   "digapony",
+   "getback"
+  ],
+  "I Need You": [
+   "anothergirl",
+   "help",
+   "thenightbefore",
+   "tickettoride",
+   "youregoingtolosethatgirl"
+  ],
+  "I Saw Her Standing There": [
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because",
+   "becauseiknowyoulovemeso"
+  ],
+  "I Should Have Known Better": [
+   "cantbuymelove",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse"
+  ],
+  "I Wanna Be Your Man": [
+   "allivegottodo",
+   "allmyloving",
+   "dontbotherme",
+   "holdmetight",
+   "itwontbelong"
+  ],
+  "I Want You (She's So Heavy)": [
+   "because",
+   "carrythatweight",
+   "cometogether",
+   "meanmrmustard",
+   "polythenepam"
+  ],
+  "I Want to Hold Your Hand": [
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because",
+   "becauseiknowyoulovemeso"
+  ],
+  "I Want to Tell You": [
+   "loveyouto",
+   "taxman",
+   "eleanorrigby",
+   "fornoone",
+   "gooddaysunshine"
+  ],
+  "I Will": [
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry",
+   "helterskelter"
+  ],
+  "I'll Be Back": [
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because",
+   "becauseiknowyoulovemeso"
+  ],
+  "I'll Be on My Way": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby"
+  ],
+  "I'll Cry Instead": [
+   "anytimeatall",
+   "ififell",
+   "tellmewhy",
+   "whenigethome",
+   "andiloveher"
+  ],
+  "I'll Follow the Sun": [
+   "babysinblack",
+   "noreply",
+   "imaloser",
+   "mrmoonlight",
+   "rockandrollmusic"
+  ],
+  "I'll Get You": [
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because",
+   "becauseiknowyoulovemeso"
+  ],
+  "I'm Down": [
+   "adayinthelife",
+   "aharddaysnight",
+   "atasteofhoney",
+   "allmyloving",
+   "alltogethernow"
+  ],
+  "I'm Gonna Sit Right Down and Cry (Over You)": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby"
+  ],
+  "I'm Happy Just to Dance with You": [
+   "andiloveher",
+   "anytimeatall",
+   "illcryinstead",
+   "ififell",
+   "tellmewhy"
+  ],
+  "I'm In Love": [
+   "badtome",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse"
+  ],
+  "I'm Looking Through You": [
+   "theword",
+   "wait",
+   "girl",
+   "inmylife",
+   "michelle"
+  ],
+  "I'm Only Sleeping": [
+   "andyourbirdcansing",
+   "doctorrobert",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues"
+  ],
+  "I'm So Tired": [
+   "birthday",
+   "crybabycry",
+   "dearprudence",
+   "everybodysgotsomethingtohideexceptmeandmymonkey",
+   "glassonion"
+  ],
+  "I'm Talking About You": [
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse",
+   "aintshesweet"
+  ],
+  "I'm a Loser": [
+   "babysinblack",
+   "illfollowthesun",
+   "mrmoonlight",
+   "noreply",
+   "rockandrollmusic"
+  ],
+  "I've Got a Feeling": [
+   "maggiemae",
+   "oneafter",
+   "twoofus",
+   "acrosstheuniverse",
+   "digit"
+  ],
+  "I've Just Seen a Face": [
+   "itsonlylove",
+   "adayinthelife",
+   "aharddaysnight",
+   "atasteofhoney",
+   "allmyloving"
+  ],
+  "If I Fell": [
+   "andiloveher",
+   "anytimeatall",
+   "illcryinstead",
+   "tellmewhy",
+   "thingswesaidtoday"
+  ],
+  "If I Needed Someone": [
+   "nowhereman",
+   "drivemycar",
+   "whatgoeson",
+   "allthingsmustpass",
+   "because"
+  ],
+  "If You've Got Trouble": [
+   "baroriginal",
+   "reallove",
+   "thatmeansalot",
+   "actnaturally",
+   "boys"
+  ],
+  "In My Life": [
+   "girl",
+   "imlookingthroughyou",
+   "norwegianwoodthisbirdhasflown",
+   "runforyourlife",
+   "theword"
+  ],
+  "In Spite of All the Danger": [
+   "aintshesweet",
+   "freeasabird",
+   "hellolittlegirl",
+   "howdoyoudoit",
+   "leavemykittenalone"
+  ],
+  "It Won't Be Long": [
+   "allivegottodo",
+   "littlechild",
+   "notasecondtime",
+   "allmyloving",
+   "dontbotherme"
+  ],
+  "It's All Too Much": [
+   "onlyanorthernsong",
+   "alltogethernow",
+   "heybulldog",
+   "allthingsmustpass",
+   "because"
+  ],
+  "It's Only Love": [
+   "ivejustseenaface",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse"
+  ],
+  "Jazz Piano Song": [
+   "adayinthelife",
+   "aharddaysnight",
+   "atasteofhoney",
+   "allmyloving",
+   "alltogethernow"
+  ],
+  "Jessie's Dream": [
+   "flying",
+   "allyouneedislove",
+   "babyyourearichman",
+   "bluejayway",
+   "hellogoodbye"
+  ],
+  "Johnny B. Goode": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby"
+  ],
+  "Julia": [
+   "birthday",
+   "crybabycry",
+   "dearprudence",
+   "everybodysgotsomethingtohideexceptmeandmymonkey",
+   "glassonion"
+  ],
+  "Junk": [
+   "comeandgetit",
+   "ripitupshakerattleandrollbluesuedeshoes",
+   "stepinsidelovelosparanoias",
+   "teddyboy",
+   "allthingsmustpass"
+  ],
+  "Kansas City/Hey-Hey-Hey-Hey!": [
+   "eightdaysaweek",
+   "everylittlething",
+   "idontwanttospoiltheparty",
+   "whatyouredoing",
+   "wordsoflove"
+  ],
+  "Keep Your Hands Off My Baby": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby"
+  ],
+  "Komm, gib mir deine Hand": [
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because",
+   "becauseiknowyoulovemeso"
+  ],
+  "Lady Madonna": [
+   "adayinthelife",
+   "aharddaysnight",
+   "atasteofhoney",
+   "allmyloving",
+   "alltogethernow"
+  ],
+  "Leave My Kitten Alone": [
+   "aintshesweet",
+   "freeasabird",
+   "hellolittlegirl",
+   "howdoyoudoit",
+   "inspiteofallthedanger"
+  ],
+  "Lend Me Your Comb": [
+   "freeasabird",
+   "moonlightbay",
+   "shout",
+   "aintshesweet",
+   "besamemucho"
+  ],
+  "Let It Be": [
+   "getback",
+   "ivegotafeeling",
+   "maggiemae",
+   "oneafter",
+   "thelongandwindingroad"
+  ],
+  "Like Dreamers Do": [
+   "besamemucho",
+   "freeasabird",
+   "hallelujahiloveherso",
+   "lendmeyourcomb",
+   "moonlightbay"
+  ],
+  "Little Child": [
+   "allivegottodo",
+   "allmyloving",
+   "holdmetight",
+   "itwontbelong",
+   "notasecondtime"
+  ],
+  "Lonesome Tears in My Eyes": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby"
+  ],
+  "Long Tall Sally": [
+   "adayinthelife",
+   "aharddaysnight",
+   "atasteofhoney",
+   "allmyloving",
+   "alltogethernow"
+  ],
+  "Long, Long, Long": [
+   "piggies",
+   "savoytruffle",
+   "whilemyguitargentlyweeps",
+   "backintheussr",
+   "birthday"
+  ],
+  "Looking Glass": [
+   "goodbye",
+   "heather",
+   "loveoftheloved",
+   "oneandoneistwo",
+   "septemberintherain"
+  ],
+  "Love Me Do": [
+   "chains",
+   "pleasepleaseme",
+   "atasteofhoney",
+   "annagotohim",
+   "askmewhy"
+  ],
+  "Love You To": [
+   "iwanttotellyou",
+   "taxman",
+   "eleanorrigby",
+   "fornoone",
+   "gooddaysunshine"
+  ],
+  "Love of the Loved": [
+   "goodbye",
+   "heather",
+   "lookingglass",
+   "oneandoneistwo",
+   "septemberintherain"
+  ],
+  "Lovely Rita": [
+   "adayinthelife",
+   "fixingahole",
+   "gettingbetter",
+   "sgtpepperslonelyheartsclubband",
+   "sgtpepperslonelyheartsclubbandreprise"
+  ],
+  "Lucille": [
+   "clarabella",
+   "donteverchange",
+   "fromustoyou",
+   "hippyhippyshake",
+   "oohmysoul"
+  ],
+  "Lucy in the Sky with Diamonds": [
+   "adayinthelife",
+   "beingforthebenefitofmrkite",
+   "gettingbetter",
+   "goodmorninggoodmorning",
+   "sgtpepperslonelyheartsclubband"
+  ],
+  "Madman": [
+   "catswalk",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse"
+  ],
+  "Maggie Mae": [
+   "ivegotafeeling",
+   "oneafter",
+   "twoofus",
+   "acrosstheuniverse",
+   "digit"
+  ],
+  "Magical Mystery Tour": [
+   "allyouneedislove",
+   "babyyourearichman",
+   "hellogoodbye",
+   "iamthewalrus",
+   "pennylane"
+  ],
+  "Mailman, Bring Me No More Blues": [
+   "ripitupshakerattleandrollbluesuedeshoes",
+   "whatsthenewmaryjane",
+   "allthingsmustpass",
+   "comeandgetit",
+   "junk"
+  ],
+  "Martha My Dear": [
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry",
+   "helterskelter"
+  ],
+  "Matchbox": [
+   "slowdown",
+   "actnaturally",
+   "boys",
+   "carrythatweight",
+   "christmastimeishereagain"
+  ],
+  "Maxwell's Silver Hammer": [
+   "because",
+   "carrythatweight",
+   "goldenslumbers",
+   "hermajesty",
+   "meanmrmustard"
+  ],
+  "Mean Mr. Mustard": [
+   "because",
+   "carrythatweight",
+   "sunking",
+   "cometogether",
+   "goldenslumbers"
+  ],
+  "Memphis, Tennessee": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby"
+  ],
+  "Michelle": [
+   "imlookingthroughyou",
+   "theword",
+   "wait",
+   "youwontseeme",
+   "girl"
+  ],
+  "Misery": [
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because",
+   "becauseiknowyoulovemeso"
+  ],
+  "Money (That's What I Want)": [
+   "youvereallygotaholdonme",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse"
+  ],
+  "Moonlight Bay": [
+   "freeasabird",
+   "shout",
+   "lendmeyourcomb",
+   "aintshesweet",
+   "besamemucho"
+  ],
+  "Mother Nature's Son": [
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry",
+   "helterskelter"
+  ],
+  "Mr. Moonlight": [
+   "babysinblack",
+   "illfollowthesun",
+   "imaloser",
+   "noreply",
+   "rockandrollmusic"
+  ],
+  "No Reply": [
+   "babysinblack",
+   "illfollowthesun",
+   "imaloser",
+   "mrmoonlight",
+   "rockandrollmusic"
+  ],
+  "Norwegian Wood (This Bird Has Flown)": [
+   "girl",
+   "imlookingthroughyou",
+   "inmylife",
+   "runforyourlife",
+   "theword"
+  ],
+  "Not Guilty": [
+   "allthingsmustpass",
+   "comeandgetit",
+   "junk",
+   "mailmanbringmenomoreblues",
+   "ripitupshakerattleandrollbluesuedeshoes"
+  ],
+  "Not a Second Time": [
+   "allivegottodo",
+   "itwontbelong",
+   "littlechild",
+   "allmyloving",
+   "dontbotherme"
+  ],
+  "Nothin' Shakin' (But the Leaves on the Trees)": [
+   "cryingwaitinghoping",
+   "donteverchange",
+   "gladallover",
+   "iforgottoremembertoforget",
+   "sohowcomenoonelovesme"
+  ],
+  "Nowhere Man": [
+   "drivemycar",
+   "ifineededsomeone",
+   "whatgoeson",
+   "because",
+   "carrythatweight"
+  ],
+  "Ob-La-Di, Ob-La-Da": [
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry",
+   "helterskelter"
+  ],
+  "Octopus's Garden": [
+   "carrythatweight",
+   "because",
+   "cometogether",
+   "goldenslumbers",
+   "hermajesty"
+  ],
+  "Oh! Darling": [
+   "because",
+   "carrythatweight",
+   "goldenslumbers",
+   "hermajesty",
+   "maxwellssilverhammer"
+  ],
+  "Old Brown Shoe": [
+   "dontletmedown",
+   "heyjude",
+   "theballadofjohnandyoko",
+   "allthingsmustpass",
+   "because"
+  ],
+  "One After 909": [
+   "ivegotafeeling",
+   "maggiemae",
+   "twoofus",
+   "acrosstheuniverse",
+   "digit"
+  ],
+  "One and One Is Two": [
+   "goodbye",
+   "heather",
+   "lookingglass",
+   "loveoftheloved",
+   "septemberintherain"
+  ],
+  "Only a Northern Song": [
+   "itsalltoomuch",
+   "alltogethernow",
+   "heybulldog",
+   "allthingsmustpass",
+   "because"
+  ],
+  "Ooh! My Soul": [
+   "clarabella",
+   "donteverchange",
+   "fromustoyou",
+   "hippyhippyshake",
+   "lucille"
+  ],
+  "P.S. I Love You": [
+   "atasteofhoney",
+   "chains",
+   "lovemedo",
+   "pleasepleaseme",
+   "annagotohim"
+  ],
+  "Paperback Writer": [
+   "adayinthelife",
+   "aharddaysnight",
+   "atasteofhoney",
+   "allmyloving",
+   "alltogethernow"
+  ],
+  "Penny Lane": [
+   "hellogoodbye",
+   "magicalmysterytour",
+   "thefoolonthehill",
+   "yourmothershouldknow",
+   "allyouneedislove"
+  ],
+  "Piggies": [
+   "longlonglong",
+   "savoytruffle",
+   "whilemyguitargentlyweeps",
+   "backintheussr",
+   "birthday"
+  ],
+  "Please Mr. Postman": [
+   "devilinherheart",
+   "rolloverbeethoven",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues"
+  ],
+  "Please Please Me": [
+   "chains",
+   "lovemedo",
+   "atasteofhoney",
+   "annagotohim",
+   "askmewhy"
+  ],
+  "Polythene Pam": [
+   "because",
+   "carrythatweight",
+   "cometogether",
+   "iwantyoushessoheavy",
+   "meanmrmustard"
+  ],
+  "Rain": [
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse",
+   "aintshesweet"
+  ],
+  "Real Love": [
+   "baroriginal",
+   "ifyouvegottrouble",
+   "thatmeansalot",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "Revolution 9": [
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry",
+   "dearprudence"
+  ],
+  "Rip It Up / Shake, Rattle, and Roll / Blue Suede Shoes": [
+   "comeandgetit",
+   "junk",
+   "mailmanbringmenomoreblues",
+   "stepinsidelovelosparanoias",
+   "teddyboy"
+  ],
+  "Rock and Roll Music": [
+   "babysinblack",
+   "illfollowthesun",
+   "imaloser",
+   "mrmoonlight",
+   "noreply"
+  ],
+  "Rocky Raccoon": [
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry",
+   "helterskelter"
+  ],
+  "Roll Over Beethoven": [
+   "devilinherheart",
+   "pleasemrpostman",
+   "allthingsmustpass",
+   "because",
+   "bluejayway"
+  ],
+  "Run for Your Life": [
+   "girl",
+   "imlookingthroughyou",
+   "inmylife",
+   "norwegianwoodthisbirdhasflown",
+   "theword"
+  ],
+  "Savoy Truffle": [
+   "longlonglong",
+   "piggies",
+   "whilemyguitargentlyweeps",
+   "backintheussr",
+   "birthday"
+  ],
+  "Searchin'": [
+   "besamemucho",
+   "freeasabird",
+   "hallelujahiloveherso",
+   "lendmeyourcomb",
+   "likedreamersdo"
+  ],
+  "September in the Rain": [
+   "goodbye",
+   "heather",
+   "lookingglass",
+   "loveoftheloved",
+   "oneandoneistwo"
+  ],
+  "Sexy Sadie": [
+   "birthday",
+   "crybabycry",
+   "dearprudence",
+   "everybodysgotsomethingtohideexceptmeandmymonkey",
+   "glassonion"
+  ],
+  "Sgt. Pepper's Lonely Hearts Club Band": [
+   "sgtpepperslonelyheartsclubbandreprise",
+   "withalittlehelpfrommyfriends",
+   "adayinthelife",
+   "gettingbetter",
+   "shesleavinghome"
+  ],
+  "Sgt. Pepper's Lonely Hearts Club Band (Reprise)": [
+   "sgtpepperslonelyheartsclubband",
+   "withalittlehelpfrommyfriends",
+   "adayinthelife",
+   "gettingbetter",
+   "shesleavinghome"
+  ],
+  "Shakin' in the Sixties": [
+   "tipofmytongue",
+   "etcetera",
+   "sourmilksea",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "She Came in Through the Bathroom Window": [
+   "because",
+   "carrythatweight",
+   "goldenslumbers",
+   "hermajesty",
+   "maxwellssilverhammer"
+  ],
+  "She Loves You": [
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because",
+   "becauseiknowyoulovemeso"
+  ],
+  "She Said She Said": [
+   "taxman",
+   "tomorrowneverknows",
+   "eleanorrigby",
+   "fornoone",
+   "gooddaysunshine"
+  ],
+  "She's Leaving Home": [
+   "adayinthelife",
+   "gettingbetter",
+   "sgtpepperslonelyheartsclubband",
+   "sgtpepperslonelyheartsclubbandreprise",
+   "withalittlehelpfrommyfriends"
+  ],
+  "She's a Woman": [
+   "adayinthelife",
+   "aharddaysnight",
+   "atasteofhoney",
+   "allmyloving",
+   "alltogethernow"
+  ],
+  "Shout": [
+   "freeasabird",
+   "moonlightbay",
+   "lendmeyourcomb",
+   "aintshesweet",
+   "besamemucho"
+  ],
+  "Sie liebt dich": [
+   "youknowmynamelookupthenumber",
+   "theinnerlight",
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack"
+  ],
+  "Slow Down": [
+   "matchbox",
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse"
+  ],
+  "So How Come (No One Loves Me)": [
+   "cryingwaitinghoping",
+   "donteverchange",
+   "gladallover",
+   "iforgottoremembertoforget",
+   "nothinshakinbuttheleavesonthetrees"
+  ],
+  "Soldier of Love (Lay Down Your Arms)": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby"
+  ],
+  "Some Other Guy": [
+   "fromustoyou",
+   "ashotofrhythmandblues",
+   "carol",
+   "clarabella",
+   "donteverchange"
+  ],
+  "Something": [
+   "because",
+   "carrythatweight",
+   "herecomesthesun",
+   "sunking",
+   "cometogether"
+  ],
+  "Sour Milk Sea": [
+   "etcetera",
+   "shakininthesixties",
+   "tipofmytongue",
+   "allthingsmustpass",
+   "because"
+  ],
+  "Step Inside Love/Los Paranoias": [
+   "comeandgetit",
+   "junk",
+   "ripitupshakerattleandrollbluesuedeshoes",
+   "teddyboy",
+   "allthingsmustpass"
+  ],
+  "Strawberry Fields Forever": [
+   "allyouneedislove",
+   "babyyourearichman",
+   "iamthewalrus",
+   "magicalmysterytour",
+   "bluejayway"
+  ],
+  "Sun King": [
+   "because",
+   "carrythatweight",
+   "meanmrmustard",
+   "cometogether",
+   "goldenslumbers"
+  ],
+  "Sure to Fall (in Love with You)": [
+   "clarabella",
+   "donteverchange",
+   "fromustoyou",
+   "hippyhippyshake",
+   "lucille"
+  ],
+  "Sweet Little Sixteen": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby"
+  ],
+  "Take Good Care of My Baby": [
+   "circles",
+   "goodbye",
+   "heather",
+   "ilostmylittlegirl",
+   "lookingglass"
+  ],
+  "Taking a Trip to Carolina": [
+   "becauseiknowyoulovemeso",
+   "childofnature",
+   "fancymychanceswithyou",
+   "actnaturally",
+   "boys"
+  ],
+  "Taxman": [
+   "eleanorrigby",
+   "fornoone",
+   "gooddaysunshine",
+   "gottogetyouintomylife",
+   "herethereandeverywhere"
+  ],
+  "Teddy Boy": [
+   "comeandgetit",
+   "junk",
+   "ripitupshakerattleandrollbluesuedeshoes",
+   "stepinsidelovelosparanoias",
+   "allthingsmustpass"
+  ],
+  "Tell Me What You See": [
+   "dizzymisslizzy",
+   "youlikemetoomuch",
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack"
+  ],
+  "Tell Me Why": [
+   "anytimeatall",
+   "illcryinstead",
+   "ififell",
+   "whenigethome",
+   "andiloveher"
+  ],
+  "Thank You Girl": [
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because",
+   "becauseiknowyoulovemeso"
+  ],
+  "That Means a Lot": [
+   "baroriginal",
+   "ifyouvegottrouble",
+   "reallove",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "That'll Be the Day": [
+   "aintshesweet",
+   "freeasabird",
+   "hellolittlegirl",
+   "howdoyoudoit",
+   "inspiteofallthedanger"
+  ],
+  "That’s All Right (Mama)": [
+   "clarabella",
+   "donteverchange",
+   "fromustoyou",
+   "hippyhippyshake",
+   "lucille"
+  ],
+  "The Ballad of John and Yoko": [
+   "dontletmedown",
+   "heyjude",
+   "oldbrownshoe",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "The Continuing Story of Bungalow Bill": [
+   "birthday",
+   "crybabycry",
+   "dearprudence",
+   "everybodysgotsomethingtohideexceptmeandmymonkey",
+   "glassonion"
+  ],
+  "The End": [
+   "because",
+   "carrythatweight",
+   "goldenslumbers",
+   "hermajesty",
+   "maxwellssilverhammer"
+  ],
+  "The Fool on the Hill": [
+   "hellogoodbye",
+   "magicalmysterytour",
+   "pennylane",
+   "yourmothershouldknow",
+   "allyouneedislove"
+  ],
+  "The Honeymoon Song": [
+   "clarabella",
+   "donteverchange",
+   "fromustoyou",
+   "hippyhippyshake",
+   "lucille"
+  ],
+  "The Inner Light": [
+   "sieliebtdich",
+   "youknowmynamelookupthenumber",
+   "allthingsmustpass",
+   "because",
+   "bluejayway"
+  ],
+  "The Long and Winding Road": [
+   "getback",
+   "ivegotafeeling",
+   "letitbe",
+   "maggiemae",
+   "oneafter"
+  ],
+  "The Night Before": [
+   "anothergirl",
+   "tickettoride",
+   "help",
+   "ineedyou",
+   "youregoingtolosethatgirl"
+  ],
+  "The Sheik of Araby": [
+   "freeasabird",
+   "moonlightbay",
+   "shout",
+   "threecoolcats",
+   "youknowwhattodo"
+  ],
+  "The Word": [
+   "imlookingthroughyou",
+   "wait",
+   "girl",
+   "inmylife",
+   "michelle"
+  ],
+  "There's a Place": [
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because",
+   "becauseiknowyoulovemeso"
+  ],
+  "Things We Said Today": [
+   "andiloveher",
+   "ififell",
+   "anytimeatall",
+   "illcryinstead",
+   "imhappyjusttodancewithyou"
+  ],
+  "Think for Yourself": [
+   "theword",
+   "girl",
+   "imlookingthroughyou",
+   "inmylife",
+   "michelle"
+  ],
+  "This Boy": [
+   "because",
+   "carrythatweight",
+   "chains",
+   "christmastimeishereagain",
+   "freeasabird"
+  ],
+  "Three Cool Cats": [
+   "freeasabird",
+   "moonlightbay",
+   "shout",
+   "thesheikofaraby",
+   "youknowwhattodo"
+  ],
+  "Ticket to Ride": [
+   "anothergirl",
+   "help",
+   "thenightbefore",
+   "youregoingtolosethatgirl",
+   "youvegottohideyourloveaway"
+  ],
+  "Till There Was You": [
+   "allmyloving",
+   "holdmetight",
+   "littlechild",
+   "allivegottodo",
+   "dontbotherme"
+  ],
+  "Tip of My Tongue": [
+   "etcetera",
+   "shakininthesixties",
+   "sourmilksea",
+   "adayinthelife",
+   "aharddaysnight"
+  ],
+  "To Know Her is to Love Her": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby"
+  ],
+  "Tomorrow Never Knows": [
+   "shesaidshesaid",
+   "taxman",
+   "eleanorrigby",
+   "fornoone",
+   "gooddaysunshine"
+  ],
+  "Too Much Monkey Business": [
+   "ashotofrhythmandblues",
+   "carol",
+   "fromustoyou",
+   "igotawoman",
+   "igottofindmybaby"
+  ],
+  "Twist and Shout": [
+   "annagotohim",
+   "askmewhy",
+   "babyitsyou",
+   "chains",
+   "lovemedo"
+  ],
+  "Two of Us": [
+   "ivegotafeeling",
+   "maggiemae",
+   "oneafter",
+   "acrosstheuniverse",
+   "digit"
+  ],
+  "Wait": [
+   "imlookingthroughyou",
+   "theword",
+   "girl",
+   "inmylife",
+   "michelle"
+  ],
+  "Watching Rainbows": [
+   "ilostmylittlegirl",
+   "circles",
+   "goodbye",
+   "heather",
+   "lookingglass"
+  ],
+  "We Can Work It Out": [
+   "daytripper",
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack",
+   "because"
+  ],
+  "What Goes On": [
+   "drivemycar",
+   "ifineededsomeone",
+   "nowhereman",
+   "actnaturally",
+   "boys"
+  ],
+  "What You're Doing": [
+   "eightdaysaweek",
+   "everylittlething",
+   "idontwanttospoiltheparty",
+   "kansascityheyheyheyhey",
+   "wordsoflove"
+  ],
+  "What's The New Mary Jane": [
+   "mailmanbringmenomoreblues",
+   "ripitupshakerattleandrollbluesuedeshoes",
+   "allthingsmustpass",
+   "comeandgetit",
+   "junk"
+  ],
+  "When I Get Home": [
+   "anytimeatall",
+   "illcryinstead",
+   "ififell",
+   "tellmewhy",
+   "andiloveher"
+  ],
+  "When I'm Sixty-Four": [
+   "adayinthelife",
+   "fixingahole",
+   "gettingbetter",
+   "lovelyrita",
+   "sgtpepperslonelyheartsclubband"
+  ],
+  "While My Guitar Gently Weeps": [
+   "longlonglong",
+   "piggies",
+   "savoytruffle",
+   "backintheussr",
+   "birthday"
+  ],
+  "Why Don't We Do It in the Road?": [
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry",
+   "helterskelter"
+  ],
+  "Wild Honey Pie": [
+   "backintheussr",
+   "birthday",
+   "blackbird",
+   "crybabycry",
+   "helterskelter"
+  ],
+  "With a Little Help from My Friends": [
+   "sgtpepperslonelyheartsclubband",
+   "sgtpepperslonelyheartsclubbandreprise",
+   "adayinthelife",
+   "gettingbetter",
+   "shesleavinghome"
+  ],
+  "Within You Without You": [
+   "adayinthelife",
+   "beingforthebenefitofmrkite",
+   "gettingbetter",
+   "goodmorninggoodmorning",
+   "lucyintheskywithdiamonds"
+  ],
+  "Woman": [
+   "adayinthelife",
+   "aharddaysnight",
+   "atasteofhoney",
+   "allmyloving",
+   "alltogethernow"
+  ],
+  "Words of Love": [
+   "eightdaysaweek",
+   "everylittlething",
+   "idontwanttospoiltheparty",
+   "kansascityheyheyheyhey",
+   "whatyouredoing"
+  ],
+  "Yellow Submarine": [
+   "eleanorrigby",
+   "fornoone",
+   "gooddaysunshine",
+   "gottogetyouintomylife",
+   "herethereandeverywhere"
+  ],
+  "Yer Blues": [
+   "birthday",
+   "crybabycry",
+   "dearprudence",
+   "everybodysgotsomethingtohideexceptmeandmymonkey",
+   "glassonion"
+  ],
+  "Yes It Is": [
+   "because",
+   "carrythatweight",
+   "chains",
+   "christmastimeishereagain",
+   "freeasabird"
+  ],
+  "Yesterday": [
+   "actnaturally",
+   "adayinthelife",
+   "aharddaysnight",
+   "atasteofhoney",
+   "allmyloving"
+  ],
+  "You Can't Do That": [
+   "adayinthelife",
+   "aharddaysnight",
+   "ashotofrhythmandblues",
+   "acrosstheuniverse",
+   "aintshesweet"
+  ],
+  "You Know My Name (Look Up the Number)": [
+   "sieliebtdich",
+   "theinnerlight",
+   "adayinthelife",
+   "aharddaysnight",
+   "babysinblack"
+  ],
+  "You Know What to Do": [
+   "freeasabird",
+   "moonlightbay",
+   "shout",
+   "thesheikofaraby",
+   "threecoolcats"
+  ],
+  "You Like Me Too Much": [
+   "dizzymisslizzy",
+   "tellmewhatyousee",
+   "allthingsmustpass",
+   "because",
+   "bluejayway"
+  ],
+  "You Never Give Me Your Money": [
+   "because",
+   "carrythatweight",
+   "goldenslumbers",
+   "hermajesty",
+   "maxwellssilverhammer"
+  ],
+  "You Won't See Me": [
+   "imlookingthroughyou",
+   "michelle",
+   "theword",
+   "wait",
+   "girl"
+  ],
+  "You'll Be Mine": [
+   "besamemucho",
+   "freeasabird",
+   "hallelujahiloveherso",
+   "lendmeyourcomb",
+   "likedreamersdo"
+  ],
+  "You're Going to Lose That Girl": [
+   "help",
+   "tickettoride",
+   "youvegottohideyourloveaway",
+   "anothergirl",
+   "ineedyou"
+  ],
+  "You've Got to Hide Your Love Away": [
+   "help",
+   "tickettoride",
+   "youregoingtolosethatgirl",
+   "anothergirl",
+   "ineedyou"
+  ],
+  "You've Really Got a Hold on Me": [
+   "moneythatswhatiwant",
+   "because",
+   "carrythatweight",
+   "chains",
+   "christmastimeishereagain"
+  ],
+  "Young Blood": [
+   "cryingwaitinghoping",
+   "donteverchange",
+   "gladallover",
+   "iforgottoremembertoforget",
+   "nothinshakinbuttheleavesonthetrees"
+  ],
+  "Your Mother Should Know": [
+   "hellogoodbye",
+   "magicalmysterytour",
+   "pennylane",
+   "thefoolonthehill",
+   "allyouneedislove"
+  ]
+ },
+ "similar": {
+  "acrosstheuniverse": [
+   "thenightbefore",
+   "herecomesthesun",
+   "whatsthenewmaryjane",
+   "backintheussr",
+   "herethereandeverywhere"
+  ],
+  "actnaturally": [
+   "anytimeatall",
+   "clarabella",
+   "catswalk",
+   "backintheussr",
+   "childofnature"
+  ],
+  "adayinthelife": [
+   "inmylife",
+   "aintshesweet",
+   "daytripper",
+   "shakininthesixties",
+   "anothergirl"
+  ],
+  "aharddaysnight": [
+   "goodnight",
+   "carrythatweight",
+   "gooddaysunshine",
+   "holdmetight",
+   "mrmoonlight"
+  ],
+  "aintshesweet": [
+   "adayinthelife",
+   "backintheussr",
+   "shakininthesixties",
+   "iwantyoushessoheavy",
+   "shesawoman"
+  ],
+  "allivegottodo": [
+   "loveyouto",
+   "ifyouvegottrouble",
+   "loveoftheloved",
+   "youvereallygotaholdonme",
+   "igottofindmybaby"
+  ],
+  "allmyloving": [
+   "flying",
+   "reallove",
+   "allyouneedislove",
+   "icallyourname",
+   "whatyouredoing"
+  ],
+  "allthingsmustpass": [
+   "watchingrainbows",
+   "lookingglass",
+   "thingswesaidtoday",
+   "illcryinstead",
+   "meanmrmustard"
+  ],
+  "alltogethernow": [
+   "cometogether",
+   "andiloveher",
+   "illgetyou",
+   "loveoftheloved",
+   "thatllbetheday"
+  ],
+  "allyouneedislove": [
+   "andiloveher",
+   "icallyourname",
+   "allmyloving",
+   "wordsoflove",
+   "hallelujahiloveherso"
+  ],
+  "andiloveher": [
+   "gladallover",
+   "allyouneedislove",
+   "hallelujahiloveherso",
+   "toknowheristoloveher",
+   "alltogethernow"
+  ],
+  "andyourbirdcansing": [
+   "whatyouredoing",
+   "babyyourearichman",
+   "onlyanorthernsong",
+   "iwanttoholdyourhand",
+   "iwannabeyourman"
+  ],
+  "annagotohim": [
+   "anothergirl",
+   "notasecondtime",
+   "igotawoman",
+   "iwannabeyourman",
+   "badtome"
+  ],
+  "anothergirl": [
+   "notguilty",
+   "onlyanorthernsong",
+   "heather",
+   "andiloveher",
+   "annagotohim"
+  ],
+  "anytimeatall": [
+   "actnaturally",
+   "cantbuymelove",
+   "thatmeansalot",
+   "iwanttotellyou",
+   "daytripper"
+  ],
+  "ashotofrhythmandblues": [
+   "atasteofhoney",
+   "tipofmytongue",
+   "foryoublue",
+   "inspiteofallthedanger",
+   "sohowcomenoonelovesme"
+  ],
+  "askmewhy": [
+   "tellmewhy",
+   "dontpassmeby",
+   "someotherguy",
+   "atasteofhoney",
+   "something"
+  ],
+  "atasteofhoney": [
+   "notasecondtime",
+   "whatsthenewmaryjane",
+   "thehoneymoonsong",
+   "someotherguy",
+   "askmewhy"
+  ],
+  "babyitsyou": [
+   "illgetyou",
+   "babyyourearichman",
+   "badboy",
+   "crybabycry",
+   "badtome"
+  ],
+  "babysinblack": [
+   "blackbird",
+   "illbeback",
+   "babyitsyou",
+   "crybabycry",
+   "badboy"
+  ],
+  "babyyourearichman": [
+   "iwannabeyourman",
+   "babyitsyou",
+   "whatyouredoing",
+   "andyourbirdcansing",
+   "searchin"
+  ],
+  "backintheussr": [
+   "shakininthesixties",
+   "aintshesweet",
+   "blackbird",
+   "anothergirl",
+   "heather"
+  ],
+  "badboy": [
+   "badtome",
+   "boys",
+   "teddyboy",
+   "babyitsyou",
+   "crybabycry"
+  ],
+  "badtome": [
+   "badboy",
+   "notasecondtime",
+   "babyitsyou",
+   "whatgoeson",
+   "madman"
+  ],
+  "baroriginal": [
+   "anothergirl",
+   "carol",
+   "fixingahole",
+   "babysinblack",
+   "eleanorrigby"
+  ],
+  "beautifuldreamer": [
+   "likedreamersdo",
+   "becauseiknowyoulovemeso",
+   "jessiesdream",
+   "pleasepleaseme",
+   "strawberryfieldsforever"
+  ],
+  "because": [
+   "becauseiknowyoulovemeso",
+   "chains",
+   "besamemucho",
+   "beautifuldreamer",
+   "tellmewhatyousee"
+  ],
+  "becauseiknowyoulovemeso": [
+   "beautifuldreamer",
+   "shelovesyou",
+   "because",
+   "hallelujahiloveherso",
+   "toknowheristoloveher"
+  ],
+  "beingforthebenefitofmrkite": [
+   "iforgottoremembertoforget",
+   "gettingbetter",
+   "thenightbefore",
+   "aintshesweet",
+   "theinnerlight"
+  ],
+  "besamemucho": [
+   "youlikemetoomuch",
+   "itsalltoomuch",
+   "badtome",
+   "because",
+   "askmewhy"
+  ],
+  "birthday": [
+   "marthamydear",
+   "blackbird",
+   "yesterday",
+   "eightdaysaweek",
+   "thatllbetheday"
+  ],
+  "blackbird": [
+   "backintheussr",
+   "freeasabird",
+   "getback",
+   "babysinblack",
+   "birthday"
+  ],
+  "bluejayway": [
+   "illbeonmyway",
+   "yerblues",
+   "foryoublue",
+   "lovelyrita",
+   "shesawoman"
+  ],
+  "boys": [
+   "badboy",
+   "thisboy",
+   "teddyboy",
+   "oohmysoul",
+   "babysinblack"
+  ],
+  "cantbuymelove": [
+   "andiloveher",
+   "cayenne",
+   "itsonlylove",
+   "allyouneedislove",
+   "anytimeatall"
+  ],
+  "carol": [
+   "clarabella",
+   "baroriginal",
+   "circles",
+   "rockandrollmusic",
+   "actnaturally"
+  ],
+  "carrythatweight": [
+   "thatsallrightmama",
+   "theinnerlight",
+   "aharddaysnight",
+   "thenightbefore",
+   "moneythatswhatiwant"
+  ],
+  "catswalk": [
+   "actnaturally",
+   "iamthewalrus",
+   "thatmeansalot",
+   "carol",
+   "chains"
+  ],
+  "cayenne": [
+   "cantbuymelove",
+   "icallyourname",
+   "pennylane",
+   "leavemykittenalone",
+   "chains"
+  ],
+  "chains": [
+   "rain",
+   "searchin",
+   "watchingrainbows",
+   "ohdarling",
+   "because"
+  ],
+  "childofnature": [
+   "mothernaturesson",
+   "actnaturally",
+   "wildhoneypie",
+   "tipofmytongue",
+   "honeydont"
+  ],
+  "christmastimeishereagain": [
+   "isawherstandingthere",
+   "septemberintherain",
+   "toknowheristoloveher",
+   "acrosstheuniverse",
+   "ilostmylittlegirl"
+  ],
+  "circles": [
+   "lucille",
+   "girl",
+   "michelle",
+   "yerblues",
+   "carol"
+  ],
+  "clarabella": [
+   "actnaturally",
+   "carol",
+   "gladallover",
+   "marthamydear",
+   "obladioblada"
+  ],
+  "comeandgetit": [
+   "oneandoneistwo",
+   "cometogether",
+   "holdmetight",
+   "something",
+   "digit"
+  ],
+  "cometogether": [
+   "someotherguy",
+   "alltogethernow",
+   "etcetera",
+   "comeandgetit",
+   "dontbotherme"
+  ],
+  "crybabycry": [
+   "babyitsyou",
+   "badboy",
+   "takegoodcareofmybaby",
+   "babysinblack",
+   "clarabella"
+  ],
+  "cryforashadow": [
+   "freeasabird",
+   "yourmothershouldknow",
+   "illcryinstead",
+   "carrythatweight",
+   "keepyourhandsoffmybaby"
+  ],
+  "cryingwaitinghoping": [
+   "lucyintheskywithdiamonds",
+   "watchingrainbows",
+   "longlonglong",
+   "thingswesaidtoday",
+   "fixingahole"
+  ],
+  "daytripper": [
+   "adayinthelife",
+   "drivemycar",
+   "heather",
+   "anytimeatall",
+   "doctorrobert"
+  ],
+  "dearprudence": [
+   "ifineededsomeone",
+   "ivejustseenaface",
+   "because",
+   "cayenne",
+   "heyjude"
+  ],
+  "devilinherheart": [
+   "whydontwedoitintheroad",
+   "donteverchange",
+   "likedreamersdo",
+   "nowhereman",
+   "tilltherewasyou"
+  ],
+  "digapony": [
+   "digit",
+   "glassonion",
+   "igotawoman",
+   "badboy",
+   "imdown"
+  ],
+  "digit": [
+   "goodnight",
+   "holdmetight",
+   "piggies",
+   "comeandgetit",
+   "digapony"
+  ],
+  "dizzymisslizzy": [
+   "misery",
+   "iminlove",
+   "inmylife",
+   "imonlysleeping",
+   "imsotired"
+  ],
+  "doctorrobert": [
+   "dontbotherme",
+   "tomorrowneverknows",
+   "octopussgarden",
+   "daytripper",
+   "foryoublue"
+  ],
+  "dontbotherme": [
+   "cometogether",
+   "dontletmedown",
+   "nowhereman",
+   "donteverchange",
+   "whydontwedoitintheroad"
+  ],
+  "donteverchange": [
+   "dontbotherme",
+   "dontletmedown",
+   "ijustdontunderstand",
+   "devilinherheart",
+   "everylittlething"
+  ],
+  "dontletmedown": [
+   "lovemedo",
+   "dontbotherme",
+   "imdown",
+   "donteverchange",
+   "dontpassmeby"
+  ],
+  "dontpassmeby": [
+   "askmewhy",
+   "dontbotherme",
+   "youwontseeme",
+   "dontletmedown",
+   "longtallsally"
+  ],
+  "doyouwanttoknowasecret": [
+   "youwontseeme",
+   "youknowwhattodo",
+   "youcantdothat",
+   "idontwanttospoiltheparty",
+   "toknowheristoloveher"
+  ],
+  "drivemycar": [
+   "daytripper",
+   "andiloveher",
+   "illbeonmyway",
+   "imaloser",
+   "younevergivemeyourmoney"
+  ],
+  "eightdaysaweek": [
+   "thenightbefore",
+   "moonlightbay",
+   "birthday",
+   "sexysadie",
+   "yesterday"
+  ],
+  "eleanorrigby": [
+   "hellogoodbye",
+   "onlyanorthernsong",
+   "andyourbirdcansing",
+   "wecanworkitout",
+   "shesleavinghome"
+  ],
+  "etcetera": [
+   "cometogether",
+   "yesterday",
+   "gettingbetter",
+   "septemberintherain",
+   "heather"
+  ],
+  "everybodysgotsomethingtohideexceptmeandmymonkey": [
+   "everybodystryingtobemybaby",
+   "youvegottohideyourloveaway",
+   "lonesometearsinmyeyes",
+   "everylittlething",
+   "younevergivemeyourmoney"
+  ],
+  "everybodystryingtobemybaby": [
+   "everybodysgotsomethingtohideexceptmeandmymonkey",
+   "keepyourhandsoffmybaby",
+   "takegoodcareofmybaby",
+   "igottofindmybaby",
+   "everylittlething"
+  ],
+  "everylittlething": [
+   "littlechild",
+   "sweetlittlesixteen",
+   "leavemykittenalone",
+   "hellolittlegirl",
+   "ilostmylittlegirl"
+  ],
+  "fancymychanceswithyou": [
+   "imhappyjusttodancewithyou",
+   "suretofallinlovewithyou",
+   "magicalmysterytour",
+   "babyitsyou",
+   "lucyintheskywithdiamonds"
+  ],
+  "fixingahole": [
+   "iminlove",
+   "flying",
+   "shesleavinghome",
+   "baroriginal",
+   "imemine"
+  ],
+  "flying": [
+   "allmyloving",
+   "ifeelfine",
+   "ohdarling",
+   "imonlysleeping",
+   "ivegotafeeling"
+  ],
+  "fornoone": [
+   "foryoublue",
+   "wordsoflove",
+   "ifineededsomeone",
+   "johnnybgoode",
+   "oldbrownshoe"
+  ],
+  "foryoublue": [
+   "runforyourlife",
+   "fornoone",
+   "yerblues",
+   "thinkforyourself",
+   "oohmysoul"
+  ],
+  "freeasabird": [
+   "blackbird",
+   "cryforashadow",
+   "meanmrmustard",
+   "birthday",
+   "threecoolcats"
+  ],
+  "frommetoyou": [
+   "fromustoyou",
+   "youlikemetoomuch",
+   "illgetyou",
+   "loveyouto",
+   "oohmysoul"
+  ],
+  "fromustoyou": [
+   "frommetoyou",
+   "oohmysoul",
+   "runforyourlife",
+   "foryoublue",
+   "hermajesty"
+  ],
+  "getback": [
+   "illbeback",
+   "blackbird",
+   "paperbackwriter",
+   "letitbe",
+   "babysinblack"
+  ],
+  "gettingbetter": [
+   "etcetera",
+   "letitbe",
+   "isawherstandingthere",
+   "oneafter",
+   "beingforthebenefitofmrkite"
+  ],
+  "girl": [
+   "circles",
+   "anothergirl",
+   "thankyougirl",
+   "notguilty",
+   "carol"
+  ],
+  "gladallover": [
+   "andiloveher",
+   "reallove",
+   "imaloser",
+   "alltogethernow",
+   "clarabella"
+  ],
+  "glassonion": [
+   "ladymadonna",
+   "sunking",
+   "longlonglong",
+   "lookingglass",
+   "digapony"
+  ],
+  "goldenslumbers": [
+   "goodbye",
+   "oldbrownshoe",
+   "gettingbetter",
+   "ishouldhaveknownbetter",
+   "lendmeyourcomb"
+  ],
+  "goodbye": [
+   "hellogoodbye",
+   "gooddaysunshine",
+   "johnnybgoode",
+   "igottofindmybaby",
+   "goodnight"
+  ],
+  "gooddaysunshine": [
+   "goodbye",
+   "goodnight",
+   "aharddaysnight",
+   "cayenne",
+   "sunking"
+  ],
+  "goodmorninggoodmorning": [
+   "goodnight",
+   "gottogetyouintomylife",
+   "howdoyoudoit",
+   "fornoone",
+   "iwanttoholdyourhand"
+  ],
+  "goodnight": [
+   "mrmoonlight",
+   "moonlightbay",
+   "holdmetight",
+   "digit",
+   "aharddaysnight"
+  ],
+  "gottogetyouintomylife": [
+   "inmylife",
+   "igottofindmybaby",
+   "adayinthelife",
+   "youvegottohideyourloveaway",
+   "loveyouto"
+  ],
+  "hallelujahiloveherso": [
+   "andiloveher",
+   "shelovesyou",
+   "allyouneedislove",
+   "maxwellssilverhammer",
+   "toknowheristoloveher"
+  ],
+  "happinessisawarmgun": [
+   "jessiesdream",
+   "backintheussr",
+   "shakininthesixties",
+   "whatsthenewmaryjane",
+   "shesawoman"
+  ],
+  "heather": [
+   "oneafter",
+   "theword",
+   "anothergirl",
+   "etcetera",
+   "cometogether"
+  ],
+  "hellogoodbye": [
+   "goodbye",
+   "heybulldog",
+   "eleanorrigby",
+   "johnnybgoode",
+   "michelle"
+  ],
+  "hellolittlegirl": [
+   "ilostmylittlegirl",
+   "littlechild",
+   "everylittlething",
+   "thefoolonthehill",
+   "helterskelter"
+  ],
+  "help": [
+   "honeypie",
+   "michelle",
+   "heybulldog",
+   "anothergirl",
+   "shelovesyou"
+  ],
+  "helterskelter": [
+   "heather",
+   "hellolittlegirl",
+   "theresaplace",
+   "michelle",
+   "theinnerlight"
+  ],
+  "herecomesthesun": [
+   "hermajesty",
+   "cometogether",
+   "someotherguy",
+   "acrosstheuniverse",
+   "rolloverbeethoven"
+  ],
+  "herethereandeverywhere": [
+   "acrosstheuniverse",
+   "helterskelter",
+   "whatsthenewmaryjane",
+   "herecomesthesun",
+   "nothinshakinbuttheleavesonthetrees"
+  ],
+  "hermajesty": [
+   "herecomesthesun",
+   "nowhereman",
+   "tilltherewasyou",
+   "whenimsixtyfour",
+   "fromustoyou"
+  ],
+  "heybulldog": [
+   "heyjude",
+   "hellogoodbye",
+   "honeydont",
+   "whatyouredoing",
+   "hellolittlegirl"
+  ],
+  "heyjude": [
+   "heybulldog",
+   "honeypie",
+   "honeydont",
+   "sexysadie",
+   "theend"
+  ],
+  "hippyhippyshake": [
+   "illcryinstead",
+   "happinessisawarmgun",
+   "imhappyjusttodancewithyou",
+   "inmylife",
+   "eightdaysaweek"
+  ],
+  "holdmetight": [
+   "goodnight",
+   "letitbe",
+   "comeandgetit",
+   "cometogether",
+   "digit"
+  ],
+  "honeydont": [
+   "oneandoneistwo",
+   "honeypie",
+   "thehoneymoonsong",
+   "loveyouto",
+   "heybulldog"
+  ],
+  "honeypie": [
+   "wildhoneypie",
+   "honeydont",
+   "heyjude",
+   "help",
+   "oneafter"
+  ],
+  "howdoyoudoit": [
+   "whatyouredoing",
+   "youcantdothat",
+   "honeydont",
+   "loveyouto",
+   "oohmysoul"
+  ],
+  "iamthewalrus": [
+   "heather",
+   "theword",
+   "tilltherewasyou",
+   "catswalk",
+   "imaloser"
+  ],
+  "icallyourname": [
+   "allyouneedislove",
+   "illgetyou",
+   "iwanttotellyou",
+   "magicalmysterytour",
+   "allmyloving"
+  ],
+  "idontwanttospoiltheparty": [
+   "iwanttotellyou",
+   "iwantyoushessoheavy",
+   "dontbotherme",
+   "inspiteofallthedanger",
+   "youcantdothat"
+  ],
+  "ifeelfine": [
+   "imemine",
+   "ivegotafeeling",
+   "flying",
+   "ififell",
+   "sieliebtdich"
+  ],
+  "ififell": [
+   "iwill",
+   "inmylife",
+   "michelle",
+   "ifeelfine",
+   "imemine"
+  ],
+  "ifineededsomeone": [
+   "fornoone",
+   "ineedyou",
+   "likedreamersdo",
+   "younevergivemeyourmoney",
+   "dearprudence"
+  ],
+  "iforgottoremembertoforget": [
+   "beingforthebenefitofmrkite",
+   "ifyouvegottrouble",
+   "doctorrobert",
+   "youvegottohideyourloveaway",
+   "thinkforyourself"
+  ],
+  "ifyouvegottrouble": [
+   "youvegottohideyourloveaway",
+   "youvereallygotaholdonme",
+   "allivegottodo",
+   "foryoublue",
+   "youregoingtolosethatgirl"
+  ],
+  "igotawoman": [
+   "woman",
+   "taxman",
+   "shesawoman",
+   "ivegotafeeling",
+   "madman"
+  ],
+  "igottofindmybaby": [
+   "takegoodcareofmybaby",
+   "goodbye",
+   "illbeonmyway",
+   "gottogetyouintomylife",
+   "allivegottodo"
+  ],
+  "ijustdontunderstand": [
+   "donteverchange",
+   "isawherstandingthere",
+   "itwontbelong",
+   "whydontwedoitintheroad",
+   "childofnature"
+  ],
+  "illbeback": [
+   "getback",
+   "illbeonmyway",
+   "lucille",
+   "babysinblack",
+   "sieliebtdich"
+  ],
+  "illbeonmyway": [
+   "illbeback",
+   "bluejayway",
+   "tilltherewasyou",
+   "igottofindmybaby",
+   "illgetyou"
+  ],
+  "illcryinstead": [
+   "allthingsmustpass",
+   "cryforashadow",
+   "icallyourname",
+   "ifeelfine",
+   "imsotired"
+  ],
+  "illfollowthesun": [
+   "tilltherewasyou",
+   "rolloverbeethoven",
+   "alltogethernow",
+   "herecomesthesun",
+   "yellowsubmarine"
+  ],
+  "illgetyou": [
+   "psiloveyou",
+   "ineedyou",
+   "tilltherewasyou",
+   "tellmewhatyousee",
+   "loveyouto"
+  ],
+  "ilostmylittlegirl": [
+   "hellolittlegirl",
+   "littlechild",
+   "sweetlittlesixteen",
+   "anothergirl",
+   "everylittlething"
+  ],
+  "imaloser": [
+   "iminlove",
+   "misery",
+   "andiloveher",
+   "gladallover",
+   "iamthewalrus"
+  ],
+  "imdown": [
+   "slowdown",
+   "dontletmedown",
+   "madman",
+   "ladymadonna",
+   "imemine"
+  ],
+  "imemine": [
+   "iminlove",
+   "ifeelfine",
+   "youllbemine",
+   "memphistennessee",
+   "imsotired"
+  ],
+  "imgonnasitrightdownandcryoveryou": [
+   "suretofallinlovewithyou",
+   "imlookingthroughyou",
+   "imhappyjusttodancewithyou",
+   "moonlightbay",
+   "theballadofjohnandyoko"
+  ],
+  "imhappyjusttodancewithyou": [
+   "fancymychanceswithyou",
+   "suretofallinlovewithyou",
+   "iwanttotellyou",
+   "fromustoyou",
+   "imtalkingaboutyou"
+  ],
+  "iminlove": [
+   "imemine",
+   "itsonlylove",
+   "imaloser",
+   "psiloveyou",
+   "andiloveher"
+  ],
+  "imlookingthroughyou": [
+   "imtalkingaboutyou",
+   "lookingglass",
+   "illgetyou",
+   "tilltherewasyou",
+   "longlonglong"
+  ],
+  "imonlysleeping": [
+   "itsonlylove",
+   "flying",
+   "ivegotafeeling",
+   "mrmoonlight",
+   "imemine"
+  ],
+  "imsotired": [
+   "imemine",
+   "savoytruffle",
+   "imaloser",
+   "iminlove",
+   "inmylife"
+  ],
+  "imtalkingaboutyou": [
+   "imlookingthroughyou",
+   "withinyouwithoutyou",
+   "illgetyou",
+   "iwannabeyourman",
+   "suretofallinlovewithyou"
+  ],
+  "ineedyou": [
+   "illgetyou",
+   "psiloveyou",
+   "iwanttotellyou",
+   "shelovesyou",
+   "iwannabeyourman"
+  ],
+  "inmylife": [
+   "adayinthelife",
+   "gottogetyouintomylife",
+   "runforyourlife",
+   "ififell",
+   "itsonlylove"
+  ],
+  "inspiteofallthedanger": [
+   "thatllbetheday",
+   "idontwanttospoiltheparty",
+   "polythenepam",
+   "donteverchange",
+   "youregoingtolosethatgirl"
+  ],
+  "isawherstandingthere": [
+   "shesleavinghome",
+   "whenigethome",
+   "heather",
+   "adayinthelife",
+   "gettingbetter"
+  ],
+  "ishouldhaveknownbetter": [
+   "yourmothershouldknow",
+   "wildhoneypie",
+   "nothinshakinbuttheleavesonthetrees",
+   "ifyouvegottrouble",
+   "gettingbetter"
+  ],
+  "itsalltoomuch": [
+   "youlikemetoomuch",
+   "illgetyou",
+   "besamemucho",
+   "imtalkingaboutyou",
+   "allivegottodo"
+  ],
+  "itsonlylove": [
+   "iminlove",
+   "imonlysleeping",
+   "wordsoflove",
+   "inmylife",
+   "reallove"
+  ],
+  "itwontbelong": [
+   "iwanttotellyou",
+   "itsonlylove",
+   "iwannabeyourman",
+   "thehoneymoonsong",
+   "cantbuymelove"
+  ],
+  "ivegotafeeling": [
+   "ifeelfine",
+   "ohdarling",
+   "flying",
+   "igotawoman",
+   "imonlysleeping"
+  ],
+  "ivejustseenaface": [
+   "theresaplace",
+   "ivegotafeeling",
+   "dearprudence",
+   "youwontseeme",
+   "leavemykittenalone"
+  ],
+  "iwannabeyourman": [
+   "iwanttoholdyourhand",
+   "babyyourearichman",
+   "iwanttotellyou",
+   "ineedyou",
+   "itwontbelong"
+  ],
+  "iwanttoholdyourhand": [
+   "iwanttotellyou",
+   "iwannabeyourman",
+   "iwantyoushessoheavy",
+   "icallyourname",
+   "andyourbirdcansing"
+  ],
+  "iwanttotellyou": [
+   "iwanttoholdyourhand",
+   "iwannabeyourman",
+   "ineedyou",
+   "itwontbelong",
+   "idontwanttospoiltheparty"
+  ],
+  "iwantyoushessoheavy": [
+   "iwanttoholdyourhand",
+   "aintshesweet",
+   "tellmewhatyousee",
+   "idontwanttospoiltheparty",
+   "iwanttotellyou"
+  ],
+  "iwill": [
+   "ififell",
+   "lucille",
+   "iminlove",
+   "michelle",
+   "girl"
+  ],
+  "jazzpianosong": [
+   "onlyanorthernsong",
+   "whatgoeson",
+   "chains",
+   "itwontbelong",
+   "andyourbirdcansing"
+  ],
+  "jessiesdream": [
+   "likedreamersdo",
+   "beautifuldreamer",
+   "maxwellssilverhammer",
+   "yesterday",
+   "shesaidshesaid"
+  ],
+  "johnnybgoode": [
+   "goodbye",
+   "fornoone",
+   "hellogoodbye",
+   "youngblood",
+   "itsonlylove"
+  ],
+  "julia": [
+   "junk",
+   "lovelyrita",
+   "sourmilksea",
+   "youllbemine",
+   "flying"
+  ],
+  "junk": [
+   "sunking",
+   "julia",
+   "heyjude",
+   "ivejustseenaface",
+   "revolution"
+  ],
+  "kansascityheyheyheyhey": [
+   "iwantyoushessoheavy",
+   "aintshesweet",
+   "acrosstheuniverse",
+   "atasteofhoney",
+   "nothinshakinbuttheleavesonthetrees"
+  ],
+  "keepyourhandsoffmybaby": [
+   "everybodystryingtobemybaby",
+   "takegoodcareofmybaby",
+   "lendmeyourcomb",
+   "igottofindmybaby",
+   "youcantdothat"
+  ],
+  "kommgibmirdeinehand": [
+   "illcryinstead",
+   "norwegianwoodthisbirdhasflown",
+   "devilinherheart",
+   "yellowsubmarine",
+   "youllbemine"
+  ],
+  "ladymadonna": [
+   "obladioblada",
+   "glassonion",
+   "imdown",
+   "madman",
+   "taxman"
+  ],
+  "leavemykittenalone": [
+   "everylittlething",
+   "shesleavinghome",
+   "cayenne",
+   "whilemyguitargentlyweeps",
+   "memphistennessee"
+  ],
+  "lendmeyourcomb": [
+   "loveyouto",
+   "keepyourhandsoffmybaby",
+   "likedreamersdo",
+   "iwannabeyourman",
+   "whenimsixtyfour"
+  ],
+  "letitbe": [
+   "holdmetight",
+   "etcetera",
+   "gettingbetter",
+   "thenightbefore",
+   "lovelyrita"
+  ],
+  "likedreamersdo": [
+   "lovemedo",
+   "jessiesdream",
+   "beautifuldreamer",
+   "lendmeyourcomb",
+   "devilinherheart"
+  ],
+  "littlechild": [
+   "hellolittlegirl",
+   "everylittlething",
+   "ilostmylittlegirl",
+   "sweetlittlesixteen",
+   "withalittlehelpfrommyfriends"
+  ],
+  "lonesometearsinmyeyes": [
+   "someotherguy",
+   "something",
+   "toomuchmonkeybusiness",
+   "herethereandeverywhere",
+   "oneafter"
+  ],
+  "longlonglong": [
+   "youngblood",
+   "lookingglass",
+   "longtallsally",
+   "glassonion",
+   "cryingwaitinghoping"
+  ],
+  "longtallsally": [
+   "actnaturally",
+   "dontpassmeby",
+   "longlonglong",
+   "lookingglass",
+   "thatllbetheday"
+  ],
+  "lookingglass": [
+   "imlookingthroughyou",
+   "longlonglong",
+   "allthingsmustpass",
+   "longtallsally",
+   "glassonion"
+  ],
+  "lovelyrita": [
+   "loveyouto",
+   "psiloveyou",
+   "andiloveher",
+   "gladallover",
+   "shelovesyou"
+  ],
+  "lovemedo": [
+   "loveyouto",
+   "dontletmedown",
+   "psiloveyou",
+   "likedreamersdo",
+   "loveoftheloved"
+  ],
+  "loveoftheloved": [
+   "loveyouto",
+   "rolloverbeethoven",
+   "lovemedo",
+   "allivegottodo",
+   "alltogethernow"
+  ],
+  "loveyouto": [
+   "psiloveyou",
+   "shelovesyou",
+   "lovelyrita",
+   "loveoftheloved",
+   "lovemedo"
+  ],
+  "lucille": [
+   "circles",
+   "michelle",
+   "illbeback",
+   "illgetyou",
+   "iwill"
+  ],
+  "lucyintheskywithdiamonds": [
+   "shakininthesixties",
+   "cryingwaitinghoping",
+   "yesitis",
+   "aintshesweet",
+   "fancymychanceswithyou"
+  ],
+  "madman": [
+   "taxman",
+   "woman",
+   "maggiemae",
+   "igotawoman",
+   "imdown"
+  ],
+  "maggiemae": [
+   "madman",
+   "imemine",
+   "piggies",
+   "michelle",
+   "magicalmysterytour"
+  ],
+  "magicalmysterytour": [
+   "icallyourname",
+   "misery",
+   "marthamydear",
+   "fancymychanceswithyou",
+   "imaloser"
+  ],
+  "mailmanbringmenomoreblues": [
+   "imtalkingaboutyou",
+   "yerblues",
+   "isawherstandingthere",
+   "shesleavinghome",
+   "beingforthebenefitofmrkite"
+  ],
+  "marthamydear": [
+   "heather",
+   "birthday",
+   "maxwellssilverhammer",
+   "thatmeansalot",
+   "magicalmysterytour"
+  ],
+  "matchbox": [
+   "thisboy",
+   "watchingrainbows",
+   "badboy",
+   "besamemucho",
+   "heather"
+  ],
+  "maxwellssilverhammer": [
+   "andiloveher",
+   "hallelujahiloveherso",
+   "jessiesdream",
+   "marthamydear",
+   "devilinherheart"
+  ],
+  "meanmrmustard": [
+   "freeasabird",
+   "pleasemrpostman",
+   "iamthewalrus",
+   "allthingsmustpass",
+   "thatmeansalot"
+  ],
+  "memphistennessee": [
+   "imemine",
+   "leavemykittenalone",
+   "mothernaturesson",
+   "acrosstheuniverse",
+   "pennylane"
+  ],
+  "michelle": [
+   "circles",
+   "ififell",
+   "lucille",
+   "hellogoodbye",
+   "help"
+  ],
+  "misery": [
+   "imaloser",
+   "yesterday",
+   "magicalmysterytour",
+   "sourmilksea",
+   "imemine"
+  ],
+  "moneythatswhatiwant": [
+   "carrythatweight",
+   "mothernaturesson",
+   "thatsallrightmama",
+   "thatmeansalot",
+   "honeydont"
+  ],
+  "moonlightbay": [
+   "mrmoonlight",
+   "goodnight",
+   "theinnerlight",
+   "eightdaysaweek",
+   "imonlysleeping"
+  ],
+  "mothernaturesson": [
+   "onlyanorthernsong",
+   "whatgoeson",
+   "whatyouredoing",
+   "iamthewalrus",
+   "someotherguy"
+  ],
+  "mrmoonlight": [
+   "moonlightbay",
+   "goodnight",
+   "theinnerlight",
+   "aharddaysnight",
+   "imonlysleeping"
+  ],
+  "noreply": [
+   "notguilty",
+   "iwanttotellyou",
+   "lovelyrita",
+   "nowhereman",
+   "anothergirl"
+  ],
+  "norwegianwoodthisbirdhasflown": [
+   "andyourbirdcansing",
+   "iwanttoholdyourhand",
+   "kommgibmirdeinehand",
+   "yourmothershouldknow",
+   "freeasabird"
+  ],
+  "notasecondtime": [
+   "atasteofhoney",
+   "annagotohim",
+   "badtome",
+   "comeandgetit",
+   "dontbotherme"
+  ],
+  "notguilty": [
+   "anothergirl",
+   "noreply",
+   "actnaturally",
+   "someotherguy",
+   "girl"
+  ],
+  "nothinshakinbuttheleavesonthetrees": [
+   "shakininthesixties",
+   "ishouldhaveknownbetter",
+   "herethereandeverywhere",
+   "ripitupshakerattleandrollbluesuedeshoes",
+   "shesleavinghome"
+  ],
+  "nowhereman": [
+   "dontbotherme",
+   "woman",
+   "hermajesty",
+   "igotawoman",
+   "shesawoman"
+  ],
+  "obladioblada": [
+   "ladymadonna",
+   "clarabella",
+   "youngblood",
+   "soldieroflovelaydownyourarms",
+   "badboy"
+  ],
+  "octopussgarden": [
+   "doctorrobert",
+   "dontpassmeby",
+   "tickettoride",
+   "backintheussr",
+   "igotawoman"
+  ],
+  "ohdarling": [
+   "something",
+   "chains",
+   "flying",
+   "ivegotafeeling",
+   "whatyouredoing"
+  ],
+  "oldbrownshoe": [
+   "fornoone",
+   "slowdown",
+   "dontletmedown",
+   "goldenslumbers",
+   "gooddaysunshine"
+  ],
+  "oneafter": [
+   "heather",
+   "cometogether",
+   "dontbotherme",
+   "etcetera",
+   "honeypie"
+  ],
+  "oneandoneistwo": [
+   "comeandgetit",
+   "honeydont",
+   "toknowheristoloveher",
+   "allyouneedislove",
+   "thehoneymoonsong"
+  ],
+  "onlyanorthernsong": [
+   "anothergirl",
+   "mothernaturesson",
+   "yourmothershouldknow",
+   "andyourbirdcansing",
+   "thehoneymoonsong"
+  ],
+  "oohmysoul": [
+   "foryoublue",
+   "frommetoyou",
+   "fromustoyou",
+   "howdoyoudoit",
+   "thankyougirl"
+  ],
+  "paperbackwriter": [
+   "isawherstandingthere",
+   "getback",
+   "etcetera",
+   "blackbird",
+   "illbeback"
+  ],
+  "pennylane": [
+   "cayenne",
+   "inmylife",
+   "ifeelfine",
+   "sexysadie",
+   "whatsthenewmaryjane"
+  ],
+  "piggies": [
+   "digit",
+   "maggiemae",
+   "circles",
+   "ififell",
+   "imemine"
+  ],
+  "pleasemrpostman": [
+   "meanmrmustard",
+   "pleasepleaseme",
+   "shesawoman",
+   "leavemykittenalone",
+   "goldenslumbers"
+  ],
+  "pleasepleaseme": [
+   "polythenepam",
+   "pleasemrpostman",
+   "beautifuldreamer",
+   "dontpassmeby",
+   "helterskelter"
+  ],
+  "polythenepam": [
+   "pleasepleaseme",
+   "inspiteofallthedanger",
+   "onlyanorthernsong",
+   "tipofmytongue",
+   "imonlysleeping"
+  ],
+  "psiloveyou": [
+   "shelovesyou",
+   "loveyouto",
+   "illgetyou",
+   "iminlove",
+   "ineedyou"
+  ],
+  "rain": [
+   "chains",
+   "searchin",
+   "wait",
+   "ohdarling",
+   "woman"
+  ],
+  "reallove": [
+   "gladallover",
+   "allmyloving",
+   "andiloveher",
+   "itsonlylove",
+   "shelovesyou"
+  ],
+  "revolution": [
+   "loveyouto",
+   "fromustoyou",
+   "everylittlething",
+   "fornoone",
+   "threecoolcats"
+  ],
+  "ripitupshakerattleandrollbluesuedeshoes": [
+   "nothinshakinbuttheleavesonthetrees",
+   "ashotofrhythmandblues",
+   "rockandrollmusic",
+   "withalittlehelpfrommyfriends",
+   "thatllbetheday"
+  ],
+  "rockandrollmusic": [
+   "carol",
+   "takingatriptocarolina",
+   "rockyraccoon",
+   "itsalltoomuch",
+   "meanmrmustard"
+  ],
+  "rockyraccoon": [
+   "rockandrollmusic",
+   "cryforashadow",
+   "fornoone",
+   "notasecondtime",
+   "loveyouto"
+  ],
+  "rolloverbeethoven": [
+   "loveoftheloved",
+   "herecomesthesun",
+   "illfollowthesun",
+   "suretofallinlovewithyou",
+   "lovemedo"
+  ],
+  "runforyourlife": [
+   "foryoublue",
+   "thinkforyourself",
+   "inmylife",
+   "fromustoyou",
+   "thankyougirl"
+  ],
+  "savoytruffle": [
+   "ifyouvegottrouble",
+   "imsotired",
+   "daytripper",
+   "foryoublue",
+   "anothergirl"
+  ],
+  "searchin": [
+   "something",
+   "chains",
+   "rain",
+   "babyyourearichman",
+   "ohdarling"
+  ],
+  "septemberintherain": [
+   "etcetera",
+   "something",
+   "isawherstandingthere",
+   "shecameinthroughthebathroomwindow",
+   "cometogether"
+  ],
+  "sexysadie": [
+   "shesaidshesaid",
+   "heyjude",
+   "honeypie",
+   "searchin",
+   "pennylane"
+  ],
+  "sgtpepperslonelyheartsclubband": [
+   "sgtpepperslonelyheartsclubbandreprise",
+   "stepinsidelovelosparanoias",
+   "septemberintherain",
+   "moneythatswhatiwant",
+   "soldieroflovelaydownyourarms"
+  ],
+  "sgtpepperslonelyheartsclubbandreprise": [
+   "sgtpepperslonelyheartsclubband",
+   "stepinsidelovelosparanoias",
+   "lonesometearsinmyeyes",
+   "herethereandeverywhere",
+   "nothinshakinbuttheleavesonthetrees"
+  ],
+  "shakininthesixties": [
+   "backintheussr",
+   "aintshesweet",
+   "adayinthelife",
+   "nothinshakinbuttheleavesonthetrees",
+   "yesitis"
+  ],
+  "shecameinthroughthebathroomwindow": [
+   "septemberintherain",
+   "cometogether",
+   "shesaidshesaid",
+   "imlookingthroughyou",
+   "shesleavinghome"
+  ],
+  "shelovesyou": [
+   "psiloveyou",
+   "loveyouto",
+   "tilltherewasyou",
+   "suretofallinlovewithyou",
+   "ineedyou"
+  ],
+  "shesaidshesaid": [
+   "sexysadie",
+   "shesawoman",
+   "iwantyoushessoheavy",
+   "shesleavinghome",
+   "heather"
+  ],
+  "shesawoman": [
+   "woman",
+   "igotawoman",
+   "shesleavinghome",
+   "madman",
+   "nowhereman"
+  ],
+  "shesleavinghome": [
+   "whenigethome",
+   "isawherstandingthere",
+   "shesawoman",
+   "leavemykittenalone",
+   "shesaidshesaid"
+  ],
+  "shout": [
+   "twistandshout",
+   "shelovesyou",
+   "howdoyoudoit",
+   "honeydont",
+   "imsotired"
+  ],
+  "sieliebtdich": [
+   "ifeelfine",
+   "illbeback",
+   "littlechild",
+   "everylittlething",
+   "youlikemetoomuch"
+  ],
+  "slowdown": [
+   "imdown",
+   "lovemedo",
+   "oldbrownshoe",
+   "dontletmedown",
+   "honeydont"
+  ],
+  "sohowcomenoonelovesme": [
+   "shelovesyou",
+   "tomorrowneverknows",
+   "becauseiknowyoulovemeso",
+   "toknowheristoloveher",
+   "itsonlylove"
+  ],
+  "soldieroflovelaydownyourarms": [
+   "psiloveyou",
+   "suretofallinlovewithyou",
+   "shelovesyou",
+   "obladioblada",
+   "wordsoflove"
+  ],
+  "someotherguy": [
+   "cometogether",
+   "something",
+   "heather",
+   "anothergirl",
+   "herecomesthesun"
+  ],
+  "something": [
+   "someotherguy",
+   "searchin",
+   "ohdarling",
+   "septemberintherain",
+   "herecomesthesun"
+  ],
+  "sourmilksea": [
+   "misery",
+   "youregoingtolosethatgirl",
+   "youllbemine",
+   "lucille",
+   "savoytruffle"
+  ],
+  "stepinsidelovelosparanoias": [
+   "shesaidshesaid",
+   "psiloveyou",
+   "sgtpepperslonelyheartsclubbandreprise",
+   "sgtpepperslonelyheartsclubband",
+   "takingatriptocarolina"
+  ],
+  "strawberryfieldsforever": [
+   "toknowheristoloveher",
+   "beautifuldreamer",
+   "cantbuymelove",
+   "ifineededsomeone",
+   "herethereandeverywhere"
+  ],
+  "sunking": [
+   "junk",
+   "something",
+   "glassonion",
+   "flying",
+   "gooddaysunshine"
+  ],
+  "suretofallinlovewithyou": [
+   "psiloveyou",
+   "imhappyjusttodancewithyou",
+   "shelovesyou",
+   "reallove",
+   "fancymychanceswithyou"
+  ],
+  "sweetlittlesixteen": [
+   "everylittlething",
+   "ilostmylittlegirl",
+   "hellolittlegirl",
+   "littlechild",
+   "withalittlehelpfrommyfriends"
+  ],
+  "takegoodcareofmybaby": [
+   "igottofindmybaby",
+   "keepyourhandsoffmybaby",
+   "takingatriptocarolina",
+   "everybodystryingtobemybaby",
+   "crybabycry"
+  ],
+  "takingatriptocarolina": [
+   "takegoodcareofmybaby",
+   "imtalkingaboutyou",
+   "thingswesaidtoday",
+   "rockandrollmusic",
+   "watchingrainbows"
+  ],
+  "taxman": [
+   "madman",
+   "igotawoman",
+   "woman",
+   "thatmeansalot",
+   "shesawoman"
+  ],
+  "teddyboy": [
+   "badboy",
+   "thisboy",
+   "boys",
+   "ineedyou",
+   "yesterday"
+  ],
+  "tellmewhatyousee": [
+   "tellmewhy",
+   "tilltherewasyou",
+   "illgetyou",
+   "whatyouredoing",
+   "iwantyoushessoheavy"
+  ],
+  "tellmewhy": [
+   "tellmewhatyousee",
+   "askmewhy",
+   "thatllbetheday",
+   "tilltherewasyou",
+   "illbeonmyway"
+  ],
+  "thankyougirl": [
+   "thinkforyourself",
+   "anothergirl",
+   "girl",
+   "oohmysoul",
+   "andyourbirdcansing"
+  ],
+  "thatllbetheday": [
+   "tilltherewasyou",
+   "tellmewhy",
+   "yesterday",
+   "thatsallrightmama",
+   "inspiteofallthedanger"
+  ],
+  "thatmeansalot": [
+   "twistandshout",
+   "thatsallrightmama",
+   "taxman",
+   "anytimeatall",
+   "marthamydear"
+  ],
+  "thatsallrightmama": [
+   "thatmeansalot",
+   "thatllbetheday",
+   "carrythatweight",
+   "theinnerlight",
+   "aharddaysnight"
+  ],
+  "theballadofjohnandyoko": [
+   "thelongandwindingroad",
+   "heybulldog",
+   "obladioblada",
+   "imgonnasitrightdownandcryoveryou",
+   "atasteofhoney"
+  ],
+  "thecontinuingstoryofbungalowbill": [
+   "thinkforyourself",
+   "theinnerlight",
+   "youregoingtolosethatgirl",
+   "thenightbefore",
+   "gottogetyouintomylife"
+  ],
+  "theend": [
+   "theword",
+   "loveoftheloved",
+   "nowhereman",
+   "heather",
+   "heyjude"
+  ],
+  "thefoolonthehill": [
+   "hellolittlegirl",
+   "fornoone",
+   "threecoolcats",
+   "toknowheristoloveher",
+   "thinkforyourself"
+  ],
+  "thehoneymoonsong": [
+   "honeydont",
+   "itwontbelong",
+   "mothernaturesson",
+   "onlyanorthernsong",
+   "atasteofhoney"
+  ],
+  "theinnerlight": [
+   "thenightbefore",
+   "anothergirl",
+   "carrythatweight",
+   "mrmoonlight",
+   "moonlightbay"
+  ],
+  "thelongandwindingroad": [
+   "theballadofjohnandyoko",
+   "shesleavinghome",
+   "isawherstandingthere",
+   "theword",
+   "longlonglong"
+  ],
+  "thenightbefore": [
+   "whenigethome",
+   "theinnerlight",
+   "whenimsixtyfour",
+   "acrosstheuniverse",
+   "eightdaysaweek"
+  ],
+  "theresaplace": [
+   "ivejustseenaface",
+   "reallove",
+   "helterskelter",
+   "thatmeansalot",
+   "hermajesty"
+  ],
+  "thesheikofaraby": [
+   "yesterday",
+   "thenightbefore",
+   "iwantyoushessoheavy",
+   "takegoodcareofmybaby",
+   "theword"
+  ],
+  "theword": [
+   "theend",
+   "heather",
+   "iamthewalrus",
+   "tickettoride",
+   "loveoftheloved"
+  ],
+  "thingswesaidtoday": [
+   "thisboy",
+   "watchingrainbows",
+   "takingatriptocarolina",
+   "allthingsmustpass",
+   "yesterday"
+  ],
+  "thinkforyourself": [
+   "thankyougirl",
+   "runforyourlife",
+   "foryoublue",
+   "thenightbefore",
+   "thesheikofaraby"
+  ],
+  "thisboy": [
+   "boys",
+   "matchbox",
+   "teddyboy",
+   "thingswesaidtoday",
+   "thenightbefore"
+  ],
+  "threecoolcats": [
+   "herecomesthesun",
+   "thefoolonthehill",
+   "thehoneymoonsong",
+   "revolution",
+   "tilltherewasyou"
+  ],
+  "tickettoride": [
+   "theword",
+   "allivegottodo",
+   "octopussgarden",
+   "thenightbefore",
+   "littlechild"
+  ],
+  "tilltherewasyou": [
+   "illgetyou",
+   "tellmewhatyousee",
+   "thatllbetheday",
+   "shelovesyou",
+   "illfollowthesun"
+  ],
+  "tipofmytongue": [
+   "cometogether",
+   "itwontbelong",
+   "polythenepam",
+   "ashotofrhythmandblues",
+   "atasteofhoney"
+  ],
+  "toknowheristoloveher": [
+   "andiloveher",
+   "youknowwhattodo",
+   "allyouneedislove",
+   "hallelujahiloveherso",
+   "oneandoneistwo"
+  ],
+  "tomorrowneverknows": [
+   "alltogethernow",
+   "yourmothershouldknow",
+   "doctorrobert",
+   "sohowcomenoonelovesme",
+   "thehoneymoonsong"
+  ],
+  "toomuchmonkeybusiness": [
+   "honeypie",
+   "ashotofrhythmandblues",
+   "lonesometearsinmyeyes",
+   "lookingglass",
+   "thankyougirl"
+  ],
+  "twistandshout": [
+   "shout",
+   "thatmeansalot",
+   "withinyouwithoutyou",
+   "ineedyou",
+   "imtalkingaboutyou"
+  ],
+  "twoofus": [
+   "frommetoyou",
+   "wordsoflove",
+   "tellmewhatyousee",
+   "theword",
+   "iamthewalrus"
+  ],
+  "wait": [
+   "rain",
+   "digit",
+   "iwill",
+   "wecanworkitout",
+   "woman"
+  ],
+  "watchingrainbows": [
+   "chains",
+   "matchbox",
+   "allthingsmustpass",
+   "thingswesaidtoday",
+   "whatgoeson"
+  ],
+  "wecanworkitout": [
+   "whenimsixtyfour",
+   "eleanorrigby",
+   "whenigethome",
+   "twistandshout",
+   "wait"
+  ],
+  "whatgoeson": [
+   "whatyouredoing",
+   "mothernaturesson",
+   "iwanttotellyou",
+   "shesawoman",
+   "youknowwhattodo"
+  ],
+  "whatsthenewmaryjane": [
+   "acrosstheuniverse",
+   "atasteofhoney",
+   "thatllbetheday",
+   "nowhereman",
+   "shesawoman"
+  ],
+  "whatyouredoing": [
+   "whatgoeson",
+   "andyourbirdcansing",
+   "howdoyoudoit",
+   "mothernaturesson",
+   "tellmewhatyousee"
+  ],
+  "whenigethome": [
+   "thenightbefore",
+   "shesleavinghome",
+   "isawherstandingthere",
+   "heather",
+   "cometogether"
+  ],
+  "whenimsixtyfour": [
+   "thenightbefore",
+   "lendmeyourcomb",
+   "wecanworkitout",
+   "whatyouredoing",
+   "hermajesty"
+  ],
+  "whilemyguitargentlyweeps": [
+   "leavemykittenalone",
+   "ilostmylittlegirl",
+   "imonlysleeping",
+   "hellolittlegirl",
+   "watchingrainbows"
+  ],
+  "whydontwedoitintheroad": [
+   "dontbotherme",
+   "youcantdothat",
+   "whatyouredoing",
+   "devilinherheart",
+   "idontwanttospoiltheparty"
+  ],
+  "wildhoneypie": [
+   "honeypie",
+   "childofnature",
+   "honeydont",
+   "ishouldhaveknownbetter",
+   "imonlysleeping"
+  ],
+  "withalittlehelpfrommyfriends": [
+   "sweetlittlesixteen",
+   "littlechild",
+   "thatllbetheday",
+   "hallelujahiloveherso",
+   "everylittlething"
+  ],
+  "withinyouwithoutyou": [
+   "imtalkingaboutyou",
+   "twistandshout",
+   "youlikemetoomuch",
+   "thankyougirl",
+   "yourmothershouldknow"
+  ],
+  "woman": [
+   "igotawoman",
+   "shesawoman",
+   "madman",
+   "taxman",
+   "nowhereman"
+  ],
+  "wordsoflove": [
+   "itsonlylove",
+   "fornoone",
+   "reallove",
+   "allyouneedislove",
+   "foryoublue"
+  ],
+  "yellowsubmarine": [
+   "youllbemine",
+   "illfollowthesun",
+   "imemine",
+   "hellogoodbye",
+   "reallove"
+  ],
+  "yerblues": [
+   "foryoublue",
+   "circles",
+   "ifyouvegottrouble",
+   "bluejayway",
+   "hermajesty"
+  ],
+  "yesitis": [
+   "yesterday",
+   "shakininthesixties",
+   "babyitsyou",
+   "lucyintheskywithdiamonds",
+   "letitbe"
+  ],
+  "yesterday": [
+   "etcetera",
+   "misery",
+   "thatllbetheday",
+   "heather",
+   "thesheikofaraby"
+  ],
+  "youcantdothat": [
+   "youknowwhattodo",
+   "whydontwedoitintheroad",
+   "idontwanttospoiltheparty",
+   "dontbotherme",
+   "howdoyoudoit"
+  ],
+  "youknowmynamelookupthenumber": [
+   "toknowheristoloveher",
+   "goldenslumbers",
+   "youlikemetoomuch",
+   "sohowcomenoonelovesme",
+   "cometogether"
+  ],
+  "youknowwhattodo": [
+   "youcantdothat",
+   "youngblood",
+   "toknowheristoloveher",
+   "doyouwanttoknowasecret",
+   "whatyouredoing"
+  ],
+  "youlikemetoomuch": [
+   "itsalltoomuch",
+   "besamemucho",
+   "frommetoyou",
+   "youllbemine",
+   "likedreamersdo"
+  ],
+  "youllbemine": [
+   "yellowsubmarine",
+   "imemine",
+   "youwontseeme",
+   "youlikemetoomuch",
+   "whatyouredoing"
+  ],
+  "younevergivemeyourmoney": [
+   "youvegottohideyourloveaway",
+   "youvereallygotaholdonme",
+   "ifineededsomeone",
+   "youlikemetoomuch",
+   "youwontseeme"
+  ],
+  "youngblood": [
+   "youknowwhattodo",
+   "longlonglong",
+   "foryoublue",
+   "goodbye",
+   "allyouneedislove"
+  ],
+  "youregoingtolosethatgirl": [
+   "youvereallygotaholdonme",
+   "ifyouvegottrouble",
+   "whatyouredoing",
+   "sourmilksea",
+   "toknowheristoloveher"
+  ],
+  "yourmothershouldknow": [
+   "onlyanorthernsong",
+   "youvereallygotaholdonme",
+   "mothernaturesson",
+   "someotherguy",
+   "ifyouvegottrouble"
+  ],
+  "youvegottohideyourloveaway": [
+   "younevergivemeyourmoney",
+   "ifyouvegottrouble",
+   "igottofindmybaby",
+   "gottogetyouintomylife",
+   "allivegottodo"
+  ],
+  "youvereallygotaholdonme": [
+   "ifyouvegottrouble",
+   "younevergivemeyourmoney",
+   "yourmothershouldknow",
+   "youregoingtolosethatgirl",
+   "allivegottodo"
+  ],
+  "youwontseeme": [
+   "doyouwanttoknowasecret",
+   "youllbemine",
+   "allyouneedislove",
+   "dontbotherme",
+   "dontpassmeby"
+  ]
+ },
+ "stats": {
+  "album": {
+   "Abbey Road": 17,
+   "Anthology 1": 20,
+   "Anthology 2": 4,
+   "Anthology 3": 9,
+   "Help!": 7,
+   "Let It Be": 12,
+   "Let It Be film": 1,
+   "Let It Be... Naked - Fly on the Wall bonus disc": 4,
+   "Let it Be film": 1,
+   "Live at the BBC": 31,
+   "Live! at the Star-Club in Hamburg, Germany; 1962": 1,
+   "Magical Mystery Tour": 12,
+   "N/A": 2,
+   "On Air – Live at the BBC Volume 2": 1,
+   "Revolver": 11,
+   "Rock 'n' Roll Music": 1,
+   "Rubber Soul": 10,
+   "Sgt. Pepper's Lonely Hearts Club Band": 13,
+   "The Beatles": 29,
+   "The Beatles Bootleg Recordings 1963": 2,
+   "The Beatles' Christmas Album": 1,
+   "UK: \"Long Tall Sally\" EP US: Something New": 2,
+   "UK: \"Long Tall Sally\" EP US: The Beatles' Second Album": 1,
+   "UK: 1967-1970 US: Hey Jude": 1,
+   "UK: 1967–1970 US: Hey Jude": 4,
+   "UK: A Collection of Beatles Oldies US: 1962–1966": 1,
+   "UK: A Collection of Beatles Oldies US: Beatles '65": 1,
+   "UK: A Collection of Beatles Oldies US: Beatles VI": 1,
+   "UK: A Collection of Beatles Oldies US: Hey Jude": 1,
+   "UK: A Collection of Beatles Oldies US: Meet the Beatles!": 1,
+   "UK: A Collection of Beatles Oldies US: The Beatles Second Album": 1,
+   "UK: A Collection of Beatles Oldies US: Yesterday and Today": 2,
+   "UK: A Hard Day's Night US: 1962–1966": 1,
+   "UK: A Hard Day's Night US: Beatles '65": 1,
+   "UK: A Hard Day's Night US: Hey Jude": 2,
+   "UK: A Hard Day's Night US: Something New": 8,
+   "UK: A Hard Day's Night US: The Beatles Second Album": 1,
+   "UK: Beatles for Sale US: Beatles '65": 8,
+   "UK: Beatles for Sale US: Beatles VI": 6,
+   "UK: Help! US: Beatles VI": 3,
+   "UK: Help! US: Rubber Soul": 2,
+   "UK: Help! US: Yesterday and Today": 2,
+   "UK: Long Tall Sally EP US: The Beatles' Second Album": 1,
+   "UK: Past Masters Volume 1 US: The Beatles' Second Album": 1,
+   "UK: Please Please Me US: Introducing… The Beatles": 1,
+   "UK: Please Please Me US: Meet the Beatles!": 1,
+   "UK: Please Please Me US: Rarities": 1,
+   "UK: Please Please Me US: The Early Beatles": 11,
+   "UK: Rarities US: Beatles '65": 1,
+   "UK: Rarities US: Beatles VI": 1,
+   "UK: Rarities US: Hey Jude": 1,
+   "UK: Rarities US: Meet the Beatles!": 1,
+   "UK: Rarities US: Rarities": 3,
+   "UK: Rarities US: Something New": 1,
+   "UK: Rarities US: The Beatles Second Album": 1,
+   "UK: Revolver US: Yesterday and Today": 3,
+   "UK: Rubber Soul US: Yesterday and Today": 4,
+   "UK: With the Beatles US: Meet the Beatles!": 9,
+   "UK: With the Beatles US: The Beatles Second Album": 2,
+   "UK: With the Beatles US: The Beatles' Second Album": 3,
+   "Unreleased": 4,
+   "Yellow Submarine": 4
+  },
+  "album,lead_vocal": {
+   "Abbey Road": {
+    "Harrison": 2,
+    "Lennon": 6,
+    "McCartney": 8,
+    "Starr": 1
+   },
+   "Anthology 1": {
+    "Harrison": 3,
+    "Instrumental": 2,
+    "Lennon": 10,
+    "McCartney": 5
+   },
+   "Anthology 2": {
+    "Instrumental": 1,
+    "Lennon": 1,
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "Anthology 3": {
+    "Harrison": 2,
+    "Lennon": 3,
+    "McCartney": 4
+   },
+   "Help!": {
+    "Harrison": 1,
+    "Lennon": 4,
+    "McCartney": 2
+   },
+   "Let It Be": {
+    "Harrison": 2,
+    "Lennon": 5,
+    "McCartney": 5
+   },
+   "Let It Be film": {
+    "McCartney": 1
+   },
+   "Let It Be... Naked - Fly on the Wall bonus disc": {
+    "Lennon": 3,
+    "Starr": 1
+   },
+   "Let it Be film": {
+    "McCartney": 1
+   },
+   "Live at the BBC": {
+    "Harrison": 7,
+    "Lennon": 17,
+    "McCartney": 7
+   },
+   "Live! at the Star-Club in Hamburg, Germany; 1962": {
+    "Lennon": 1
+   },
+   "Magical Mystery Tour": {
+    "Harrison": 1,
+    "Instrumental": 2,
+    "Lennon": 4,
+    "McCartney": 5
+   },
+   "N/A": {
+    "Lennon": 1,
+    "N/A": 1
+   },
+   "On Air – Live at the BBC Volume 2": {
+    "McCartney": 1
+   },
+   "Revolver": {
+    "Harrison": 3,
+    "Lennon": 2,
+    "McCartney": 5,
+    "Starr": 1
+   },
+   "Rock 'n' Roll Music": {
+    "McCartney": 1
+   },
+   "Rubber Soul": {
+    "Harrison": 1,
+    "Lennon": 5,
+    "McCartney": 4
+   },
+   "Sgt. Pepper's Lonely Hearts Club Band": {
+    "Lennon": 5,
+    "McCartney": 7,
+    "Starr": 1
+   },
+   "The Beatles": {
+    "Harrison": 4,
+    "Lennon": 10,
+    "McCartney": 12,
+    "Sound Collage": 1,
+    "Starr": 2
+   },
+   "The Beatles Bootleg Recordings 1963": {
+    "Lennon": 2
+   },
+   "The Beatles' Christmas Album": {
+    "Lennon": 1
+   },
+   "UK: \"Long Tall Sally\" EP US: Something New": {
+    "Lennon": 1,
+    "Starr": 1
+   },
+   "UK: \"Long Tall Sally\" EP US: The Beatles' Second Album": {
+    "Lennon": 1
+   },
+   "UK: 1967-1970 US: Hey Jude": {
+    "McCartney": 1
+   },
+   "UK: 1967–1970 US: Hey Jude": {
+    "Harrison": 1,
+    "Lennon": 2,
+    "McCartney": 1
+   },
+   "UK: A Collection of Beatles Oldies US: 1962–1966": {
+    "Lennon": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Beatles '65": {
+    "Lennon": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Beatles VI": {
+    "Lennon": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Hey Jude": {
+    "McCartney": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Meet the Beatles!": {
+    "Lennon": 1
+   },
+   "UK: A Collection of Beatles Oldies US: The Beatles Second Album": {
+    "Lennon": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Yesterday and Today": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Hard Day's Night US: 1962–1966": {
+    "Lennon": 1
+   },
+   "UK: A Hard Day's Night US: Beatles '65": {
+    "Lennon": 1
+   },
+   "UK: A Hard Day's Night US: Hey Jude": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Hard Day's Night US: Something New": {
+    "Harrison": 1,
+    "Lennon": 5,
+    "McCartney": 2
+   },
+   "UK: A Hard Day's Night US: The Beatles Second Album": {
+    "Lennon": 1
+   },
+   "UK: Beatles for Sale US: Beatles '65": {
+    "Harrison": 1,
+    "Lennon": 5,
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "UK: Beatles for Sale US: Beatles VI": {
+    "Lennon": 4,
+    "McCartney": 2
+   },
+   "UK: Help! US: Beatles VI": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Help! US: Rubber Soul": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Help! US: Yesterday and Today": {
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "UK: Long Tall Sally EP US: The Beatles' Second Album": {
+    "McCartney": 1
+   },
+   "UK: Past Masters Volume 1 US: The Beatles' Second Album": {
+    "Lennon": 1
+   },
+   "UK: Please Please Me US: Introducing… The Beatles": {
+    "Lennon": 1
+   },
+   "UK: Please Please Me US: Meet the Beatles!": {
+    "McCartney": 1
+   },
+   "UK: Please Please Me US: Rarities": {
+    "Lennon": 1
+   },
+   "UK: Please Please Me US: The Early Beatles": {
+    "Harrison": 2,
+    "Lennon": 5,
+    "McCartney": 3,
+    "Starr": 1
+   },
+   "UK: Rarities US: Beatles '65": {
+    "McCartney": 1
+   },
+   "UK: Rarities US: Beatles VI": {
+    "Lennon": 1
+   },
+   "UK: Rarities US: Hey Jude": {
+    "Lennon": 1
+   },
+   "UK: Rarities US: Meet the Beatles!": {
+    "Lennon": 1
+   },
+   "UK: Rarities US: Rarities": {
+    "Harrison": 1,
+    "Lennon": 2
+   },
+   "UK: Rarities US: Something New": {
+    "Lennon": 1
+   },
+   "UK: Rarities US: The Beatles Second Album": {
+    "Lennon": 1
+   },
+   "UK: Revolver US: Yesterday and Today": {
+    "Lennon": 3
+   },
+   "UK: Rubber Soul US: Yesterday and Today": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "UK: With the Beatles US: Meet the Beatles!": {
+    "Harrison": 1,
+    "Lennon": 4,
+    "McCartney": 3,
+    "Starr": 1
+   },
+   "UK: With the Beatles US: The Beatles Second Album": {
+    "Lennon": 2
+   },
+   "UK: With the Beatles US: The Beatles' Second Album": {
+    "Harrison": 2,
+    "Lennon": 1
+   },
+   "Unreleased": {
+    "Harrison": 1,
+    "Lennon": 2,
+    "McCartney": 1
+   },
+   "Yellow Submarine": {
+    "Harrison": 2,
+    "Lennon": 1,
+    "McCartney": 1
+   }
+  },
+  "album,songwriters": {
+   "Abbey Road": {
+    "Harrison": 2,
+    "Lennon": 6,
+    "McCartney": 8,
+    "Starr": 1
+   },
+   "Anthology 1": {
+    "Ben Weisman": 1,
+    "Buddy Holly": 1,
+    "Consuelo Velázquez": 1,
+    "Edward Madden": 1,
+    "Francis Wheeler": 1,
+    "Fred Wise": 1,
+    "Harrison": 4,
+    "Harry B. Smith": 1,
+    "Jack Yellen": 1,
+    "James McDougall": 1,
+    "Jerry Allison": 1,
+    "Jerry Leiber": 2,
+    "Kay Twomey": 1,
+    "Lennon": 4,
+    "Little Willie John": 1,
+    "McCartney": 5,
+    "Mike Stoller": 2,
+    "Milton Ager": 1,
+    "Mitch Murray": 1,
+    "Norman Petty": 1,
+    "O'Kelly Isley Jr.": 1,
+    "Percy Wenrich": 1,
+    "Ray Charles": 1,
+    "Ronald Isley": 1,
+    "Rudolph Isley": 1,
+    "Starr": 1,
+    "Sunny Skylar": 1,
+    "Ted Snyder": 1,
+    "Titus Turner": 1
+   },
+   "Anthology 2": {
+    "Harrison": 1,
+    "Lennon": 3,
+    "McCartney": 3,
+    "Starr": 1
+   },
+   "Anthology 3": {
+    "Bill Katz": 1,
+    "Carl Perkins": 1,
+    "Charles Calhoun": 1,
+    "Harrison": 3,
+    "John Marascalco": 1,
+    "Lennon": 2,
+    "McCartney": 4,
+    "Robert Blackwell": 1,
+    "Ruth Roberts": 1,
+    "Stanley Clayton": 1,
+    "Starr": 1
+   },
+   "Help!": {
+    "Harrison": 1,
+    "Lennon": 4,
+    "McCartney": 3
+   },
+   "Let It Be": {
+    "Harrison": 4,
+    "Lennon": 6,
+    "McCartney": 7,
+    "Starr": 2,
+    "Traditional": 1
+   },
+   "Let It Be film": {
+    "McCartney": 1
+   },
+   "Let It Be... Naked - Fly on the Wall bonus disc": {
+    "Lennon": 3,
+    "McCartney": 2,
+    "Starr": 1
+   },
+   "Let it Be film": {
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "Live at the BBC": {
+    "Aaron Schroeder": 1,
+    "Al Mortimer": 1,
+    "Albert Collins": 1,
+    "Arthur Crudup": 1,
+    "Bill Cantrell": 1,
+    "Boudleaux Bryant": 1,
+    "Buddy Holly": 1,
+    "Buzz Cason": 1,
+    "Carl Perkins": 1,
+    "Carole King": 2,
+    "Chan Romero": 1,
+    "Charlie Feathers": 1,
+    "Chuck Berry": 6,
+    "Dorsey Burnette": 1,
+    "Eddie Fontaine": 1,
+    "Felice": 1,
+    "Gerry Goffin": 2,
+    "Howard Biggs": 1,
+    "Jerry Leiber": 2,
+    "Joe Thomas": 1,
+    "Johnny Burnette": 1,
+    "Kent Westberry": 1,
+    "Lennon": 1,
+    "Little Richard": 2,
+    "Marijohn Wilkin": 1,
+    "McCartney": 2,
+    "Mike Pingitore": 1,
+    "Mike Stoller": 2,
+    "Mikis Theodorakis": 1,
+    "Paul Burlison": 1,
+    "Phil Spector": 1,
+    "Quinton Claunch": 1,
+    "Ray Charles": 1,
+    "Richie Barrett": 1,
+    "Roy C. Bennett": 1,
+    "Sansom": 1,
+    "Sid Tepper": 1,
+    "Stan Kesler": 1,
+    "Terry Thompson": 1,
+    "Tony Moon": 1
+   },
+   "Live! at the Star-Club in Hamburg, Germany; 1962": {
+    "Chuck Berry": 1
+   },
+   "Magical Mystery Tour": {
+    "Harrison": 3,
+    "Lennon": 7,
+    "McCartney": 8,
+    "Starr": 2
+   },
+   "N/A": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "On Air – Live at the BBC Volume 2": {
+    "Stephen Foster": 1
+   },
+   "Revolver": {
+    "Harrison": 3,
+    "Lennon": 5,
+    "McCartney": 6
+   },
+   "Rock 'n' Roll Music": {
+    "McCartney": 1
+   },
+   "Rubber Soul": {
+    "Harrison": 1,
+    "Lennon": 7,
+    "McCartney": 8
+   },
+   "Sgt. Pepper's Lonely Hearts Club Band": {
+    "Lennon": 8,
+    "McCartney": 9
+   },
+   "The Beatles": {
+    "Harrison": 5,
+    "Lennon": 14,
+    "McCartney": 12,
+    "Ono": 1,
+    "Starr": 1
+   },
+   "The Beatles Bootleg Recordings 1963": {
+    "Lennon": 2
+   },
+   "The Beatles' Christmas Album": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "UK: \"Long Tall Sally\" EP US: Something New": {
+    "Blind Lemon Jefferson": 1,
+    "Carl Perkins": 1,
+    "Larry Williams": 1
+   },
+   "UK: \"Long Tall Sally\" EP US: The Beatles' Second Album": {
+    "Lennon": 1
+   },
+   "UK: 1967-1970 US: Hey Jude": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: 1967–1970 US: Hey Jude": {
+    "Harrison": 1,
+    "Lennon": 2,
+    "McCartney": 1
+   },
+   "UK: A Collection of Beatles Oldies US: 1962–1966": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Beatles '65": {
+    "Lennon": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Beatles VI": {
+    "Larry Williams": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Hey Jude": {
+    "McCartney": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Meet the Beatles!": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Collection of Beatles Oldies US: The Beatles Second Album": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Yesterday and Today": {
+    "Lennon": 2,
+    "McCartney": 2
+   },
+   "UK: A Hard Day's Night US: 1962–1966": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Hard Day's Night US: Beatles '65": {
+    "Lennon": 1
+   },
+   "UK: A Hard Day's Night US: Hey Jude": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Hard Day's Night US: Something New": {
+    "Lennon": 7,
+    "McCartney": 4
+   },
+   "UK: A Hard Day's Night US: The Beatles Second Album": {
+    "Lennon": 1
+   },
+   "UK: Beatles for Sale US: Beatles '65": {
+    "Carl Perkins": 2,
+    "Chuck Berry": 1,
+    "Lennon": 3,
+    "McCartney": 3,
+    "Roy Lee Johnson": 1
+   },
+   "UK: Beatles for Sale US: Beatles VI": {
+    "Buddy Holly": 1,
+    "Jerry Leiber": 1,
+    "Lennon": 2,
+    "Little Richard": 1,
+    "McCartney": 3,
+    "Mike Stoller": 1
+   },
+   "UK: Help! US: Beatles VI": {
+    "Harrison": 1,
+    "Larry Williams": 1,
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Help! US: Rubber Soul": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Help! US: Yesterday and Today": {
+    "Johnny Russell": 1,
+    "McCartney": 1,
+    "Voni Morrison": 1
+   },
+   "UK: Long Tall Sally EP US: The Beatles' Second Album": {
+    "Enotris Johnson": 1,
+    "Little Richard": 1,
+    "Robert \"Bumps\" Blackwell": 1
+   },
+   "UK: Past Masters Volume 1 US: The Beatles' Second Album": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Please Please Me US: Introducing… The Beatles": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Please Please Me US: Meet the Beatles!": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Please Please Me US: Rarities": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Please Please Me US: The Early Beatles": {
+    "Arthur Alexander": 1,
+    "Bert Berns": 1,
+    "Bobby Scott": 1,
+    "Burt Bacharach": 1,
+    "Carole King": 1,
+    "Gerry Goffin": 1,
+    "Hal David": 1,
+    "Lennon": 5,
+    "Luther Dixon": 2,
+    "McCartney": 3,
+    "Phil Medley": 1,
+    "Ric Marlow": 1,
+    "Wes Farrell": 1
+   },
+   "UK: Rarities US: Beatles '65": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Rarities US: Beatles VI": {
+    "Lennon": 1
+   },
+   "UK: Rarities US: Hey Jude": {
+    "Lennon": 1
+   },
+   "UK: Rarities US: Meet the Beatles!": {
+    "Lennon": 1
+   },
+   "UK: Rarities US: Rarities": {
+    "Harrison": 1,
+    "Jean Nicolas": 1,
+    "Lee Montogue": 1,
+    "Lennon": 2,
+    "McCartney": 2
+   },
+   "UK: Rarities US: Something New": {
+    "Heinz Hellmer": 1,
+    "Jean Nicolas": 1,
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Rarities US: The Beatles Second Album": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Revolver US: Yesterday and Today": {
+    "Lennon": 3,
+    "McCartney": 2
+   },
+   "UK: Rubber Soul US: Yesterday and Today": {
+    "Harrison": 1,
+    "Lennon": 3,
+    "McCartney": 3,
+    "Starr": 1
+   },
+   "UK: With the Beatles US: Meet the Beatles!": {
+    "Harrison": 1,
+    "Lennon": 6,
+    "McCartney": 5,
+    "Meredith Willson": 1
+   },
+   "UK: With the Beatles US: The Beatles Second Album": {
+    "Berry Gordy": 1,
+    "Janie Bradford": 1,
+    "Smokey Robinson": 1
+   },
+   "UK: With the Beatles US: The Beatles' Second Album": {
+    "Brian Holland": 1,
+    "Chuck Berry": 1,
+    "Drapkin": 1,
+    "Freddie Gorman": 1,
+    "Georgia Dobbins": 1,
+    "Robert Bateman": 1,
+    "William Garrett": 1
+   },
+   "Unreleased": {
+    "Harrison": 1,
+    "Lennon": 2,
+    "McCartney": 2
+   },
+   "Yellow Submarine": {
+    "Harrison": 2,
+    "Lennon": 2,
+    "McCartney": 1
+   }
+  },
+  "album,vocals": {
+   "Abbey Road": {
+    "Harrison": 5,
+    "Lennon": 7,
+    "McCartney": 11,
+    "Starr": 2
+   },
+   "Anthology 1": {
+    "Eric Morecambe": 1,
+    "Ernie Wise": 1,
+    "Harrison": 6,
+    "Instrumental": 2,
+    "Lennon": 10,
+    "McCartney": 9,
+    "Starr": 1
+   },
+   "Anthology 2": {
+    "Instrumental": 1,
+    "Lennon": 1,
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "Anthology 3": {
+    "Harrison": 2,
+    "Lennon": 3,
+    "McCartney": 5
+   },
+   "Help!": {
+    "Harrison": 1,
+    "Lennon": 4,
+    "McCartney": 3
+   },
+   "Let It Be": {
+    "Harrison": 2,
+    "Lennon": 7,
+    "McCartney": 7
+   },
+   "Let It Be film": {
+    "McCartney": 1
+   },
+   "Let It Be... Naked - Fly on the Wall bonus disc": {
+    "Lennon": 3,
+    "McCartney": 2,
+    "Starr": 1
+   },
+   "Let it Be film": {
+    "McCartney": 1
+   },
+   "Live at the BBC": {
+    "Harrison": 7,
+    "Lennon": 17,
+    "McCartney": 10
+   },
+   "Live! at the Star-Club in Hamburg, Germany; 1962": {
+    "Lennon": 1
+   },
+   "Magical Mystery Tour": {
+    "Harrison": 1,
+    "Instrumental": 2,
+    "Lennon": 5,
+    "McCartney": 5
+   },
+   "N/A": {
+    "Lennon": 1,
+    "N/A": 1
+   },
+   "On Air – Live at the BBC Volume 2": {
+    "McCartney": 1
+   },
+   "Revolver": {
+    "Harrison": 3,
+    "Lennon": 3,
+    "McCartney": 6,
+    "Starr": 1
+   },
+   "Rock 'n' Roll Music": {
+    "McCartney": 1
+   },
+   "Rubber Soul": {
+    "Harrison": 2,
+    "Lennon": 7,
+    "McCartney": 5
+   },
+   "Sgt. Pepper's Lonely Hearts Club Band": {
+    "Harrison": 2,
+    "Lennon": 10,
+    "McCartney": 9,
+    "Starr": 3
+   },
+   "The Beatles": {
+    "Harrison": 4,
+    "Lennon": 11,
+    "McCartney": 13,
+    "Sound Collage": 1,
+    "Starr": 2
+   },
+   "The Beatles Bootleg Recordings 1963": {
+    "Lennon": 2
+   },
+   "The Beatles' Christmas Album": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "UK: \"Long Tall Sally\" EP US: Something New": {
+    "Lennon": 1,
+    "Starr": 1
+   },
+   "UK: \"Long Tall Sally\" EP US: The Beatles' Second Album": {
+    "Lennon": 1
+   },
+   "UK: 1967-1970 US: Hey Jude": {
+    "McCartney": 1
+   },
+   "UK: 1967–1970 US: Hey Jude": {
+    "Harrison": 1,
+    "Lennon": 2,
+    "McCartney": 3
+   },
+   "UK: A Collection of Beatles Oldies US: 1962–1966": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Beatles '65": {
+    "Lennon": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Beatles VI": {
+    "Lennon": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Hey Jude": {
+    "McCartney": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Meet the Beatles!": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Collection of Beatles Oldies US: The Beatles Second Album": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Yesterday and Today": {
+    "Lennon": 2,
+    "McCartney": 2
+   },
+   "UK: A Hard Day's Night US: 1962–1966": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Hard Day's Night US: Beatles '65": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: A Hard Day's Night US: Hey Jude": {
+    "Lennon": 2,
+    "McCartney": 1
+   },
+   "UK: A Hard Day's Night US: Something New": {
+    "Harrison": 1,
+    "Lennon": 5,
+    "McCartney": 3
+   },
+   "UK: A Hard Day's Night US: The Beatles Second Album": {
+    "Lennon": 1
+   },
+   "UK: Beatles for Sale US: Beatles '65": {
+    "Harrison": 1,
+    "Lennon": 6,
+    "McCartney": 3,
+    "Starr": 1
+   },
+   "UK: Beatles for Sale US: Beatles VI": {
+    "Lennon": 4,
+    "McCartney": 6
+   },
+   "UK: Help! US: Beatles VI": {
+    "Harrison": 1,
+    "Lennon": 2,
+    "McCartney": 1
+   },
+   "UK: Help! US: Rubber Soul": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Help! US: Yesterday and Today": {
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "UK: Long Tall Sally EP US: The Beatles' Second Album": {
+    "McCartney": 1
+   },
+   "UK: Past Masters Volume 1 US: The Beatles' Second Album": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Please Please Me US: Introducing… The Beatles": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Please Please Me US: Meet the Beatles!": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Please Please Me US: Rarities": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Please Please Me US: The Early Beatles": {
+    "Harrison": 2,
+    "Lennon": 7,
+    "McCartney": 5,
+    "Starr": 1
+   },
+   "UK: Rarities US: Beatles '65": {
+    "McCartney": 1
+   },
+   "UK: Rarities US: Beatles VI": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Rarities US: Hey Jude": {
+    "Lennon": 1
+   },
+   "UK: Rarities US: Meet the Beatles!": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Rarities US: Rarities": {
+    "Harrison": 1,
+    "Lennon": 2,
+    "McCartney": 2
+   },
+   "UK: Rarities US: Something New": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Rarities US: The Beatles Second Album": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "UK: Revolver US: Yesterday and Today": {
+    "Lennon": 3
+   },
+   "UK: Rubber Soul US: Yesterday and Today": {
+    "Harrison": 2,
+    "Lennon": 2,
+    "McCartney": 2,
+    "Starr": 1
+   },
+   "UK: With the Beatles US: Meet the Beatles!": {
+    "Harrison": 1,
+    "Lennon": 4,
+    "McCartney": 4,
+    "Starr": 1
+   },
+   "UK: With the Beatles US: The Beatles Second Album": {
+    "Harrison": 1,
+    "Lennon": 2
+   },
+   "UK: With the Beatles US: The Beatles' Second Album": {
+    "Harrison": 2,
+    "Lennon": 1
+   },
+   "Unreleased": {
+    "Harrison": 1,
+    "Lennon": 2,
+    "McCartney": 2
+   },
+   "Yellow Submarine": {
+    "Harrison": 2,
+    "Lennon": 1,
+    "McCartney": 2
+   }
+  },
+  "album,year": {
+   "Abbey Road": {
+    "1969": 17
+   },
+   "Anthology 1": {
+    "1958": 2,
+    "1960": 3,
+    "1961": 2,
+    "1962": 7,
+    "1963": 2,
+    "1964": 3,
+    "1977": 1
+   },
+   "Anthology 2": {
+    "1965": 3,
+    "1980": 1
+   },
+   "Anthology 3": {
+    "1968": 4,
+    "1969": 5
+   },
+   "Help!": {
+    "1965": 7
+   },
+   "Let It Be": {
+    "1968": 1,
+    "1969": 10,
+    "1970": 1
+   },
+   "Let It Be film": {
+    "1965": 1
+   },
+   "Let It Be... Naked - Fly on the Wall bonus disc": {
+    "1968": 1,
+    "1969": 3
+   },
+   "Let it Be film": {
+    "1969": 1
+   },
+   "Live at the BBC": {
+    "1963": 29,
+    "1964": 2
+   },
+   "Live! at the Star-Club in Hamburg, Germany; 1962": {
+    "1962": 1
+   },
+   "Magical Mystery Tour": {
+    "1966": 2,
+    "1967": 10
+   },
+   "N/A": {
+    "1962": 1,
+    "1969": 1
+   },
+   "On Air – Live at the BBC Volume 2": {
+    "1963": 1
+   },
+   "Revolver": {
+    "1966": 11
+   },
+   "Rock 'n' Roll Music": {
+    "1965": 1
+   },
+   "Rubber Soul": {
+    "1965": 10
+   },
+   "Sgt. Pepper's Lonely Hearts Club Band": {
+    "1966": 1,
+    "1967": 12
+   },
+   "The Beatles": {
+    "1968": 29
+   },
+   "The Beatles Bootleg Recordings 1963": {
+    "1963": 2
+   },
+   "The Beatles' Christmas Album": {
+    "1967": 1
+   },
+   "UK: \"Long Tall Sally\" EP US: Something New": {
+    "1964": 2
+   },
+   "UK: \"Long Tall Sally\" EP US: The Beatles' Second Album": {
+    "1964": 1
+   },
+   "UK: 1967-1970 US: Hey Jude": {
+    "1968": 1
+   },
+   "UK: 1967–1970 US: Hey Jude": {
+    "1968": 1,
+    "1969": 3
+   },
+   "UK: A Collection of Beatles Oldies US: 1962–1966": {
+    "1963": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Beatles '65": {
+    "1964": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Beatles VI": {
+    "1965": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Hey Jude": {
+    "1966": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Meet the Beatles!": {
+    "1963": 1
+   },
+   "UK: A Collection of Beatles Oldies US: The Beatles Second Album": {
+    "1963": 1
+   },
+   "UK: A Collection of Beatles Oldies US: Yesterday and Today": {
+    "1965": 2
+   },
+   "UK: A Hard Day's Night US: 1962–1966": {
+    "1964": 1
+   },
+   "UK: A Hard Day's Night US: Beatles '65": {
+    "1964": 1
+   },
+   "UK: A Hard Day's Night US: Hey Jude": {
+    "1964": 2
+   },
+   "UK: A Hard Day's Night US: Something New": {
+    "1964": 8
+   },
+   "UK: A Hard Day's Night US: The Beatles Second Album": {
+    "1964": 1
+   },
+   "UK: Beatles for Sale US: Beatles '65": {
+    "1964": 8
+   },
+   "UK: Beatles for Sale US: Beatles VI": {
+    "1964": 6
+   },
+   "UK: Help! US: Beatles VI": {
+    "1965": 3
+   },
+   "UK: Help! US: Rubber Soul": {
+    "1965": 2
+   },
+   "UK: Help! US: Yesterday and Today": {
+    "1965": 2
+   },
+   "UK: Long Tall Sally EP US: The Beatles' Second Album": {
+    "1964": 1
+   },
+   "UK: Past Masters Volume 1 US: The Beatles' Second Album": {
+    "1963": 1
+   },
+   "UK: Please Please Me US: Introducing… The Beatles": {
+    "1963": 1
+   },
+   "UK: Please Please Me US: Meet the Beatles!": {
+    "1963": 1
+   },
+   "UK: Please Please Me US: Rarities": {
+    "1963": 1
+   },
+   "UK: Please Please Me US: The Early Beatles": {
+    "1962": 4,
+    "1963": 7
+   },
+   "UK: Rarities US: Beatles '65": {
+    "1964": 1
+   },
+   "UK: Rarities US: Beatles VI": {
+    "1965": 1
+   },
+   "UK: Rarities US: Hey Jude": {
+    "1966": 1
+   },
+   "UK: Rarities US: Meet the Beatles!": {
+    "1963": 1
+   },
+   "UK: Rarities US: Rarities": {
+    "1964": 1,
+    "1967": 1,
+    "1968": 1
+   },
+   "UK: Rarities US: Something New": {
+    "1964": 1
+   },
+   "UK: Rarities US: The Beatles Second Album": {
+    "1963": 1
+   },
+   "UK: Revolver US: Yesterday and Today": {
+    "1966": 3
+   },
+   "UK: Rubber Soul US: Yesterday and Today": {
+    "1965": 4
+   },
+   "UK: With the Beatles US: Meet the Beatles!": {
+    "1963": 9
+   },
+   "UK: With the Beatles US: The Beatles Second Album": {
+    "1963": 2
+   },
+   "UK: With the Beatles US: The Beatles' Second Album": {
+    "1963": 3
+   },
+   "Unreleased": {
+    "1968": 2,
+    "1969": 1
+   },
+   "Yellow Submarine": {
+    "1967": 3,
+    "1968": 1
+   }
+  },
+  "lead_vocal": {
+   "Harrison": 42,
+   "Instrumental": 5,
+   "Lennon": 141,
+   "McCartney": 100,
+   "N/A": 1,
+   "Sound Collage": 1,
+   "Starr": 13
+  },
+  "lead_vocal,album": {
+   "Harrison": {
+    "Abbey Road": 2,
+    "Anthology 1": 3,
+    "Anthology 3": 2,
+    "Help!": 1,
+    "Let It Be": 2,
+    "Live at the BBC": 7,
+    "Magical Mystery Tour": 1,
+    "Revolver": 3,
+    "Rubber Soul": 1,
+    "The Beatles": 4,
+    "UK: 1967–1970 US: Hey Jude": 1,
+    "UK: A Hard Day's Night US: Something New": 1,
+    "UK: Beatles for Sale US: Beatles '65": 1,
+    "UK: Help! US: Beatles VI": 1,
+    "UK: Please Please Me US: The Early Beatles": 2,
+    "UK: Rarities US: Rarities": 1,
+    "UK: Rubber Soul US: Yesterday and Today": 1,
+    "UK: With the Beatles US: Meet the Beatles!": 1,
+    "UK: With the Beatles US: The Beatles' Second Album": 2,
+    "Unreleased": 1,
+    "Yellow Submarine": 2
+   },
+   "Instrumental": {
+    "Anthology 1": 2,
+    "Anthology 2": 1,
+    "Magical Mystery Tour": 2
+   },
+   "Lennon": {
+    "Abbey Road": 6,
+    "Anthology 1": 10,
+    "Anthology 2": 1,
+    "Anthology 3": 3,
+    "Help!": 4,
+    "Let It Be": 5,
+    "Let It Be... Naked - Fly on the Wall bonus disc": 3,
+    "Live at the BBC": 17,
+    "Live! at the Star-Club in Hamburg, Germany; 1962": 1,
+    "Magical Mystery Tour": 4,
+    "N/A": 1,
+    "Revolver": 2,
+    "Rubber Soul": 5,
+    "Sgt. Pepper's Lonely Hearts Club Band": 5,
+    "The Beatles": 10,
+    "The Beatles Bootleg Recordings 1963": 2,
+    "The Beatles' Christmas Album": 1,
+    "UK: \"Long Tall Sally\" EP US: Something New": 1,
+    "UK: \"Long Tall Sally\" EP US: The Beatles' Second Album": 1,
+    "UK: 1967–1970 US: Hey Jude": 2,
+    "UK: A Collection of Beatles Oldies US: 1962–1966": 1,
+    "UK: A Collection of Beatles Oldies US: Beatles '65": 1,
+    "UK: A Collection of Beatles Oldies US: Beatles VI": 1,
+    "UK: A Collection of Beatles Oldies US: Meet the Beatles!": 1,
+    "UK: A Collection of Beatles Oldies US: The Beatles Second Album": 1,
+    "UK: A Collection of Beatles Oldies US: Yesterday and Today": 1,
+    "UK: A Hard Day's Night US: 1962–1966": 1,
+    "UK: A Hard Day's Night US: Beatles '65": 1,
+    "UK: A Hard Day's Night US: Hey Jude": 1,
+    "UK: A Hard Day's Night US: Something New": 5,
+    "UK: A Hard Day's Night US: The Beatles Second Album": 1,
+    "UK: Beatles for Sale US: Beatles '65": 5,
+    "UK: Beatles for Sale US: Beatles VI": 4,
+    "UK: Help! US: Beatles VI": 1,
+    "UK: Help! US: Rubber Soul": 1,
+    "UK: Past Masters Volume 1 US: The Beatles' Second Album": 1,
+    "UK: Please Please Me US: Introducing… The Beatles": 1,
+    "UK: Please Please Me US: Rarities": 1,
+    "UK: Please Please Me US: The Early Beatles": 5,
+    "UK: Rarities US: Beatles VI": 1,
+    "UK: Rarities US: Hey Jude": 1,
+    "UK: Rarities US: Meet the Beatles!": 1,
+    "UK: Rarities US: Rarities": 2,
+    "UK: Rarities US: Something New": 1,
+    "UK: Rarities US: The Beatles Second Album": 1,
+    "UK: Revolver US: Yesterday and Today": 3,
+    "UK: Rubber Soul US: Yesterday and Today": 1,
+    "UK: With the Beatles US: Meet the Beatles!": 4,
+    "UK: With the Beatles US: The Beatles Second Album": 2,
+    "UK: With the Beatles US: The Beatles' Second Album": 1,
+    "Unreleased": 2,
+    "Yellow Submarine": 1
+   },
+   "McCartney": {
+    "Abbey Road": 8,
+    "Anthology 1": 5,
+    "Anthology 2": 1,
+    "Anthology 3": 4,
+    "Help!": 2,
+    "Let It Be": 5,
+    "Let It Be film": 1,
+    "Let it Be film": 1,
+    "Live at the BBC": 7,
+    "Magical Mystery Tour": 5,
+    "On Air – Live at the BBC Volume 2": 1,
+    "Revolver": 5,
+    "Rock 'n' Roll Music": 1,
+    "Rubber Soul": 4,
+    "Sgt. Pepper's Lonely Hearts Club Band": 7,
+    "The Beatles": 12,
+    "UK: 1967-1970 US: Hey Jude": 1,
+    "UK: 1967–1970 US: Hey Jude": 1,
+    "UK: A Collection of Beatles Oldies US: Hey Jude": 1,
+    "UK: A Collection of Beatles Oldies US: Yesterday and Today": 1,
+    "UK: A Hard Day's Night US: Hey Jude": 1,
+    "UK: A Hard Day's Night US: Something New": 2,
+    "UK: Beatles for Sale US: Beatles '65": 1,
+    "UK: Beatles for Sale US: Beatles VI": 2,
+    "UK: Help! US: Beatles VI": 1,
+    "UK: Help! US: Rubber Soul": 1,
+    "UK: Help! US: Yesterday and Today": 1,
+    "UK: Long Tall Sally EP US: The Beatles' Second Album": 1,
+    "UK: Please Please Me US: Meet the Beatles!": 1,
+    "UK: Please Please Me US: The Early Beatles": 3,
+    "UK: Rarities US: Beatles '65": 1,
+    "UK: Rubber Soul US: Yesterday and Today": 1,
+    "UK: With the Beatles US: Meet the Beatles!": 3,
+    "Unreleased": 1,
+    "Yellow Submarine": 1
+   },
+   "N/A": {
+    "N/A": 1
+   },
+   "Sound Collage": {
+    "The Beatles": 1
+   },
+   "Starr": {
+    "Abbey Road": 1,
+    "Anthology 2": 1,
+    "Let It Be... Naked - Fly on the Wall bonus disc": 1,
+    "Revolver": 1,
+    "Sgt. Pepper's Lonely Hearts Club Band": 1,
+    "The Beatles": 2,
+    "UK: \"Long Tall Sally\" EP US: Something New": 1,
+    "UK: Beatles for Sale US: Beatles '65": 1,
+    "UK: Help! US: Yesterday and Today": 1,
+    "UK: Please Please Me US: The Early Beatles": 1,
+    "UK: Rubber Soul US: Yesterday and Today": 1,
+    "UK: With the Beatles US: Meet the Beatles!": 1
+   }
+  },
+  "lead_vocal,songwriters": {
+   "Harrison": {
+    "Aaron Schroeder": 1,
+    "Boudleaux Bryant": 1,
+    "Buddy Holly": 1,
+    "Carl Perkins": 1,
+    "Carole King": 3,
+    "Charlie Feathers": 1,
+    "Chuck Berry": 1,
+    "Drapkin": 1,
+    "Eddie Fontaine": 1,
+    "Felice": 1,
+    "Francis Wheeler": 1,
+    "Gerry Goffin": 3,
+    "Harrison": 26,
+    "Harry B. Smith": 1,
+    "Jerry Leiber": 2,
+    "Lennon": 2,
+    "McCartney": 1,
+    "Mike Stoller": 2,
+    "Roy C. Bennett": 1,
+    "Sid Tepper": 1,
+    "Stan Kesler": 1,
+    "Ted Snyder": 1
+   },
+   "Instrumental": {
+    "Harrison": 4,
+    "Lennon": 4,
+    "McCartney": 4,
+    "Starr": 3
+   },
+   "Lennon": {
+    "Al Mortimer": 1,
+    "Arthur Alexander": 1,
+    "Ben Weisman": 1,
+    "Berry Gordy": 1,
+    "Bert Berns": 1,
+    "Bill Katz": 1,
+    "Brian Holland": 1,
+    "Buddy Holly": 2,
+    "Burt Bacharach": 1,
+    "Buzz Cason": 1,
+    "Carl Perkins": 1,
+    "Carole King": 1,
+    "Charles Calhoun": 1,
+    "Chuck Berry": 8,
+    "Dorsey Burnette": 1,
+    "Edward Madden": 1,
+    "Fred Wise": 1,
+    "Freddie Gorman": 1,
+    "Georgia Dobbins": 1,
+    "Gerry Goffin": 1,
+    "Hal David": 1,
+    "Harrison": 5,
+    "Heinz Hellmer": 1,
+    "Howard Biggs": 1,
+    "Jack Yellen": 1,
+    "James McDougall": 1,
+    "Janie Bradford": 1,
+    "Jean Nicolas": 2,
+    "Jerry Allison": 1,
+    "Jerry Leiber": 1,
+    "Joe Thomas": 1,
+    "John Marascalco": 1,
+    "Johnny Burnette": 1,
+    "Kay Twomey": 1,
+    "Kent Westberry": 1,
+    "Larry Williams": 3,
+    "Lee Montogue": 1,
+    "Lennon": 100,
+    "Little Willie John": 1,
+    "Luther Dixon": 1,
+    "Marijohn Wilkin": 1,
+    "McCartney": 42,
+    "Mike Stoller": 1,
+    "Milton Ager": 1,
+    "Mitch Murray": 1,
+    "Norman Petty": 1,
+    "O'Kelly Isley Jr.": 1,
+    "Paul Burlison": 1,
+    "Percy Wenrich": 1,
+    "Phil Medley": 1,
+    "Phil Spector": 1,
+    "Ray Charles": 1,
+    "Richie Barrett": 1,
+    "Robert Bateman": 1,
+    "Robert Blackwell": 1,
+    "Ronald Isley": 1,
+    "Roy Lee Johnson": 1,
+    "Rudolph Isley": 1,
+    "Ruth Roberts": 1,
+    "Smokey Robinson": 1,
+    "Stanley Clayton": 1,
+    "Starr": 4,
+    "Terry Thompson": 1,
+    "Titus Turner": 1,
+    "Tony Moon": 1,
+    "Traditional": 1,
+    "William Garrett": 1
+   },
+   "McCartney": {
+    "Al Dubin": 1,
+    "Albert Collins": 1,
+    "Arthur Crudup": 1,
+    "Bill Cantrell": 1,
+    "Bobby Scott": 1,
+    "Carl Perkins": 1,
+    "Chan Romero": 1,
+    "Consuelo Velázquez": 1,
+    "Enotris Johnson": 1,
+    "Harrison": 1,
+    "Harry Warren": 1,
+    "Jerry Leiber": 2,
+    "Lennon": 24,
+    "Little Richard": 4,
+    "McCartney": 84,
+    "Meredith Willson": 1,
+    "Mike Pingitore": 1,
+    "Mike Stoller": 2,
+    "Mikis Theodorakis": 1,
+    "Quinton Claunch": 1,
+    "Ray Charles": 1,
+    "Ric Marlow": 1,
+    "Robert \"Bumps\" Blackwell": 1,
+    "Sansom": 1,
+    "Starr": 2,
+    "Stephen Foster": 1,
+    "Sunny Skylar": 1
+   },
+   "N/A": {
+    "McCartney": 1
+   },
+   "Sound Collage": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "Ono": 1
+   },
+   "Starr": {
+    "Blind Lemon Jefferson": 1,
+    "Carl Perkins": 2,
+    "Johnny Russell": 1,
+    "Lennon": 6,
+    "Luther Dixon": 1,
+    "McCartney": 5,
+    "Starr": 4,
+    "Voni Morrison": 1,
+    "Wes Farrell": 1
+   }
+  },
+  "lead_vocal,vocals": {
+   "Harrison": {
+    "Harrison": 42,
+    "Lennon": 2,
+    "McCartney": 3
+   },
+   "Instrumental": {
+    "Instrumental": 5
+   },
+   "Lennon": {
+    "Eric Morecambe": 1,
+    "Ernie Wise": 1,
+    "Harrison": 11,
+    "Lennon": 141,
+    "McCartney": 48,
+    "Starr": 2
+   },
+   "McCartney": {
+    "Harrison": 3,
+    "Lennon": 18,
+    "McCartney": 100,
+    "Starr": 3
+   },
+   "N/A": {
+    "N/A": 1
+   },
+   "Sound Collage": {
+    "Sound Collage": 1
+   },
+   "Starr": {
+    "Lennon": 1,
+    "McCartney": 1,
+    "Starr": 13
+   }
+  },
+  "lead_vocal,year": {
+   "Harrison": {
+    "1962": 3,
+    "1963": 11,
+    "1964": 4,
+    "1965": 4,
+    "1966": 3,
+    "1967": 3,
+    "1968": 8,
+    "1969": 5,
+    "1970": 1
+   },
+   "Instrumental": {
+    "1960": 1,
+    "1961": 1,
+    "1965": 1,
+    "1967": 2
+   },
+   "Lennon": {
+    "1958": 2,
+    "1961": 1,
+    "1962": 6,
+    "1963": 38,
+    "1964": 26,
+    "1965": 15,
+    "1966": 7,
+    "1967": 10,
+    "1968": 14,
+    "1969": 19,
+    "1977": 1,
+    "1980": 1
+   },
+   "McCartney": {
+    "1960": 2,
+    "1962": 8,
+    "1963": 13,
+    "1964": 9,
+    "1965": 14,
+    "1966": 8,
+    "1967": 11,
+    "1968": 18,
+    "1969": 17
+   },
+   "N/A": {
+    "1962": 1
+   },
+   "Sound Collage": {
+    "1968": 1
+   },
+   "Starr": {
+    "1963": 2,
+    "1964": 2,
+    "1965": 3,
+    "1966": 1,
+    "1967": 1,
+    "1968": 2,
+    "1969": 2
+   }
+  },
+  "songwriters": {
+   "Aaron Schroeder": 1,
+   "Al Dubin": 1,
+   "Al Mortimer": 1,
+   "Albert Collins": 1,
+   "Arthur Alexander": 1,
+   "Arthur Crudup": 1,
+   "Ben Weisman": 1,
+   "Berry Gordy": 1,
+   "Bert Berns": 1,
+   "Bill Cantrell": 1,
+   "Bill Katz": 1,
+   "Blind Lemon Jefferson": 1,
+   "Bobby Scott": 1,
+   "Boudleaux Bryant": 1,
+   "Brian Holland": 1,
+   "Buddy Holly": 3,
+   "Burt Bacharach": 1,
+   "Buzz Cason": 1,
+   "Carl Perkins": 5,
+   "Carole King": 4,
+   "Chan Romero": 1,
+   "Charles Calhoun": 1,
+   "Charlie Feathers": 1,
+   "Chuck Berry": 9,
+   "Consuelo Velázquez": 1,
+   "Dorsey Burnette": 1,
+   "Drapkin": 1,
+   "Eddie Fontaine": 1,
+   "Edward Madden": 1,
+   "Enotris Johnson": 1,
+   "Felice": 1,
+   "Francis Wheeler": 1,
+   "Fred Wise": 1,
+   "Freddie Gorman": 1,
+   "Georgia Dobbins": 1,
+   "Gerry Goffin": 4,
+   "Hal David": 1,
+   "Harrison": 37,
+   "Harry B. Smith": 1,
+   "Harry Warren": 1,
+   "Heinz Hellmer": 1,
+   "Howard Biggs": 1,
+   "Jack Yellen": 1,
+   "James McDougall": 1,
+   "Janie Bradford": 1,
+   "Jean Nicolas": 2,
+   "Jerry Allison": 1,
+   "Jerry Leiber": 5,
+   "Joe Thomas": 1,
+   "John Marascalco": 1,
+   "Johnny Burnette": 1,
+   "Johnny Russell": 1,
+   "Kay Twomey": 1,
+   "Kent Westberry": 1,
+   "Larry Williams": 3,
+   "Lee Montogue": 1,
+   "Lennon": 137,
+   "Little Richard": 4,
+   "Little Willie John": 1,
+   "Luther Dixon": 2,
+   "Marijohn Wilkin": 1,
+   "McCartney": 137,
+   "Meredith Willson": 1,
+   "Mike Pingitore": 1,
+   "Mike Stoller": 5,
+   "Mikis Theodorakis": 1,
+   "Milton Ager": 1,
+   "Mitch Murray": 1,
+   "Norman Petty": 1,
+   "O'Kelly Isley Jr.": 1,
+   "Ono": 1,
+   "Paul Burlison": 1,
+   "Percy Wenrich": 1,
+   "Phil Medley": 1,
+   "Phil Spector": 1,
+   "Quinton Claunch": 1,
+   "Ray Charles": 2,
+   "Ric Marlow": 1,
+   "Richie Barrett": 1,
+   "Robert \"Bumps\" Blackwell": 1,
+   "Robert Bateman": 1,
+   "Robert Blackwell": 1,
+   "Ronald Isley": 1,
+   "Roy C. Bennett": 1,
+   "Roy Lee Johnson": 1,
+   "Rudolph Isley": 1,
+   "Ruth Roberts": 1,
+   "Sansom": 1,
+   "Sid Tepper": 1,
+   "Smokey Robinson": 1,
+   "Stan Kesler": 1,
+   "Stanley Clayton": 1,
+   "Starr": 13,
+   "Stephen Foster": 1,
+   "Sunny Skylar": 1,
+   "Ted Snyder": 1,
+   "Terry Thompson": 1,
+   "Titus Turner": 1,
+   "Tony Moon": 1,
+   "Traditional": 1,
+   "Voni Morrison": 1,
+   "Wes Farrell": 1,
+   "William Garrett": 1
+  },
+  "songwriters,album": {
+   "Aaron Schroeder": {
+    "Live at the BBC": 1
+   },
+   "Al Dubin": {},
+   "Al Mortimer": {
+    "Live at the BBC": 1
+   },
+   "Albert Collins": {
+    "Live at the BBC": 1
+   },
+   "Arthur Alexander": {
+    "UK: Please Please Me US: The Early Beatles": 1
+   },
+   "Arthur Crudup": {
+    "Live at the BBC": 1
+   },
+   "Ben Weisman": {
+    "Anthology 1": 1
+   },
+   "Berry Gordy": {
+    "UK: With the Beatles US: The Beatles Second Album": 1
+   },
+   "Bert Berns": {
+    "UK: Please Please Me US: The Early Beatles": 1
+   },
+   "Bill Cantrell": {
+    "Live at the BBC": 1
+   },
+   "Bill Katz": {
+    "Anthology 3": 1
+   },
+   "Blind Lemon Jefferson": {
+    "UK: \"Long Tall Sally\" EP US: Something New": 1
+   },
+   "Bobby Scott": {
+    "UK: Please Please Me US: The Early Beatles": 1
+   },
+   "Boudleaux Bryant": {
+    "Live at the BBC": 1
+   },
+   "Brian Holland": {
+    "UK: With the Beatles US: The Beatles' Second Album": 1
+   },
+   "Buddy Holly": {
+    "Anthology 1": 1,
+    "Live at the BBC": 1,
+    "UK: Beatles for Sale US: Beatles VI": 1
+   },
+   "Burt Bacharach": {
+    "UK: Please Please Me US: The Early Beatles": 1
+   },
+   "Buzz Cason": {
+    "Live at the BBC": 1
+   },
+   "Carl Perkins": {
+    "Anthology 3": 1,
+    "Live at the BBC": 1,
+    "UK: \"Long Tall Sally\" EP US: Something New": 1,
+    "UK: Beatles for Sale US: Beatles '65": 2
+   },
+   "Carole King": {
+    "Live at the BBC": 2,
+    "UK: Please Please Me US: The Early Beatles": 1
+   },
+   "Chan Romero": {
+    "Live at the BBC": 1
+   },
+   "Charles Calhoun": {
+    "Anthology 3": 1
+   },
+   "Charlie Feathers": {
+    "Live at the BBC": 1
+   },
+   "Chuck Berry": {
+    "Live at the BBC": 6,
+    "Live! at the Star-Club in Hamburg, Germany; 1962": 1,
+    "UK: Beatles for Sale US: Beatles '65": 1,
+    "UK: With the Beatles US: The Beatles' Second Album": 1
+   },
+   "Consuelo Velázquez": {
+    "Anthology 1": 1
+   },
+   "Dorsey Burnette": {
+    "Live at the BBC": 1
+   },
+   "Drapkin": {
+    "UK: With the Beatles US: The Beatles' Second Album": 1
+   },
+   "Eddie Fontaine": {
+    "Live at the BBC": 1
+   },
+   "Edward Madden": {
+    "Anthology 1": 1
+   },
+   "Enotris Johnson": {
+    "UK: Long Tall Sally EP US: The Beatles' Second Album": 1
+   },
+   "Felice": {
+    "Live at the BBC": 1
+   },
+   "Francis Wheeler": {
+    "Anthology 1": 1
+   },
+   "Fred Wise": {
+    "Anthology 1": 1
+   },
+   "Freddie Gorman": {
+    "UK: With the Beatles US: The Beatles' Second Album": 1
+   },
+   "Georgia Dobbins": {
+    "UK: With the Beatles US: The Beatles' Second Album": 1
+   },
+   "Gerry Goffin": {
+    "Live at the BBC": 2,
+    "UK: Please Please Me US: The Early Beatles": 1
+   },
+   "Hal David": {
+    "UK: Please Please Me US: The Early Beatles": 1
+   },
+   "Harrison": {
+    "Abbey Road": 2,
+    "Anthology 1": 4,
+    "Anthology 2": 1,
+    "Anthology 3": 3,
+    "Help!": 1,
+    "Let It Be": 4,
+    "Magical Mystery Tour": 3,
+    "Revolver": 3,
+    "Rubber Soul": 1,
+    "The Beatles": 5,
+    "The Beatles' Christmas Album": 1,
+    "UK: 1967–1970 US: Hey Jude": 1,
+    "UK: Help! US: Beatles VI": 1,
+    "UK: Rarities US: Rarities": 1,
+    "UK: Rubber Soul US: Yesterday and Today": 1,
+    "UK: With the Beatles US: Meet the Beatles!": 1,
+    "Unreleased": 1,
+    "Yellow Submarine": 2
+   },
+   "Harry B. Smith": {
+    "Anthology 1": 1
+   },
+   "Harry Warren": {},
+   "Heinz Hellmer": {
+    "UK: Rarities US: Something New": 1
+   },
+   "Howard Biggs": {
+    "Live at the BBC": 1
+   },
+   "Jack Yellen": {
+    "Anthology 1": 1
+   },
+   "James McDougall": {
+    "Anthology 1": 1
+   },
+   "Janie Bradford": {
+    "UK: With the Beatles US: The Beatles Second Album": 1
+   },
+   "Jean Nicolas": {
+    "UK: Rarities US: Rarities": 1,
+    "UK: Rarities US: Something New": 1
+   },
+   "Jerry Allison": {
+    "Anthology 1": 1
+   },
+   "Jerry Leiber": {
+    "Anthology 1": 2,
+    "Live at the BBC": 2,
+    "UK: Beatles for Sale US: Beatles VI": 1
+   },
+   "Joe Thomas": {
+    "Live at the BBC": 1
+   },
+   "John Marascalco": {
+    "Anthology 3": 1
+   },
+   "Johnny Burnette": {
+    "Live at the BBC": 1
+   },
+   "Johnny Russell": {
+    "UK: Help! US: Yesterday and Today": 1
+   },
+   "Kay Twomey": {
+    "Anthology 1": 1
+   },
+   "Kent Westberry": {
+    "Live at the BBC": 1
+   },
+   "Larry Williams": {
+    "UK: \"Long Tall Sally\" EP US: Something New": 1,
+    "UK: A Collection of Beatles Oldies US: Beatles VI": 1,
+    "UK: Help! US: Beatles VI": 1
+   },
+   "Lee Montogue": {
+    "UK: Rarities US: Rarities": 1
+   },
+   "Lennon": {
+    "Abbey Road": 6,
+    "Anthology 1": 4,
+    "Anthology 2": 3,
+    "Anthology 3": 2,
+    "Help!": 4,
+    "Let It Be": 6,
+    "Let It Be... Naked - Fly on the Wall bonus disc": 3,
+    "Live at the BBC": 1,
+    "Magical Mystery Tour": 7,
+    "N/A": 1,
+    "Revolver": 5,
+    "Rubber Soul": 7,
+    "Sgt. Pepper's Lonely Hearts Club Band": 8,
+    "The Beatles": 14,
+    "The Beatles Bootleg Recordings 1963": 2,
+    "The Beatles' Christmas Album": 1,
+    "UK: \"Long Tall Sally\" EP US: The Beatles' Second Album": 1,
+    "UK: 1967-1970 US: Hey Jude": 1,
+    "UK: 1967–1970 US: Hey Jude": 2,
+    "UK: A Collection of Beatles Oldies US: 1962–1966": 1,
+    "UK: A Collection of Beatles Oldies US: Beatles '65": 1,
+    "UK: A Collection of Beatles Oldies US: Meet the Beatles!": 1,
+    "UK: A Collection of Beatles Oldies US: The Beatles Second Album": 1,
+    "UK: A Collection of Beatles Oldies US: Yesterday and Today": 2,
+    "UK: A Hard Day's Night US: 1962–1966": 1,
+    "UK: A Hard Day's Night US: Beatles '65": 1,
+    "UK: A Hard Day's Night US: Hey Jude": 1,
+    "UK: A Hard Day's Night US: Something New": 7,
+    "UK: A Hard Day's Night US: The Beatles Second Album": 1,
+    "UK: Beatles for Sale US: Beatles '65": 3,
+    "UK: Beatles for Sale US: Beatles VI": 2,
+    "UK: Help! US: Beatles VI": 1,
+    "UK: Help! US: Rubber Soul": 1,
+    "UK: Past Masters Volume 1 US: The Beatles' Second Album": 1,
+    "UK: Please Please Me US: Introducing… The Beatles": 1,
+    "UK: Please Please Me US: Meet the Beatles!": 1,
+    "UK: Please Please Me US: Rarities": 1,
+    "UK: Please Please Me US: The Early Beatles": 5,
+    "UK: Rarities US: Beatles '65": 1,
+    "UK: Rarities US: Beatles VI": 1,
+    "UK: Rarities US: Hey Jude": 1,
+    "UK: Rarities US: Meet the Beatles!": 1,
+    "UK: Rarities US: Rarities": 2,
+    "UK: Rarities US: Something New": 1,
+    "UK: Rarities US: The Beatles Second Album": 1,
+    "UK: Revolver US: Yesterday and Today": 3,
+    "UK: Rubber Soul US: Yesterday and Today": 3,
+    "UK: With the Beatles US: Meet the Beatles!": 6,
+    "Unreleased": 2,
+    "Yellow Submarine": 2
+   },
+   "Little Richard": {
+    "Live at the BBC": 2,
+    "UK: Beatles for Sale US: Beatles VI": 1,
+    "UK: Long Tall Sally EP US: The Beatles' Second Album": 1
+   },
+   "Little Willie John": {
+    "Anthology 1": 1
+   },
+   "Luther Dixon": {
+    "UK: Please Please Me US: The Early Beatles": 2
+   },
+   "Marijohn Wilkin": {
+    "Live at the BBC": 1
+   },
+   "McCartney": {
+    "Abbey Road": 8,
+    "Anthology 1": 5,
+    "Anthology 2": 3,
+    "Anthology 3": 4,
+    "Help!": 3,
+    "Let It Be": 7,
+    "Let It Be film": 1,
+    "Let It Be... Naked - Fly on the Wall bonus disc": 2,
+    "Let it Be film": 1,
+    "Live at the BBC": 2,
+    "Magical Mystery Tour": 8,
+    "N/A": 1,
+    "Revolver": 6,
+    "Rock 'n' Roll Music": 1,
+    "Rubber Soul": 8,
+    "Sgt. Pepper's Lonely Hearts Club Band": 9,
+    "The Beatles": 12,
+    "The Beatles' Christmas Album": 1,
+    "UK: 1967-1970 US: Hey Jude": 1,
+    "UK: 1967–1970 US: Hey Jude": 1,
+    "UK: A Collection of Beatles Oldies US: 1962–1966": 1,
+    "UK: A Collection of Beatles Oldies US: Hey Jude": 1,
+    "UK: A Collection of Beatles Oldies US: Meet the Beatles!": 1,
+    "UK: A Collection of Beatles Oldies US: The Beatles Second Album": 1,
+    "UK: A Collection of Beatles Oldies US: Yesterday and Today": 2,
+    "UK: A Hard Day's Night US: 1962–1966": 1,
+    "UK: A Hard Day's Night US: Hey Jude": 1,
+    "UK: A Hard Day's Night US: Something New": 4,
+    "UK: Beatles for Sale US: Beatles '65": 3,
+    "UK: Beatles for Sale US: Beatles VI": 3,
+    "UK: Help! US: Beatles VI": 1,
+    "UK: Help! US: Rubber Soul": 1,
+    "UK: Help! US: Yesterday and Today": 1,
+    "UK: Past Masters Volume 1 US: The Beatles' Second Album": 1,
+    "UK: Please Please Me US: Introducing… The Beatles": 1,
+    "UK: Please Please Me US: Meet the Beatles!": 1,
+    "UK: Please Please Me US: Rarities": 1,
+    "UK: Please Please Me US: The Early Beatles": 3,
+    "UK: Rarities US: Beatles '65": 1,
+    "UK: Rarities US: Rarities": 2,
+    "UK: Rarities US: Something New": 1,
+    "UK: Rarities US: The Beatles Second Album": 1,
+    "UK: Revolver US: Yesterday and Today": 2,
+    "UK: Rubber Soul US: Yesterday and Today": 3,
+    "UK: With the Beatles US: Meet the Beatles!": 5,
+    "Unreleased": 2,
+    "Yellow Submarine": 1
+   },
+   "Meredith Willson": {
+    "UK: With the Beatles US: Meet the Beatles!": 1
+   },
+   "Mike Pingitore": {
+    "Live at the BBC": 1
+   },
+   "Mike Stoller": {
+    "Anthology 1": 2,
+    "Live at the BBC": 2,
+    "UK: Beatles for Sale US: Beatles VI": 1
+   },
+   "Mikis Theodorakis": {
+    "Live at the BBC": 1
+   },
+   "Milton Ager": {
+    "Anthology 1": 1
+   },
+   "Mitch Murray": {
+    "Anthology 1": 1
+   },
+   "Norman Petty": {
+    "Anthology 1": 1
+   },
+   "O'Kelly Isley Jr.": {
+    "Anthology 1": 1
+   },
+   "Ono": {
+    "The Beatles": 1
+   },
+   "Paul Burlison": {
+    "Live at the BBC": 1
+   },
+   "Percy Wenrich": {
+    "Anthology 1": 1
+   },
+   "Phil Medley": {
+    "UK: Please Please Me US: The Early Beatles": 1
+   },
+   "Phil Spector": {
+    "Live at the BBC": 1
+   },
+   "Quinton Claunch": {
+    "Live at the BBC": 1
+   },
+   "Ray Charles": {
+    "Anthology 1": 1,
+    "Live at the BBC": 1
+   },
+   "Ric Marlow": {
+    "UK: Please Please Me US: The Early Beatles": 1
+   },
+   "Richie Barrett": {
+    "Live at the BBC": 1
+   },
+   "Robert \"Bumps\" Blackwell": {
+    "UK: Long Tall Sally EP US: The Beatles' Second Album": 1
+   },
+   "Robert Bateman": {
+    "UK: With the Beatles US: The Beatles' Second Album": 1
+   },
+   "Robert Blackwell": {
+    "Anthology 3": 1
+   },
+   "Ronald Isley": {
+    "Anthology 1": 1
+   },
+   "Roy C. Bennett": {
+    "Live at the BBC": 1
+   },
+   "Roy Lee Johnson": {
+    "UK: Beatles for Sale US: Beatles '65": 1
+   },
+   "Rudolph Isley": {
+    "Anthology 1": 1
+   },
+   "Ruth Roberts": {
+    "Anthology 3": 1
+   },
+   "Sansom": {
+    "Live at the BBC": 1
+   },
+   "Sid Tepper": {
+    "Live at the BBC": 1
+   },
+   "Smokey Robinson": {
+    "UK: With the Beatles US: The Beatles Second Album": 1
+   },
+   "Stan Kesler": {
+    "Live at the BBC": 1
+   },
+   "Stanley Clayton": {
+    "Anthology 3": 1
+   },
+   "Starr": {
+    "Abbey Road": 1,
+    "Anthology 1": 1,
+    "Anthology 2": 1,
+    "Anthology 3": 1,
+    "Let It Be": 2,
+    "Let It Be... Naked - Fly on the Wall bonus disc": 1,
+    "Let it Be film": 1,
+    "Magical Mystery Tour": 2,
+    "The Beatles": 1,
+    "The Beatles' Christmas Album": 1,
+    "UK: Rubber Soul US: Yesterday and Today": 1
+   },
+   "Stephen Foster": {
+    "On Air – Live at the BBC Volume 2": 1
+   },
+   "Sunny Skylar": {
+    "Anthology 1": 1
+   },
+   "Ted Snyder": {
+    "Anthology 1": 1
+   },
+   "Terry Thompson": {
+    "Live at the BBC": 1
+   },
+   "Titus Turner": {
+    "Anthology 1": 1
+   },
+   "Tony Moon": {
+    "Live at the BBC": 1
+   },
+   "Traditional": {
+    "Let It Be": 1
+   },
+   "Voni Morrison": {
+    "UK: Help! US: Yesterday and Today": 1
+   },
+   "Wes Farrell": {
+    "UK: Please Please Me US: The Early Beatles": 1
+   },
+   "William Garrett": {
+    "UK: With the Beatles US: The Beatles' Second Album": 1
+   }
+  },
+  "songwriters,lead_vocal": {
+   "Aaron Schroeder": {
+    "Harrison": 1
+   },
+   "Al Dubin": {
+    "McCartney": 1
+   },
+   "Al Mortimer": {
+    "Lennon": 1
+   },
+   "Albert Collins": {
+    "McCartney": 1
+   },
+   "Arthur Alexander": {
+    "Lennon": 1
+   },
+   "Arthur Crudup": {
+    "McCartney": 1
+   },
+   "Ben Weisman": {
+    "Lennon": 1
+   },
+   "Berry Gordy": {
+    "Lennon": 1
+   },
+   "Bert Berns": {
+    "Lennon": 1
+   },
+   "Bill Cantrell": {
+    "McCartney": 1
+   },
+   "Bill Katz": {
+    "Lennon": 1
+   },
+   "Blind Lemon Jefferson": {
+    "Starr": 1
+   },
+   "Bobby Scott": {
+    "McCartney": 1
+   },
+   "Boudleaux Bryant": {
+    "Harrison": 1
+   },
+   "Brian Holland": {
+    "Lennon": 1
+   },
+   "Buddy Holly": {
+    "Harrison": 1,
+    "Lennon": 2
+   },
+   "Burt Bacharach": {
+    "Lennon": 1
+   },
+   "Buzz Cason": {
+    "Lennon": 1
+   },
+   "Carl Perkins": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1,
+    "Starr": 2
+   },
+   "Carole King": {
+    "Harrison": 3,
+    "Lennon": 1
+   },
+   "Chan Romero": {
+    "McCartney": 1
+   },
+   "Charles Calhoun": {
+    "Lennon": 1
+   },
+   "Charlie Feathers": {
+    "Harrison": 1
+   },
+   "Chuck Berry": {
+    "Harrison": 1,
+    "Lennon": 8
+   },
+   "Consuelo Velázquez": {
+    "McCartney": 1
+   },
+   "Dorsey Burnette": {
+    "Lennon": 1
+   },
+   "Drapkin": {
+    "Harrison": 1
+   },
+   "Eddie Fontaine": {
+    "Harrison": 1
+   },
+   "Edward Madden": {
+    "Lennon": 1
+   },
+   "Enotris Johnson": {
+    "McCartney": 1
+   },
+   "Felice": {
+    "Harrison": 1
+   },
+   "Francis Wheeler": {
+    "Harrison": 1
+   },
+   "Fred Wise": {
+    "Lennon": 1
+   },
+   "Freddie Gorman": {
+    "Lennon": 1
+   },
+   "Georgia Dobbins": {
+    "Lennon": 1
+   },
+   "Gerry Goffin": {
+    "Harrison": 3,
+    "Lennon": 1
+   },
+   "Hal David": {
+    "Lennon": 1
+   },
+   "Harrison": {
+    "Harrison": 26,
+    "Instrumental": 4,
+    "Lennon": 5,
+    "McCartney": 1,
+    "Sound Collage": 1
+   },
+   "Harry B. Smith": {
+    "Harrison": 1
+   },
+   "Harry Warren": {
+    "McCartney": 1
+   },
+   "Heinz Hellmer": {
+    "Lennon": 1
+   },
+   "Howard Biggs": {
+    "Lennon": 1
+   },
+   "Jack Yellen": {
+    "Lennon": 1
+   },
+   "James McDougall": {
+    "Lennon": 1
+   },
+   "Janie Bradford": {
+    "Lennon": 1
+   },
+   "Jean Nicolas": {
+    "Lennon": 2
+   },
+   "Jerry Allison": {
+    "Lennon": 1
+   },
+   "Jerry Leiber": {
+    "Harrison": 2,
+    "Lennon": 1,
+    "McCartney": 2
+   },
+   "Joe Thomas": {
+    "Lennon": 1
+   },
+   "John Marascalco": {
+    "Lennon": 1
+   },
+   "Johnny Burnette": {
+    "Lennon": 1
+   },
+   "Johnny Russell": {
+    "Starr": 1
+   },
+   "Kay Twomey": {
+    "Lennon": 1
+   },
+   "Kent Westberry": {
+    "Lennon": 1
+   },
+   "Larry Williams": {
+    "Lennon": 3
+   },
+   "Lee Montogue": {
+    "Lennon": 1
+   },
+   "Lennon": {
+    "Harrison": 2,
+    "Instrumental": 4,
+    "Lennon": 100,
+    "McCartney": 24,
+    "Sound Collage": 1,
+    "Starr": 6
+   },
+   "Little Richard": {
+    "McCartney": 4
+   },
+   "Little Willie John": {
+    "Lennon": 1
+   },
+   "Luther Dixon": {
+    "Lennon": 1,
+    "Starr": 1
+   },
+   "Marijohn Wilkin": {
+    "Lennon": 1
+   },
+   "McCartney": {
+    "Harrison": 1,
+    "Instrumental": 4,
+    "Lennon": 42,
+    "McCartney": 84,
+    "N/A": 1,
+    "Starr": 5
+   },
+   "Meredith Willson": {
+    "McCartney": 1
+   },
+   "Mike Pingitore": {
+    "McCartney": 1
+   },
+   "Mike Stoller": {
+    "Harrison": 2,
+    "Lennon": 1,
+    "McCartney": 2
+   },
+   "Mikis Theodorakis": {
+    "McCartney": 1
+   },
+   "Milton Ager": {
+    "Lennon": 1
+   },
+   "Mitch Murray": {
+    "Lennon": 1
+   },
+   "Norman Petty": {
+    "Lennon": 1
+   },
+   "O'Kelly Isley Jr.": {
+    "Lennon": 1
+   },
+   "Ono": {
+    "Sound Collage": 1
+   },
+   "Paul Burlison": {
+    "Lennon": 1
+   },
+   "Percy Wenrich": {
+    "Lennon": 1
+   },
+   "Phil Medley": {
+    "Lennon": 1
+   },
+   "Phil Spector": {
+    "Lennon": 1
+   },
+   "Quinton Claunch": {
+    "McCartney": 1
+   },
+   "Ray Charles": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Ric Marlow": {
+    "McCartney": 1
+   },
+   "Richie Barrett": {
+    "Lennon": 1
+   },
+   "Robert \"Bumps\" Blackwell": {
+    "McCartney": 1
+   },
+   "Robert Bateman": {
+    "Lennon": 1
+   },
+   "Robert Blackwell": {
+    "Lennon": 1
+   },
+   "Ronald Isley": {
+    "Lennon": 1
+   },
+   "Roy C. Bennett": {
+    "Harrison": 1
+   },
+   "Roy Lee Johnson": {
+    "Lennon": 1
+   },
+   "Rudolph Isley": {
+    "Lennon": 1
+   },
+   "Ruth Roberts": {
+    "Lennon": 1
+   },
+   "Sansom": {
+    "McCartney": 1
+   },
+   "Sid Tepper": {
+    "Harrison": 1
+   },
+   "Smokey Robinson": {
+    "Lennon": 1
+   },
+   "Stan Kesler": {
+    "Harrison": 1
+   },
+   "Stanley Clayton": {
+    "Lennon": 1
+   },
+   "Starr": {
+    "Instrumental": 3,
+    "Lennon": 4,
+    "McCartney": 2,
+    "Starr": 4
+   },
+   "Stephen Foster": {
+    "McCartney": 1
+   },
+   "Sunny Skylar": {
+    "McCartney": 1
+   },
+   "Ted Snyder": {
+    "Harrison": 1
+   },
+   "Terry Thompson": {
+    "Lennon": 1
+   },
+   "Titus Turner": {
+    "Lennon": 1
+   },
+   "Tony Moon": {
+    "Lennon": 1
+   },
+   "Traditional": {
+    "Lennon": 1
+   },
+   "Voni Morrison": {
+    "Starr": 1
+   },
+   "Wes Farrell": {
+    "Starr": 1
+   },
+   "William Garrett": {
+    "Lennon": 1
+   }
+  },
+  "songwriters,vocals": {
+   "Aaron Schroeder": {
+    "Harrison": 1
+   },
+   "Al Dubin": {
+    "McCartney": 1
+   },
+   "Al Mortimer": {
+    "Lennon": 1
+   },
+   "Albert Collins": {
+    "McCartney": 1
+   },
+   "Arthur Alexander": {
+    "Lennon": 1
+   },
+   "Arthur Crudup": {
+    "McCartney": 1
+   },
+   "Ben Weisman": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Berry Gordy": {
+    "Lennon": 1
+   },
+   "Bert Berns": {
+    "Lennon": 1
+   },
+   "Bill Cantrell": {
+    "McCartney": 1
+   },
+   "Bill Katz": {
+    "Lennon": 1
+   },
+   "Blind Lemon Jefferson": {
+    "Starr": 1
+   },
+   "Bobby Scott": {
+    "McCartney": 1
+   },
+   "Boudleaux Bryant": {
+    "Harrison": 1
+   },
+   "Brian Holland": {
+    "Lennon": 1
+   },
+   "Buddy Holly": {
+    "Harrison": 1,
+    "Lennon": 2,
+    "McCartney": 1
+   },
+   "Burt Bacharach": {
+    "Lennon": 1
+   },
+   "Buzz Cason": {
+    "Lennon": 1
+   },
+   "Carl Perkins": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 2,
+    "Starr": 2
+   },
+   "Carole King": {
+    "Harrison": 3,
+    "Lennon": 2,
+    "McCartney": 2
+   },
+   "Chan Romero": {
+    "McCartney": 1
+   },
+   "Charles Calhoun": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Charlie Feathers": {
+    "Harrison": 1
+   },
+   "Chuck Berry": {
+    "Harrison": 1,
+    "Lennon": 8
+   },
+   "Consuelo Velázquez": {
+    "McCartney": 1
+   },
+   "Dorsey Burnette": {
+    "Lennon": 1
+   },
+   "Drapkin": {
+    "Harrison": 1
+   },
+   "Eddie Fontaine": {
+    "Harrison": 1
+   },
+   "Edward Madden": {
+    "Eric Morecambe": 1,
+    "Ernie Wise": 1,
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Enotris Johnson": {
+    "McCartney": 1
+   },
+   "Felice": {
+    "Harrison": 1
+   },
+   "Francis Wheeler": {
+    "Harrison": 1
+   },
+   "Fred Wise": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Freddie Gorman": {
+    "Lennon": 1
+   },
+   "Georgia Dobbins": {
+    "Lennon": 1
+   },
+   "Gerry Goffin": {
+    "Harrison": 3,
+    "Lennon": 2,
+    "McCartney": 2
+   },
+   "Hal David": {
+    "Lennon": 1
+   },
+   "Harrison": {
+    "Harrison": 28,
+    "Instrumental": 4,
+    "Lennon": 6,
+    "McCartney": 5,
+    "Sound Collage": 1,
+    "Starr": 1
+   },
+   "Harry B. Smith": {
+    "Harrison": 1
+   },
+   "Harry Warren": {
+    "McCartney": 1
+   },
+   "Heinz Hellmer": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Howard Biggs": {
+    "Lennon": 1
+   },
+   "Jack Yellen": {
+    "Lennon": 1
+   },
+   "James McDougall": {
+    "Lennon": 1
+   },
+   "Janie Bradford": {
+    "Lennon": 1
+   },
+   "Jean Nicolas": {
+    "Lennon": 2,
+    "McCartney": 2
+   },
+   "Jerry Allison": {
+    "Lennon": 1
+   },
+   "Jerry Leiber": {
+    "Harrison": 2,
+    "Lennon": 1,
+    "McCartney": 3
+   },
+   "Joe Thomas": {
+    "Lennon": 1
+   },
+   "John Marascalco": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Johnny Burnette": {
+    "Lennon": 1
+   },
+   "Johnny Russell": {
+    "Starr": 1
+   },
+   "Kay Twomey": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Kent Westberry": {
+    "Lennon": 1
+   },
+   "Larry Williams": {
+    "Lennon": 3
+   },
+   "Lee Montogue": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Lennon": {
+    "Harrison": 10,
+    "Instrumental": 4,
+    "Lennon": 112,
+    "McCartney": 66,
+    "Sound Collage": 1,
+    "Starr": 7
+   },
+   "Little Richard": {
+    "McCartney": 4
+   },
+   "Little Willie John": {
+    "Lennon": 1
+   },
+   "Luther Dixon": {
+    "Lennon": 1,
+    "Starr": 1
+   },
+   "Marijohn Wilkin": {
+    "Lennon": 1
+   },
+   "McCartney": {
+    "Harrison": 8,
+    "Instrumental": 4,
+    "Lennon": 61,
+    "McCartney": 112,
+    "N/A": 1,
+    "Starr": 9
+   },
+   "Meredith Willson": {
+    "McCartney": 1
+   },
+   "Mike Pingitore": {
+    "McCartney": 1
+   },
+   "Mike Stoller": {
+    "Harrison": 2,
+    "Lennon": 1,
+    "McCartney": 3
+   },
+   "Mikis Theodorakis": {
+    "McCartney": 1
+   },
+   "Milton Ager": {
+    "Lennon": 1
+   },
+   "Mitch Murray": {
+    "Lennon": 1
+   },
+   "Norman Petty": {
+    "Lennon": 1
+   },
+   "O'Kelly Isley Jr.": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "Ono": {
+    "Sound Collage": 1
+   },
+   "Paul Burlison": {
+    "Lennon": 1
+   },
+   "Percy Wenrich": {
+    "Eric Morecambe": 1,
+    "Ernie Wise": 1,
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Phil Medley": {
+    "Lennon": 1
+   },
+   "Phil Spector": {
+    "Lennon": 1
+   },
+   "Quinton Claunch": {
+    "McCartney": 1
+   },
+   "Ray Charles": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Ric Marlow": {
+    "McCartney": 1
+   },
+   "Richie Barrett": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Robert \"Bumps\" Blackwell": {
+    "McCartney": 1
+   },
+   "Robert Bateman": {
+    "Lennon": 1
+   },
+   "Robert Blackwell": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Ronald Isley": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "Roy C. Bennett": {
+    "Harrison": 1
+   },
+   "Roy Lee Johnson": {
+    "Lennon": 1
+   },
+   "Rudolph Isley": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "Ruth Roberts": {
+    "Lennon": 1
+   },
+   "Sansom": {
+    "McCartney": 1
+   },
+   "Sid Tepper": {
+    "Harrison": 1
+   },
+   "Smokey Robinson": {
+    "Harrison": 1,
+    "Lennon": 1
+   },
+   "Stan Kesler": {
+    "Harrison": 1
+   },
+   "Stanley Clayton": {
+    "Lennon": 1
+   },
+   "Starr": {
+    "Harrison": 2,
+    "Instrumental": 3,
+    "Lennon": 4,
+    "McCartney": 5,
+    "Starr": 5
+   },
+   "Stephen Foster": {
+    "McCartney": 1
+   },
+   "Sunny Skylar": {
+    "McCartney": 1
+   },
+   "Ted Snyder": {
+    "Harrison": 1
+   },
+   "Terry Thompson": {
+    "Lennon": 1
+   },
+   "Titus Turner": {
+    "Lennon": 1
+   },
+   "Tony Moon": {
+    "Lennon": 1
+   },
+   "Traditional": {
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "Voni Morrison": {
+    "Starr": 1
+   },
+   "Wes Farrell": {
+    "Starr": 1
+   },
+   "William Garrett": {
+    "Lennon": 1
+   }
+  },
+  "songwriters,year": {
+   "Aaron Schroeder": {
+    "1963": 1
+   },
+   "Al Dubin": {
+    "1962": 1
+   },
+   "Al Mortimer": {
+    "1963": 1
+   },
+   "Albert Collins": {
+    "1963": 1
+   },
+   "Arthur Alexander": {
+    "1963": 1
+   },
+   "Arthur Crudup": {
+    "1963": 1
+   },
+   "Ben Weisman": {
+    "1963": 1
+   },
+   "Berry Gordy": {
+    "1963": 1
+   },
+   "Bert Berns": {
+    "1963": 1
+   },
+   "Bill Cantrell": {
+    "1963": 1
+   },
+   "Bill Katz": {
+    "1969": 1
+   },
+   "Blind Lemon Jefferson": {
+    "1964": 1
+   },
+   "Bobby Scott": {
+    "1963": 1
+   },
+   "Boudleaux Bryant": {
+    "1963": 1
+   },
+   "Brian Holland": {
+    "1963": 1
+   },
+   "Buddy Holly": {
+    "1958": 1,
+    "1963": 1,
+    "1964": 1
+   },
+   "Burt Bacharach": {
+    "1963": 1
+   },
+   "Buzz Cason": {
+    "1963": 1
+   },
+   "Carl Perkins": {
+    "1963": 1,
+    "1964": 3,
+    "1969": 1
+   },
+   "Carole King": {
+    "1962": 1,
+    "1963": 3
+   },
+   "Chan Romero": {
+    "1963": 1
+   },
+   "Charles Calhoun": {
+    "1969": 1
+   },
+   "Charlie Feathers": {
+    "1964": 1
+   },
+   "Chuck Berry": {
+    "1962": 1,
+    "1963": 6,
+    "1964": 2
+   },
+   "Consuelo Velázquez": {
+    "1962": 1
+   },
+   "Dorsey Burnette": {
+    "1963": 1
+   },
+   "Drapkin": {
+    "1963": 1
+   },
+   "Eddie Fontaine": {
+    "1963": 1
+   },
+   "Edward Madden": {
+    "1963": 1
+   },
+   "Enotris Johnson": {
+    "1964": 1
+   },
+   "Felice": {
+    "1963": 1
+   },
+   "Francis Wheeler": {
+    "1962": 1
+   },
+   "Fred Wise": {
+    "1963": 1
+   },
+   "Freddie Gorman": {
+    "1963": 1
+   },
+   "Georgia Dobbins": {
+    "1963": 1
+   },
+   "Gerry Goffin": {
+    "1962": 1,
+    "1963": 3
+   },
+   "Hal David": {
+    "1963": 1
+   },
+   "Harrison": {
+    "1958": 1,
+    "1961": 1,
+    "1963": 1,
+    "1964": 1,
+    "1965": 5,
+    "1966": 3,
+    "1967": 6,
+    "1968": 10,
+    "1969": 7,
+    "1970": 1,
+    "1977": 1
+   },
+   "Harry B. Smith": {
+    "1962": 1
+   },
+   "Harry Warren": {
+    "1962": 1
+   },
+   "Heinz Hellmer": {
+    "1964": 1
+   },
+   "Howard Biggs": {
+    "1963": 1
+   },
+   "Jack Yellen": {
+    "1961": 1
+   },
+   "James McDougall": {
+    "1964": 1
+   },
+   "Janie Bradford": {
+    "1963": 1
+   },
+   "Jean Nicolas": {
+    "1964": 2
+   },
+   "Jerry Allison": {
+    "1958": 1
+   },
+   "Jerry Leiber": {
+    "1962": 2,
+    "1963": 2,
+    "1964": 1
+   },
+   "Joe Thomas": {
+    "1963": 1
+   },
+   "John Marascalco": {
+    "1969": 1
+   },
+   "Johnny Burnette": {
+    "1963": 1
+   },
+   "Johnny Russell": {
+    "1965": 1
+   },
+   "Kay Twomey": {
+    "1963": 1
+   },
+   "Kent Westberry": {
+    "1963": 1
+   },
+   "Larry Williams": {
+    "1964": 1,
+    "1965": 2
+   },
+   "Lee Montogue": {
+    "1964": 1
+   },
+   "Lennon": {
+    "1960": 1,
+    "1961": 1,
+    "1962": 6,
+    "1963": 19,
+    "1964": 21,
+    "1965": 21,
+    "1966": 10,
+    "1967": 17,
+    "1968": 20,
+    "1969": 18,
+    "1977": 1,
+    "1980": 1
+   },
+   "Little Richard": {
+    "1963": 2,
+    "1964": 2
+   },
+   "Little Willie John": {
+    "1964": 1
+   },
+   "Luther Dixon": {
+    "1963": 2
+   },
+   "Marijohn Wilkin": {
+    "1963": 1
+   },
+   "McCartney": {
+    "1958": 1,
+    "1960": 2,
+    "1962": 8,
+    "1963": 15,
+    "1964": 16,
+    "1965": 24,
+    "1966": 11,
+    "1967": 18,
+    "1968": 18,
+    "1969": 22,
+    "1977": 1
+   },
+   "Meredith Willson": {
+    "1963": 1
+   },
+   "Mike Pingitore": {
+    "1963": 1
+   },
+   "Mike Stoller": {
+    "1962": 2,
+    "1963": 2,
+    "1964": 1
+   },
+   "Mikis Theodorakis": {
+    "1963": 1
+   },
+   "Milton Ager": {
+    "1961": 1
+   },
+   "Mitch Murray": {
+    "1962": 1
+   },
+   "Norman Petty": {
+    "1958": 1
+   },
+   "O'Kelly Isley Jr.": {
+    "1964": 1
+   },
+   "Ono": {
+    "1968": 1
+   },
+   "Paul Burlison": {
+    "1963": 1
+   },
+   "Percy Wenrich": {
+    "1963": 1
+   },
+   "Phil Medley": {
+    "1963": 1
+   },
+   "Phil Spector": {
+    "1963": 1
+   },
+   "Quinton Claunch": {
+    "1963": 1
+   },
+   "Ray Charles": {
+    "1960": 1,
+    "1963": 1
+   },
+   "Ric Marlow": {
+    "1963": 1
+   },
+   "Richie Barrett": {
+    "1963": 1
+   },
+   "Robert \"Bumps\" Blackwell": {
+    "1964": 1
+   },
+   "Robert Bateman": {
+    "1963": 1
+   },
+   "Robert Blackwell": {
+    "1969": 1
+   },
+   "Ronald Isley": {
+    "1964": 1
+   },
+   "Roy C. Bennett": {
+    "1963": 1
+   },
+   "Roy Lee Johnson": {
+    "1964": 1
+   },
+   "Rudolph Isley": {
+    "1964": 1
+   },
+   "Ruth Roberts": {
+    "1969": 1
+   },
+   "Sansom": {
+    "1963": 1
+   },
+   "Sid Tepper": {
+    "1963": 1
+   },
+   "Smokey Robinson": {
+    "1963": 1
+   },
+   "Stan Kesler": {
+    "1964": 1
+   },
+   "Stanley Clayton": {
+    "1969": 1
+   },
+   "Starr": {
+    "1965": 2,
+    "1967": 3,
+    "1968": 2,
+    "1969": 5,
+    "1977": 1
+   },
+   "Stephen Foster": {
+    "1963": 1
+   },
+   "Sunny Skylar": {
+    "1962": 1
+   },
+   "Ted Snyder": {
+    "1962": 1
+   },
+   "Terry Thompson": {
+    "1963": 1
+   },
+   "Titus Turner": {
+    "1964": 1
+   },
+   "Tony Moon": {
+    "1963": 1
+   },
+   "Traditional": {
+    "1969": 1
+   },
+   "Voni Morrison": {
+    "1965": 1
+   },
+   "Wes Farrell": {
+    "1963": 1
+   },
+   "William Garrett": {
+    "1963": 1
+   }
+  },
+  "vocals": {
+   "Eric Morecambe": 1,
+   "Ernie Wise": 1,
+   "Harrison": 56,
+   "Instrumental": 5,
+   "Lennon": 162,
+   "McCartney": 152,
+   "N/A": 1,
+   "Sound Collage": 1,
+   "Starr": 18
+  },
+  "vocals,album": {
+   "Eric Morecambe": {
+    "Anthology 1": 1
+   },
+   "Ernie Wise": {
+    "Anthology 1": 1
+   },
+   "Harrison": {
+    "Abbey Road": 5,
+    "Anthology 1": 6,
+    "Anthology 3": 2,
+    "Help!": 1,
+    "Let It Be": 2,
+    "Live at the BBC": 7,
+    "Magical Mystery Tour": 1,
+    "Revolver": 3,
+    "Rubber Soul": 2,
+    "Sgt. Pepper's Lonely Hearts Club Band": 2,
+    "The Beatles": 4,
+    "The Beatles' Christmas Album": 1,
+    "UK: 1967–1970 US: Hey Jude": 1,
+    "UK: A Hard Day's Night US: Something New": 1,
+    "UK: Beatles for Sale US: Beatles '65": 1,
+    "UK: Help! US: Beatles VI": 1,
+    "UK: Please Please Me US: The Early Beatles": 2,
+    "UK: Rarities US: Beatles VI": 1,
+    "UK: Rarities US: Meet the Beatles!": 1,
+    "UK: Rarities US: Rarities": 1,
+    "UK: Rubber Soul US: Yesterday and Today": 2,
+    "UK: With the Beatles US: Meet the Beatles!": 1,
+    "UK: With the Beatles US: The Beatles Second Album": 1,
+    "UK: With the Beatles US: The Beatles' Second Album": 2,
+    "Unreleased": 1,
+    "Yellow Submarine": 2
+   },
+   "Instrumental": {
+    "Anthology 1": 2,
+    "Anthology 2": 1,
+    "Magical Mystery Tour": 2
+   },
+   "Lennon": {
+    "Abbey Road": 7,
+    "Anthology 1": 10,
+    "Anthology 2": 1,
+    "Anthology 3": 3,
+    "Help!": 4,
+    "Let It Be": 7,
+    "Let It Be... Naked - Fly on the Wall bonus disc": 3,
+    "Live at the BBC": 17,
+    "Live! at the Star-Club in Hamburg, Germany; 1962": 1,
+    "Magical Mystery Tour": 5,
+    "N/A": 1,
+    "Revolver": 3,
+    "Rubber Soul": 7,
+    "Sgt. Pepper's Lonely Hearts Club Band": 10,
+    "The Beatles": 11,
+    "The Beatles Bootleg Recordings 1963": 2,
+    "The Beatles' Christmas Album": 1,
+    "UK: \"Long Tall Sally\" EP US: Something New": 1,
+    "UK: \"Long Tall Sally\" EP US: The Beatles' Second Album": 1,
+    "UK: 1967–1970 US: Hey Jude": 2,
+    "UK: A Collection of Beatles Oldies US: 1962–1966": 1,
+    "UK: A Collection of Beatles Oldies US: Beatles '65": 1,
+    "UK: A Collection of Beatles Oldies US: Beatles VI": 1,
+    "UK: A Collection of Beatles Oldies US: Meet the Beatles!": 1,
+    "UK: A Collection of Beatles Oldies US: The Beatles Second Album": 1,
+    "UK: A Collection of Beatles Oldies US: Yesterday and Today": 2,
+    "UK: A Hard Day's Night US: 1962–1966": 1,
+    "UK: A Hard Day's Night US: Beatles '65": 1,
+    "UK: A Hard Day's Night US: Hey Jude": 2,
+    "UK: A Hard Day's Night US: Something New": 5,
+    "UK: A Hard Day's Night US: The Beatles Second Album": 1,
+    "UK: Beatles for Sale US: Beatles '65": 6,
+    "UK: Beatles for Sale US: Beatles VI": 4,
+    "UK: Help! US: Beatles VI": 2,
+    "UK: Help! US: Rubber Soul": 1,
+    "UK: Past Masters Volume 1 US: The Beatles' Second Album": 1,
+    "UK: Please Please Me US: Introducing… The Beatles": 1,
+    "UK: Please Please Me US: Meet the Beatles!": 1,
+    "UK: Please Please Me US: Rarities": 1,
+    "UK: Please Please Me US: The Early Beatles": 7,
+    "UK: Rarities US: Beatles VI": 1,
+    "UK: Rarities US: Hey Jude": 1,
+    "UK: Rarities US: Meet the Beatles!": 1,
+    "UK: Rarities US: Rarities": 2,
+    "UK: Rarities US: Something New": 1,
+    "UK: Rarities US: The Beatles Second Album": 1,
+    "UK: Revolver US: Yesterday and Today": 3,
+    "UK: Rubber Soul US: Yesterday and Today": 2,
+    "UK: With the Beatles US: Meet the Beatles!": 4,
+    "UK: With the Beatles US: The Beatles Second Album": 2,
+    "UK: With the Beatles US: The Beatles' Second Album": 1,
+    "Unreleased": 2,
+    "Yellow Submarine": 1
+   },
+   "McCartney": {
+    "Abbey Road": 11,
+    "Anthology 1": 9,
+    "Anthology 2": 1,
+    "Anthology 3": 5,
+    "Help!": 3,
+    "Let It Be": 7,
+    "Let It Be film": 1,
+    "Let It Be... Naked - Fly on the Wall bonus disc": 2,
+    "Let it Be film": 1,
+    "Live at the BBC": 10,
+    "Magical Mystery Tour": 5,
+    "On Air – Live at the BBC Volume 2": 1,
+    "Revolver": 6,
+    "Rock 'n' Roll Music": 1,
+    "Rubber Soul": 5,
+    "Sgt. Pepper's Lonely Hearts Club Band": 9,
+    "The Beatles": 13,
+    "The Beatles' Christmas Album": 1,
+    "UK: 1967-1970 US: Hey Jude": 1,
+    "UK: 1967–1970 US: Hey Jude": 3,
+    "UK: A Collection of Beatles Oldies US: 1962–1966": 1,
+    "UK: A Collection of Beatles Oldies US: Hey Jude": 1,
+    "UK: A Collection of Beatles Oldies US: Meet the Beatles!": 1,
+    "UK: A Collection of Beatles Oldies US: The Beatles Second Album": 1,
+    "UK: A Collection of Beatles Oldies US: Yesterday and Today": 2,
+    "UK: A Hard Day's Night US: 1962–1966": 1,
+    "UK: A Hard Day's Night US: Beatles '65": 1,
+    "UK: A Hard Day's Night US: Hey Jude": 1,
+    "UK: A Hard Day's Night US: Something New": 3,
+    "UK: Beatles for Sale US: Beatles '65": 3,
+    "UK: Beatles for Sale US: Beatles VI": 6,
+    "UK: Help! US: Beatles VI": 1,
+    "UK: Help! US: Rubber Soul": 1,
+    "UK: Help! US: Yesterday and Today": 1,
+    "UK: Long Tall Sally EP US: The Beatles' Second Album": 1,
+    "UK: Past Masters Volume 1 US: The Beatles' Second Album": 1,
+    "UK: Please Please Me US: Introducing… The Beatles": 1,
+    "UK: Please Please Me US: Meet the Beatles!": 1,
+    "UK: Please Please Me US: Rarities": 1,
+    "UK: Please Please Me US: The Early Beatles": 5,
+    "UK: Rarities US: Beatles '65": 1,
+    "UK: Rarities US: Beatles VI": 1,
+    "UK: Rarities US: Meet the Beatles!": 1,
+    "UK: Rarities US: Rarities": 2,
+    "UK: Rarities US: Something New": 1,
+    "UK: Rarities US: The Beatles Second Album": 1,
+    "UK: Rubber Soul US: Yesterday and Today": 2,
+    "UK: With the Beatles US: Meet the Beatles!": 4,
+    "Unreleased": 2,
+    "Yellow Submarine": 2
+   },
+   "N/A": {
+    "N/A": 1
+   },
+   "Sound Collage": {
+    "The Beatles": 1
+   },
+   "Starr": {
+    "Abbey Road": 2,
+    "Anthology 1": 1,
+    "Anthology 2": 1,
+    "Let It Be... Naked - Fly on the Wall bonus disc": 1,
+    "Revolver": 1,
+    "Sgt. Pepper's Lonely Hearts Club Band": 3,
+    "The Beatles": 2,
+    "The Beatles' Christmas Album": 1,
+    "UK: \"Long Tall Sally\" EP US: Something New": 1,
+    "UK: Beatles for Sale US: Beatles '65": 1,
+    "UK: Help! US: Yesterday and Today": 1,
+    "UK: Please Please Me US: The Early Beatles": 1,
+    "UK: Rubber Soul US: Yesterday and Today": 1,
+    "UK: With the Beatles US: Meet the Beatles!": 1
+   }
+  },
+  "vocals,lead_vocal": {
+   "Eric Morecambe": {
+    "Lennon": 1
+   },
+   "Ernie Wise": {
+    "Lennon": 1
+   },
+   "Harrison": {
+    "Harrison": 42,
+    "Lennon": 11,
+    "McCartney": 3
+   },
+   "Instrumental": {
+    "Instrumental": 5
+   },
+   "Lennon": {
+    "Harrison": 2,
+    "Lennon": 141,
+    "McCartney": 18,
+    "Starr": 1
+   },
+   "McCartney": {
+    "Harrison": 3,
+    "Lennon": 48,
+    "McCartney": 100,
+    "Starr": 1
+   },
+   "N/A": {
+    "N/A": 1
+   },
+   "Sound Collage": {
+    "Sound Collage": 1
+   },
+   "Starr": {
+    "Lennon": 2,
+    "McCartney": 3,
+    "Starr": 13
+   }
+  },
+  "vocals,songwriters": {
+   "Eric Morecambe": {
+    "Edward Madden": 1,
+    "Percy Wenrich": 1
+   },
+   "Ernie Wise": {
+    "Edward Madden": 1,
+    "Percy Wenrich": 1
+   },
+   "Harrison": {
+    "Aaron Schroeder": 1,
+    "Boudleaux Bryant": 1,
+    "Buddy Holly": 1,
+    "Carl Perkins": 1,
+    "Carole King": 3,
+    "Charlie Feathers": 1,
+    "Chuck Berry": 1,
+    "Drapkin": 1,
+    "Eddie Fontaine": 1,
+    "Edward Madden": 1,
+    "Felice": 1,
+    "Francis Wheeler": 1,
+    "Gerry Goffin": 3,
+    "Harrison": 28,
+    "Harry B. Smith": 1,
+    "Jerry Leiber": 2,
+    "Lennon": 10,
+    "McCartney": 8,
+    "Mike Stoller": 2,
+    "O'Kelly Isley Jr.": 1,
+    "Percy Wenrich": 1,
+    "Ronald Isley": 1,
+    "Roy C. Bennett": 1,
+    "Rudolph Isley": 1,
+    "Sid Tepper": 1,
+    "Smokey Robinson": 1,
+    "Stan Kesler": 1,
+    "Starr": 2,
+    "Ted Snyder": 1
+   },
+   "Instrumental": {
+    "Harrison": 4,
+    "Lennon": 4,
+    "McCartney": 4,
+    "Starr": 3
+   },
+   "Lennon": {
+    "Al Mortimer": 1,
+    "Arthur Alexander": 1,
+    "Ben Weisman": 1,
+    "Berry Gordy": 1,
+    "Bert Berns": 1,
+    "Bill Katz": 1,
+    "Brian Holland": 1,
+    "Buddy Holly": 2,
+    "Burt Bacharach": 1,
+    "Buzz Cason": 1,
+    "Carl Perkins": 1,
+    "Carole King": 2,
+    "Charles Calhoun": 1,
+    "Chuck Berry": 8,
+    "Dorsey Burnette": 1,
+    "Edward Madden": 1,
+    "Fred Wise": 1,
+    "Freddie Gorman": 1,
+    "Georgia Dobbins": 1,
+    "Gerry Goffin": 2,
+    "Hal David": 1,
+    "Harrison": 6,
+    "Heinz Hellmer": 1,
+    "Howard Biggs": 1,
+    "Jack Yellen": 1,
+    "James McDougall": 1,
+    "Janie Bradford": 1,
+    "Jean Nicolas": 2,
+    "Jerry Allison": 1,
+    "Jerry Leiber": 1,
+    "Joe Thomas": 1,
+    "John Marascalco": 1,
+    "Johnny Burnette": 1,
+    "Kay Twomey": 1,
+    "Kent Westberry": 1,
+    "Larry Williams": 3,
+    "Lee Montogue": 1,
+    "Lennon": 112,
+    "Little Willie John": 1,
+    "Luther Dixon": 1,
+    "Marijohn Wilkin": 1,
+    "McCartney": 61,
+    "Mike Stoller": 1,
+    "Milton Ager": 1,
+    "Mitch Murray": 1,
+    "Norman Petty": 1,
+    "O'Kelly Isley Jr.": 1,
+    "Paul Burlison": 1,
+    "Percy Wenrich": 1,
+    "Phil Medley": 1,
+    "Phil Spector": 1,
+    "Ray Charles": 1,
+    "Richie Barrett": 1,
+    "Robert Bateman": 1,
+    "Robert Blackwell": 1,
+    "Ronald Isley": 1,
+    "Roy Lee Johnson": 1,
+    "Rudolph Isley": 1,
+    "Ruth Roberts": 1,
+    "Smokey Robinson": 1,
+    "Stanley Clayton": 1,
+    "Starr": 4,
+    "Terry Thompson": 1,
+    "Titus Turner": 1,
+    "Tony Moon": 1,
+    "Traditional": 1,
+    "William Garrett": 1
+   },
+   "McCartney": {
+    "Al Dubin": 1,
+    "Albert Collins": 1,
+    "Arthur Crudup": 1,
+    "Ben Weisman": 1,
+    "Bill Cantrell": 1,
+    "Bobby Scott": 1,
+    "Buddy Holly": 1,
+    "Carl Perkins": 2,
+    "Carole King": 2,
+    "Chan Romero": 1,
+    "Charles Calhoun": 1,
+    "Consuelo Velázquez": 1,
+    "Edward Madden": 1,
+    "Enotris Johnson": 1,
+    "Fred Wise": 1,
+    "Gerry Goffin": 2,
+    "Harrison": 5,
+    "Harry Warren": 1,
+    "Heinz Hellmer": 1,
+    "Jean Nicolas": 2,
+    "Jerry Leiber": 3,
+    "John Marascalco": 1,
+    "Kay Twomey": 1,
+    "Lee Montogue": 1,
+    "Lennon": 66,
+    "Little Richard": 4,
+    "McCartney": 112,
+    "Meredith Willson": 1,
+    "Mike Pingitore": 1,
+    "Mike Stoller": 3,
+    "Mikis Theodorakis": 1,
+    "O'Kelly Isley Jr.": 1,
+    "Percy Wenrich": 1,
+    "Quinton Claunch": 1,
+    "Ray Charles": 1,
+    "Ric Marlow": 1,
+    "Richie Barrett": 1,
+    "Robert \"Bumps\" Blackwell": 1,
+    "Robert Blackwell": 1,
+    "Ronald Isley": 1,
+    "Rudolph Isley": 1,
+    "Sansom": 1,
+    "Starr": 5,
+    "Stephen Foster": 1,
+    "Sunny Skylar": 1,
+    "Traditional": 1
+   },
+   "N/A": {
+    "McCartney": 1
+   },
+   "Sound Collage": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "Ono": 1
+   },
+   "Starr": {
+    "Blind Lemon Jefferson": 1,
+    "Carl Perkins": 2,
+    "Harrison": 1,
+    "Johnny Russell": 1,
+    "Lennon": 7,
+    "Luther Dixon": 1,
+    "McCartney": 9,
+    "O'Kelly Isley Jr.": 1,
+    "Ronald Isley": 1,
+    "Rudolph Isley": 1,
+    "Starr": 5,
+    "Voni Morrison": 1,
+    "Wes Farrell": 1
+   }
+  },
+  "vocals,year": {
+   "Eric Morecambe": {
+    "1963": 1
+   },
+   "Ernie Wise": {
+    "1963": 1
+   },
+   "Harrison": {
+    "1962": 3,
+    "1963": 14,
+    "1964": 5,
+    "1965": 7,
+    "1966": 3,
+    "1967": 6,
+    "1968": 8,
+    "1969": 8,
+    "1970": 1,
+    "1977": 1
+   },
+   "Instrumental": {
+    "1960": 1,
+    "1961": 1,
+    "1965": 1,
+    "1967": 2
+   },
+   "Lennon": {
+    "1958": 2,
+    "1961": 1,
+    "1962": 7,
+    "1963": 40,
+    "1964": 28,
+    "1965": 20,
+    "1966": 8,
+    "1967": 16,
+    "1968": 15,
+    "1969": 22,
+    "1977": 1,
+    "1980": 1
+   },
+   "McCartney": {
+    "1960": 2,
+    "1962": 9,
+    "1963": 28,
+    "1964": 21,
+    "1965": 19,
+    "1966": 9,
+    "1967": 15,
+    "1968": 20,
+    "1969": 27,
+    "1977": 1
+   },
+   "N/A": {
+    "1962": 1
+   },
+   "Sound Collage": {
+    "1968": 1
+   },
+   "Starr": {
+    "1963": 2,
+    "1964": 3,
+    "1965": 3,
+    "1966": 1,
+    "1967": 4,
+    "1968": 2,
+    "1969": 3
+   }
+  },
+  "year": {
+   "1958": 2,
+   "1960": 3,
+   "1961": 2,
+   "1962": 18,
+   "1963": 64,
+   "1964": 41,
+   "1965": 37,
+   "1966": 19,
+   "1967": 27,
+   "1968": 43,
+   "1969": 43,
+   "1970": 1,
+   "1977": 1,
+   "1980": 1
+  },
+  "year,album": {
+   "1958": {
+    "Anthology 1": 2
+   },
+   "1960": {
+    "Anthology 1": 3
+   },
+   "1961": {
+    "Anthology 1": 2
+   },
+   "1962": {
+    "Anthology 1": 7,
+    "Live! at the Star-Club in Hamburg, Germany; 1962": 1,
+    "N/A": 1,
+    "UK: Please Please Me US: The Early Beatles": 4
+   },
+   "1963": {
+    "Anthology 1": 2,
+    "Live at the BBC": 29,
+    "On Air – Live at the BBC Volume 2": 1,
+    "The Beatles Bootleg Recordings 1963": 2,
+    "UK: A Collection of Beatles Oldies US: 1962–1966": 1,
+    "UK: A Collection of Beatles Oldies US: Meet the Beatles!": 1,
+    "UK: A Collection of Beatles Oldies US: The Beatles Second Album": 1,
+    "UK: Past Masters Volume 1 US: The Beatles' Second Album": 1,
+    "UK: Please Please Me US: Introducing… The Beatles": 1,
+    "UK: Please Please Me US: Meet the Beatles!": 1,
+    "UK: Please Please Me US: Rarities": 1,
+    "UK: Please Please Me US: The Early Beatles": 7,
+    "UK: Rarities US: Meet the Beatles!": 1,
+    "UK: Rarities US: The Beatles Second Album": 1,
+    "UK: With the Beatles US: Meet the Beatles!": 9,
+    "UK: With the Beatles US: The Beatles Second Album": 2,
+    "UK: With the Beatles US: The Beatles' Second Album": 3
+   },
+   "1964": {
+    "Anthology 1": 3,
+    "Live at the BBC": 2,
+    "UK: \"Long Tall Sally\" EP US: Something New": 2,
+    "UK: \"Long Tall Sally\" EP US: The Beatles' Second Album": 1,
+    "UK: A Collection of Beatles Oldies US: Beatles '65": 1,
+    "UK: A Hard Day's Night US: 1962–1966": 1,
+    "UK: A Hard Day's Night US: Beatles '65": 1,
+    "UK: A Hard Day's Night US: Hey Jude": 2,
+    "UK: A Hard Day's Night US: Something New": 8,
+    "UK: A Hard Day's Night US: The Beatles Second Album": 1,
+    "UK: Beatles for Sale US: Beatles '65": 8,
+    "UK: Beatles for Sale US: Beatles VI": 6,
+    "UK: Long Tall Sally EP US: The Beatles' Second Album": 1,
+    "UK: Rarities US: Beatles '65": 1,
+    "UK: Rarities US: Rarities": 1,
+    "UK: Rarities US: Something New": 1
+   },
+   "1965": {
+    "Anthology 2": 3,
+    "Help!": 7,
+    "Let It Be film": 1,
+    "Rock 'n' Roll Music": 1,
+    "Rubber Soul": 10,
+    "UK: A Collection of Beatles Oldies US: Beatles VI": 1,
+    "UK: A Collection of Beatles Oldies US: Yesterday and Today": 2,
+    "UK: Help! US: Beatles VI": 3,
+    "UK: Help! US: Rubber Soul": 2,
+    "UK: Help! US: Yesterday and Today": 2,
+    "UK: Rarities US: Beatles VI": 1,
+    "UK: Rubber Soul US: Yesterday and Today": 4
+   },
+   "1966": {
+    "Magical Mystery Tour": 2,
+    "Revolver": 11,
+    "Sgt. Pepper's Lonely Hearts Club Band": 1,
+    "UK: A Collection of Beatles Oldies US: Hey Jude": 1,
+    "UK: Rarities US: Hey Jude": 1,
+    "UK: Revolver US: Yesterday and Today": 3
+   },
+   "1967": {
+    "Magical Mystery Tour": 10,
+    "Sgt. Pepper's Lonely Hearts Club Band": 12,
+    "The Beatles' Christmas Album": 1,
+    "UK: Rarities US: Rarities": 1,
+    "Yellow Submarine": 3
+   },
+   "1968": {
+    "Anthology 3": 4,
+    "Let It Be": 1,
+    "Let It Be... Naked - Fly on the Wall bonus disc": 1,
+    "The Beatles": 29,
+    "UK: 1967-1970 US: Hey Jude": 1,
+    "UK: 1967–1970 US: Hey Jude": 1,
+    "UK: Rarities US: Rarities": 1,
+    "Unreleased": 2,
+    "Yellow Submarine": 1
+   },
+   "1969": {
+    "Abbey Road": 17,
+    "Anthology 3": 5,
+    "Let It Be": 10,
+    "Let It Be... Naked - Fly on the Wall bonus disc": 3,
+    "Let it Be film": 1,
+    "N/A": 1,
+    "UK: 1967–1970 US: Hey Jude": 3,
+    "Unreleased": 1
+   },
+   "1970": {
+    "Let It Be": 1
+   },
+   "1977": {
+    "Anthology 1": 1
+   },
+   "1980": {
+    "Anthology 2": 1
+   }
+  },
+  "year,lead_vocal": {
+   "1958": {
+    "Lennon": 2
+   },
+   "1960": {
+    "Instrumental": 1,
+    "McCartney": 2
+   },
+   "1961": {
+    "Instrumental": 1,
+    "Lennon": 1
+   },
+   "1962": {
+    "Harrison": 3,
+    "Lennon": 6,
+    "McCartney": 8,
+    "N/A": 1
+   },
+   "1963": {
+    "Harrison": 11,
+    "Lennon": 38,
+    "McCartney": 13,
+    "Starr": 2
+   },
+   "1964": {
+    "Harrison": 4,
+    "Lennon": 26,
+    "McCartney": 9,
+    "Starr": 2
+   },
+   "1965": {
+    "Harrison": 4,
+    "Instrumental": 1,
+    "Lennon": 15,
+    "McCartney": 14,
+    "Starr": 3
+   },
+   "1966": {
+    "Harrison": 3,
+    "Lennon": 7,
+    "McCartney": 8,
+    "Starr": 1
+   },
+   "1967": {
+    "Harrison": 3,
+    "Instrumental": 2,
+    "Lennon": 10,
+    "McCartney": 11,
+    "Starr": 1
+   },
+   "1968": {
+    "Harrison": 8,
+    "Lennon": 14,
+    "McCartney": 18,
+    "Sound Collage": 1,
+    "Starr": 2
+   },
+   "1969": {
+    "Harrison": 5,
+    "Lennon": 19,
+    "McCartney": 17,
+    "Starr": 2
+   },
+   "1970": {
+    "Harrison": 1
+   },
+   "1977": {
+    "Lennon": 1
+   },
+   "1980": {
+    "Lennon": 1
+   }
+  },
+  "year,songwriters": {
+   "1958": {
+    "Buddy Holly": 1,
+    "Harrison": 1,
+    "Jerry Allison": 1,
+    "McCartney": 1,
+    "Norman Petty": 1
+   },
+   "1960": {
+    "Lennon": 1,
+    "McCartney": 2,
+    "Ray Charles": 1
+   },
+   "1961": {
+    "Harrison": 1,
+    "Jack Yellen": 1,
+    "Lennon": 1,
+    "Milton Ager": 1
+   },
+   "1962": {
+    "Al Dubin": 1,
+    "Carole King": 1,
+    "Chuck Berry": 1,
+    "Consuelo Velázquez": 1,
+    "Francis Wheeler": 1,
+    "Gerry Goffin": 1,
+    "Harry B. Smith": 1,
+    "Harry Warren": 1,
+    "Jerry Leiber": 2,
+    "Lennon": 6,
+    "McCartney": 8,
+    "Mike Stoller": 2,
+    "Mitch Murray": 1,
+    "Sunny Skylar": 1,
+    "Ted Snyder": 1
+   },
+   "1963": {
+    "Aaron Schroeder": 1,
+    "Al Mortimer": 1,
+    "Albert Collins": 1,
+    "Arthur Alexander": 1,
+    "Arthur Crudup": 1,
+    "Ben Weisman": 1,
+    "Berry Gordy": 1,
+    "Bert Berns": 1,
+    "Bill Cantrell": 1,
+    "Bobby Scott": 1,
+    "Boudleaux Bryant": 1,
+    "Brian Holland": 1,
+    "Buddy Holly": 1,
+    "Burt Bacharach": 1,
+    "Buzz Cason": 1,
+    "Carl Perkins": 1,
+    "Carole King": 3,
+    "Chan Romero": 1,
+    "Chuck Berry": 6,
+    "Dorsey Burnette": 1,
+    "Drapkin": 1,
+    "Eddie Fontaine": 1,
+    "Edward Madden": 1,
+    "Felice": 1,
+    "Fred Wise": 1,
+    "Freddie Gorman": 1,
+    "Georgia Dobbins": 1,
+    "Gerry Goffin": 3,
+    "Hal David": 1,
+    "Harrison": 1,
+    "Howard Biggs": 1,
+    "Janie Bradford": 1,
+    "Jerry Leiber": 2,
+    "Joe Thomas": 1,
+    "Johnny Burnette": 1,
+    "Kay Twomey": 1,
+    "Kent Westberry": 1,
+    "Lennon": 19,
+    "Little Richard": 2,
+    "Luther Dixon": 2,
+    "Marijohn Wilkin": 1,
+    "McCartney": 15,
+    "Meredith Willson": 1,
+    "Mike Pingitore": 1,
+    "Mike Stoller": 2,
+    "Mikis Theodorakis": 1,
+    "Paul Burlison": 1,
+    "Percy Wenrich": 1,
+    "Phil Medley": 1,
+    "Phil Spector": 1,
+    "Quinton Claunch": 1,
+    "Ray Charles": 1,
+    "Ric Marlow": 1,
+    "Richie Barrett": 1,
+    "Robert Bateman": 1,
+    "Roy C. Bennett": 1,
+    "Sansom": 1,
+    "Sid Tepper": 1,
+    "Smokey Robinson": 1,
+    "Stephen Foster": 1,
+    "Terry Thompson": 1,
+    "Tony Moon": 1,
+    "Wes Farrell": 1,
+    "William Garrett": 1
+   },
+   "1964": {
+    "Blind Lemon Jefferson": 1,
+    "Buddy Holly": 1,
+    "Carl Perkins": 3,
+    "Charlie Feathers": 1,
+    "Chuck Berry": 2,
+    "Enotris Johnson": 1,
+    "Harrison": 1,
+    "Heinz Hellmer": 1,
+    "James McDougall": 1,
+    "Jean Nicolas": 2,
+    "Jerry Leiber": 1,
+    "Larry Williams": 1,
+    "Lee Montogue": 1,
+    "Lennon": 21,
+    "Little Richard": 2,
+    "Little Willie John": 1,
+    "McCartney": 16,
+    "Mike Stoller": 1,
+    "O'Kelly Isley Jr.": 1,
+    "Robert \"Bumps\" Blackwell": 1,
+    "Ronald Isley": 1,
+    "Roy Lee Johnson": 1,
+    "Rudolph Isley": 1,
+    "Stan Kesler": 1,
+    "Titus Turner": 1
+   },
+   "1965": {
+    "Harrison": 5,
+    "Johnny Russell": 1,
+    "Larry Williams": 2,
+    "Lennon": 21,
+    "McCartney": 24,
+    "Starr": 2,
+    "Voni Morrison": 1
+   },
+   "1966": {
+    "Harrison": 3,
+    "Lennon": 10,
+    "McCartney": 11
+   },
+   "1967": {
+    "Harrison": 6,
+    "Lennon": 17,
+    "McCartney": 18,
+    "Starr": 3
+   },
+   "1968": {
+    "Harrison": 10,
+    "Lennon": 20,
+    "McCartney": 18,
+    "Ono": 1,
+    "Starr": 2
+   },
+   "1969": {
+    "Bill Katz": 1,
+    "Carl Perkins": 1,
+    "Charles Calhoun": 1,
+    "Harrison": 7,
+    "John Marascalco": 1,
+    "Lennon": 18,
+    "McCartney": 22,
+    "Robert Blackwell": 1,
+    "Ruth Roberts": 1,
+    "Stanley Clayton": 1,
+    "Starr": 5,
+    "Traditional": 1
+   },
+   "1970": {
+    "Harrison": 1
+   },
+   "1977": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1,
+    "Starr": 1
+   },
+   "1980": {
+    "Lennon": 1
+   }
+  },
+  "year,vocals": {
+   "1958": {
+    "Lennon": 2
+   },
+   "1960": {
+    "Instrumental": 1,
+    "McCartney": 2
+   },
+   "1961": {
+    "Instrumental": 1,
+    "Lennon": 1
+   },
+   "1962": {
+    "Harrison": 3,
+    "Lennon": 7,
+    "McCartney": 9,
+    "N/A": 1
+   },
+   "1963": {
+    "Eric Morecambe": 1,
+    "Ernie Wise": 1,
+    "Harrison": 14,
+    "Lennon": 40,
+    "McCartney": 28,
+    "Starr": 2
+   },
+   "1964": {
+    "Harrison": 5,
+    "Lennon": 28,
+    "McCartney": 21,
+    "Starr": 3
+   },
+   "1965": {
+    "Harrison": 7,
+    "Instrumental": 1,
+    "Lennon": 20,
+    "McCartney": 19,
+    "Starr": 3
+   },
+   "1966": {
+    "Harrison": 3,
+    "Lennon": 8,
+    "McCartney": 9,
+    "Starr": 1
+   },
+   "1967": {
+    "Harrison": 6,
+    "Instrumental": 2,
+    "Lennon": 16,
+    "McCartney": 15,
+    "Starr": 4
+   },
+   "1968": {
+    "Harrison": 8,
+    "Lennon": 15,
+    "McCartney": 20,
+    "Sound Collage": 1,
+    "Starr": 2
+   },
+   "1969": {
+    "Harrison": 8,
+    "Lennon": 22,
+    "McCartney": 27,
+    "Starr": 3
+   },
+   "1970": {
+    "Harrison": 1
+   },
+   "1977": {
+    "Harrison": 1,
+    "Lennon": 1,
+    "McCartney": 1
+   },
+   "1980": {
+    "Lennon": 1
+   }
+  }
+ }
+}
+
+catalog = Catalog(songs, DATA_VERSION, tables)
+
 
 if __name__ == '__main__':
     main()
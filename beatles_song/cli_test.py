@@ -2,9 +2,13 @@
 
 import os
 import sys
+import json
+import time
 import pytest
 import subprocess
 
+import beatles_song
+
 
 cli_path = os.path.join(os.path.dirname(__file__), 'beatles_song.py')
 
@@ -14,7 +18,9 @@ def do_cli(query, env=None, with_coverage=True):
     :return: stdout
     :rtype: binary string
     """
-    args = [sys.executable, cli_path, query]
+    if not isinstance(query, list):
+        query = [query]
+    args = [sys.executable, cli_path] + query
     print('executable', sys.executable)
     if with_coverage:
         args = ['coverage', 'run', '-a'] + args
@@ -25,12 +31,22 @@ def do_cli(query, env=None, with_coverage=True):
     return p, out, err
 
 
+song_tmpl = {'album': '', 'notes': '', 'songwriters': '', 'title': '', 'vocals': '', 'year': ''}
+
+
 def bstr(s):
     if sys.version_info.major == 3:
         return s.encode()
     return s
 
 
+def ustr(s):
+    # song values baked into the module are bytes in py2
+    if isinstance(s, bytes):
+        return s.decode('utf-8')
+    return s
+
+
 testdata = [
     # rank
     ({'BS_MODE': 'rank', 'BS_RATIO': '0.8', 'BS_LIMIT': '1', 'BS_FMT': '{title}|{vocals}|{year}'},
@@ -38,6 +54,9 @@ testdata = [
     # rank, special character
     ({'BS_MODE': 'rank', 'BS_RATIO': '0.75', 'BS_LIMIT': '1', 'BS_FMT': '{title}'},
      'besame mucho', bstr('Bésame Mucho')),
+    # rank, special character folded to precise match
+    ({'BS_MODE': 'rank', 'BS_RATIO': '1', 'BS_LIMIT': '1', 'BS_FMT': '{title}'},
+     'besame mucho', bstr('Bésame Mucho')),
     # rank, high ratio
     ({'BS_MODE': 'rank', 'BS_RATIO': '1', 'BS_LIMIT': '1', 'BS_FMT': '{title}|{vocals}|{year}'},
      'eight days a wee', None),
@@ -51,6 +70,21 @@ testdata = [
     # rank+fuzzy, purge
     ({'BS_MODE': 'rank,fuzzy', 'BS_PURGE_QUERY': '1', 'BS_RATIO': '0.7', 'BS_LIMIT': '1', 'BS_FMT': '{title} - {vocals}, {year}'},
      'Norwegian Wood (This Bird Has Flown)', b'Norwegian Wood (This Bird Has Flown) - Lennon, 1965'),
+    # format spec
+    ({'BS_MODE': 'rank', 'BS_FMT': '{year:*>6}|{title}%'},
+     'yesterday', b'**1965|Yesterday%'),
+    # jsonl
+    ({'BS_MODE': 'rank', 'BS_OUTPUT': 'jsonl'},
+     'yesterday', (b'{"album": "UK: Help! US: Yesterday and Today", "notes": "", "songwriters": "McCartney", '
+                   b'"title": "Yesterday", "vocals": "McCartney", "year": "1965"}')),
+    # tsv
+    ({'BS_MODE': 'rank', 'BS_OUTPUT': 'tsv'},
+     'yes it is', (b'title\talbum\tsongwriters\tvocals\tyear\tnotes\n'
+                   b'Yes It Is\tUK: Rarities US: Beatles VI\tLennon\tLennon, McCartney and Harrison\t1965\t'
+                   b'Non-album single\\nB-side of "Ticket to Ride"')),
+    # unknown output
+    ({'BS_OUTPUT': 'xml'},
+     'yesterday', None),
 ]
 
 
@@ -65,3 +99,354 @@ def test_cli(env, query, want):
         assert p.returncode == 0, 'out={} err={}'.format(out, err)
         print('out', out)
         assert out == want
+
+
+def write_data_file(path, songs):
+    with open(str(path), 'wb') as f:
+        f.write(json.dumps(songs).encode('utf-8'))
+
+
+def test_data_path(tmpdir):
+    path = tmpdir.join('songs.json')
+    write_data_file(path, {'lovemedo': dict(song_tmpl, title='Love Me Do', vocals='Lennon')})
+    p, out, err = do_cli('love me do', {'BS_DATA_PATH': str(path), 'BS_FMT': '{title}|{vocals}'}, with_coverage=False)
+    assert p.returncode == 0, 'out={} err={}'.format(out, err)
+    assert out.strip() == b'Love Me Do|Lennon'
+
+
+@pytest.mark.parametrize('songs', [
+    {'x': {'title': 'X'}},
+    {'x': dict(song_tmpl, title='X', year=1965)},
+])
+def test_data_path_invalid(tmpdir, songs):
+    path = tmpdir.join('songs.json')
+    write_data_file(path, songs)
+    with pytest.raises(ValueError):
+        beatles_song.load_catalog(str(path))
+
+    p, out, err = do_cli('x', {'BS_DATA_PATH': str(path)}, with_coverage=False)
+    assert p.returncode == 1
+    assert out.startswith(b'data file is not loaded: ')
+    assert not err
+
+
+def test_data_path_missing(tmpdir):
+    p, out, err = do_cli('x', {'BS_DATA_PATH': str(tmpdir.join('songs.json'))}, with_coverage=False)
+    assert p.returncode == 1
+    assert out.startswith(b'data file is not loaded: ')
+    assert not err
+
+
+def wait_for(f, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if f():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_catalog_reloader_thread(tmpdir):
+    path = tmpdir.join('songs.json')
+    write_data_file(path, {'x': {'title': 'X'}})
+    origin = beatles_song.get_catalog()
+    reloader = beatles_song.CatalogReloader(str(path), interval=0.01)
+    reloader.start()
+    try:
+        # a broken data file neither swaps the catalog nor kills the thread
+        time.sleep(0.1)
+        assert beatles_song.get_catalog() is origin
+        assert reloader._thread.is_alive()
+
+        write_data_file(path, {'lovemedo': dict(song_tmpl, title='Love Me Do')})
+        os.utime(str(path), (0, 0))
+        assert wait_for(lambda: beatles_song.get_catalog() is not origin)
+        assert list(beatles_song.get_catalog().songs) == ['lovemedo']
+    finally:
+        reloader.stop()
+        beatles_song.swap_catalog(origin)
+    assert reloader._thread is None
+
+
+def test_catalog_reload(tmpdir):
+    path = tmpdir.join('songs.json')
+    write_data_file(path, {'lovemedo': dict(song_tmpl, title='Love Me Do')})
+    origin = beatles_song.get_catalog()
+    reloader = beatles_song.CatalogReloader(str(path))
+    try:
+        assert reloader.check() is True
+        # tables are built by the reloader before the swap
+        assert sorted(beatles_song.get_catalog().tables) == sorted(beatles_song.table_keys)
+        # snapshot held by a search in flight is not affected by the swap
+        assert origin.songs['yesterday']['title'] == 'Yesterday'
+        assert [s['title'] for s in beatles_song.match_songs('love me do', 'rank')] == ['Love Me Do']
+        assert beatles_song.match_songs('yesterday', 'fuzzy') == []
+        # nothing changed
+        assert reloader.check() is False
+
+        write_data_file(path, {'yesterday': dict(song_tmpl, title='Yesterday')})
+        os.utime(str(path), (0, 0))
+        assert reloader.check() is True
+        assert [s['title'] for s in beatles_song.match_songs('yesterday', 'rank')] == ['Yesterday']
+    finally:
+        beatles_song.swap_catalog(origin)
+
+
+stats_testdata = [
+    (['--stats', 'year,vocals', '1958'], b'Lennon\t2'),
+    (['--stats', 'songwriters,year', 'Harrison'], b'1958\t1\n1961\t1\n1963\t1'),
+    (['--stats', 'year,songwriters', '1900'], b''),
+    (['--stats', 'title'], None),
+    (['--stats', 'year', 'Harrison'], None),
+    (['--stats'], None),
+    (['--stats', 'year', '1958', 'x'], None),
+    (['--stats', 'lead_vocal,year', 'Starr'], b'1963\t2\n1964\t2\n1965\t3'),
+]
+
+
+@pytest.mark.parametrize('args,want_prefix', stats_testdata)
+def test_stats(args, want_prefix):
+    p, out, err = do_cli(args, {}, with_coverage=False)
+    if want_prefix is None:
+        assert p.returncode != 0
+    else:
+        assert p.returncode == 0, 'out={} err={}'.format(out, err)
+        assert out.startswith(want_prefix)
+
+
+def test_stats_usage():
+    p, out, err = do_cli(['--stats'], {}, with_coverage=False)
+    assert p.returncode != 0
+    assert out.startswith(b'Usage: ')
+
+
+def test_stats_lead_vocal():
+    stats = beatles_song.catalog.table('stats')
+    # `Lennon, with McCartney` counts McCartney in vocals but not in lead_vocal
+    assert sum(stats['lead_vocal'].values()) == len([s for s in beatles_song.songs.values() if s['vocals']])
+    assert stats['lead_vocal']['McCartney'] < stats['vocals']['McCartney']
+
+
+def test_split_names():
+    assert beatles_song.split_names('Lennon, with McCartney and Harrison') == ['Lennon', 'McCartney', 'Harrison']
+    assert beatles_song.split_names('John Lennon\nPaul McCartney\nGeorge Harrison\nRingo Starr') == [
+        'Lennon', 'McCartney', 'Harrison', 'Starr']
+    assert beatles_song.split_names('McCartney (as Bernard Webb)') == ['McCartney']
+    assert beatles_song.split_names('Starkey[b]') == ['Starr']
+    assert beatles_song.split_names('N/A') == ['N/A']
+
+
+def test_completion_data():
+    path = os.path.join(os.path.dirname(__file__), 'completion', 'titles.txt')
+    with open(path, 'rb') as f:
+        lines = f.read().decode('utf-8').splitlines()
+    assert lines == sorted(lines)
+    for line in lines:
+        sig, title = line.split('\t')
+        assert ustr(beatles_song.songs[sig]['title']) == title
+    assert len(lines) == len(beatles_song.songs)
+
+
+def test_alfred_output():
+    env = {'BS_OUTPUT': 'alfred', 'BS_MODE': 'rank,fuzzy', 'BS_LIMIT': '3', 'BS_ALFRED_CACHE': '30'}
+    p, out, err = do_cli('yes', env, with_coverage=False)
+    assert p.returncode == 0, 'out={} err={}'.format(out, err)
+    data = json.loads(out.decode('utf-8'))
+    assert [i['title'] for i in data['items']] == ['Yes It Is', 'Yesterday', 'Lonesome Tears in My Eyes']
+    assert data['items'][1]['subtitle'] == 'McCartney / 1965 / UK: Help! US: Yesterday and Today'
+    assert data['cache'] == {'seconds': 30, 'loosereload': True}
+    assert 'rerun' not in data
+
+    p, out, err = do_cli('zzzzzz', env, with_coverage=False)
+    assert p.returncode == 0
+    assert json.loads(out.decode('utf-8'))['items'] == []
+
+    p, out, err = do_cli('yes', dict(env, BS_ALFRED_RERUN='0.5'), with_coverage=False)
+    assert json.loads(out.decode('utf-8'))['rerun'] == 0.5
+
+
+@pytest.mark.parametrize('env', [
+    {'BS_ALFRED_RERUN': 'x'},
+    {'BS_ALFRED_RERUN': '6'},
+    {'BS_ALFRED_CACHE': '1.5'},
+    {'BS_ALFRED_CACHE': '1'},
+    {'BS_ALFRED_CACHE': '100000'},
+])
+def test_alfred_output_invalid(env):
+    p, out, err = do_cli('yes', dict(env, BS_OUTPUT='alfred'), with_coverage=False)
+    assert p.returncode != 0
+    assert out.startswith(b'BS_ALFRED_')
+    assert err == b''
+
+
+def test_normalize():
+    assert beatles_song.normalize('Bésame Mucho') == 'besamemucho'
+    assert beatles_song.normalize("Why Don't We Do It in the Road?") == 'whydontwedoitintheroad'
+    assert beatles_song.normalize(u'\u201cÇa\u201d \u2013 Señor') == 'casenor'
+    assert beatles_song.normalize('12-Bar Original') == 'baroriginal'
+
+
+@pytest.mark.parametrize('output', ['text', 'jsonl', 'tsv', 'alfred'])
+def test_list_all_cache(tmpdir, output):
+    env = {'BS_LIST_ALL': '1', 'BS_OUTPUT': output, 'BS_CACHE_DIR': str(tmpdir)}
+    p, out, err = do_cli([], env, with_coverage=False)
+    assert p.returncode == 0, 'out={} err={}'.format(out, err)
+    cached = tmpdir.listdir()
+    assert len(cached) == 1
+    assert cached[0].read_binary() == out
+
+    p, cached_out, err = do_cli([], env, with_coverage=False)
+    assert cached_out == out
+    assert len(tmpdir.listdir()) == 1
+
+
+def test_did_you_mean():
+    env = {'BS_MODE': 'rank', 'BS_RATIO': '1'}
+    p, out, err = do_cli('eight days a wee', env, with_coverage=False)
+    assert p.returncode != 0
+    assert err.startswith(b'Did you mean: Eight Days a Week, ')
+
+    p, out, err = do_cli('eight days a wee', dict(env, BS_OUTPUT='alfred'), with_coverage=False)
+    assert p.returncode == 0
+    items = json.loads(out.decode('utf-8'))['items']
+    assert items[0]['title'] == 'Eight Days a Week'
+    assert len(items) == beatles_song.similar_limit
+
+    p, out, err = do_cli('zzzzzz', env, with_coverage=False)
+    assert p.returncode != 0
+    assert err == b''
+
+
+def test_related():
+    env = {'BS_FMT': '{title}|{album}', 'BS_LIMIT': '5'}
+    p, out, err = do_cli(['--related', 'eleanor rigby'], env, with_coverage=False)
+    assert p.returncode == 0, 'out={} err={}'.format(out, err)
+    lines = out.decode('utf-8').splitlines()
+    assert len(lines) == beatles_song.similar_limit
+    assert 'Eleanor Rigby|Revolver' not in lines
+    assert all(i.endswith('|Revolver') for i in lines)
+
+    p, out, err = do_cli(['--related', 'eleanor rigby'], dict(env, BS_LIMIT='2'), with_coverage=False)
+    assert out.decode('utf-8').splitlines() == lines[:2]
+
+
+def test_related_data_keys(tmpdir):
+    # data file keyed by signatures of an older normalize
+    path = tmpdir.join('songs.json')
+    write_data_file(path, {
+        u'bésamemucho': dict(song_tmpl, title=u'Bésame Mucho', album='Anthology 1'),
+        u'thatsallrightmama': dict(song_tmpl, title="That's All Right (Mama)", album='Anthology 1'),
+    })
+    c = beatles_song.load_catalog(str(path))
+    related = beatles_song.related_songs(c.songs[u'bésamemucho'], c)
+    assert [s['title'] for s in related] == ["That's All Right (Mama)"]
+
+
+def test_similar_table():
+    similar = beatles_song.catalog.table('similar')
+    assert set(similar) == set(beatles_song.songs)
+    for k, sigs in similar.items():
+        assert k not in sigs
+        assert len(sigs) == beatles_song.similar_limit
+
+
+def do_bash_completion(*words):
+    """
+    :return: COMPREPLY of completing the last word of `bts <words>`
+    """
+    script = os.path.join(os.path.dirname(__file__), 'completion', 'bts.bash')
+    code = 'source "$0"; COMP_WORDS=(bts "$@"); COMP_CWORD=$#; _bts; printf "%s\\n" "${COMPREPLY[@]}"'
+    env = dict(os.environ, LC_ALL='C.UTF-8')
+    out = subprocess.check_output(['bash', '-c', code, script] + [i.encode('utf-8') for i in words], env=env)
+    return [i for i in out.decode('utf-8').splitlines() if i]
+
+
+bash_completion_testdata = [
+    (['hey'], ['Hey\\ Bulldog', 'Hey\\ Jude']),
+    # readline replaces the text after an open quote and closes the quote
+    (['"hey b'], ['Hey Bulldog']),
+    (['"don\'t let'], ["Don't Let Me Down"]),
+    (["'don"], ["Don'\\''t Bother Me", "Don'\\''t Ever Change", "Don'\\''t Let Me Down", "Don'\\''t Pass Me By"]),
+    # text before the open quote is kept
+    (["don't let"], ['t Let Me Down']),
+    ([u'Bésame'], [u'Bésame\\ Mucho']),
+    (['--'], ['--stats', '--related']),
+    (['--related', 'hey j'], ['Hey\\ Jude']),
+    (['--related', 'hey', 'x'], []),
+    (['--stats', 'lead'], ['lead_vocal']),
+    (['yesterday', 'x'], []),
+]
+
+
+@pytest.mark.parametrize('words,want', bash_completion_testdata)
+def test_bash_completion(words, want):
+    assert do_bash_completion(*words) == want
+
+
+def find_executable(name):
+    for i in os.environ.get('PATH', '').split(os.pathsep):
+        path = os.path.join(i, name)
+        if os.access(path, os.X_OK):
+            return path
+    return None
+
+
+@pytest.mark.skipif(find_executable('zsh') is None, reason='zsh is not installed')
+@pytest.mark.parametrize('words,want', [
+    (['hey'], ['Hey Bulldog', 'Hey Jude']),
+    (['--'], ['--stats', '--related']),
+    (['--related', 'hey j'], ['Hey Jude']),
+    (['--stats', 'lead'], ['year', 'album', 'lead_vocal', 'vocals', 'songwriters']),
+])
+def test_zsh_completion(words, want):
+    """
+    Run _bts under `zsh -f` with compadd replaced, which prints the candidates
+    """
+    completion_dir = os.path.join(os.path.dirname(__file__), 'completion')
+    code = (
+        'fpath=("$0" $fpath); autoload -Uz _bts; '
+        'compadd() { while [[ $1 != -- ]]; do shift; done; shift; print -rl -- "$@"; }; '
+        'words=(bts "$@"); CURRENT=$(( $# + 1 )); PREFIX=${words[CURRENT]}; _bts'
+    )
+    env = dict(os.environ, LC_ALL='C.UTF-8', BTS_COMPLETION_FILE=os.path.join(completion_dir, 'titles.txt'))
+    out = subprocess.check_output(['zsh', '-f', '-c', code, completion_dir] + words, env=env)
+    assert out.decode('utf-8').splitlines() == want
+
+
+@pytest.mark.parametrize('locale', ['C', 'C.UTF-8'])
+def test_bash_completion_sig(locale):
+    script = os.path.join(os.path.dirname(__file__), 'completion', 'bts.bash')
+    words = [u'Bésa', u'ŒUVRE d\u2019Æsop', u'Señor 12-Bar!', u'Ça va']
+    code = 'source "$0"; for i in "$@"; do _bts_sig "$i"; echo; done'
+    env = dict(os.environ, LC_ALL=locale)
+    out = subprocess.check_output(['bash', '-c', code, script] + [i.encode('utf-8') for i in words], env=env)
+    assert out.decode('utf-8').splitlines() == [beatles_song.normalize(i) for i in words]
+
+
+def test_normalize_bytes():
+    # query from sys.argv is bytes in py2
+    assert beatles_song.normalize(u'Bésame Mucho'.encode('utf-8')) == 'besamemucho'
+
+
+def test_load_catalog_tables(tmpdir):
+    data_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'songs.json')
+    c = beatles_song.load_catalog(data_path)
+    assert c.version == beatles_song.DATA_VERSION
+    # a json round trip turns the py2 byte strings baked into the module into unicode
+    assert c.tables == json.loads(json.dumps(beatles_song.catalog.tables))
+
+    # stale tables are not loaded, but built the first time they are used
+    path = tmpdir.join('songs.json')
+    write_data_file(path, {'lovemedo': dict(song_tmpl, title='Love Me Do')})
+    tmpdir.join('songs.tables.json').write_binary(json.dumps({
+        'data_version': c.version, 'tables': c.tables,
+    }).encode('utf-8'))
+    c = beatles_song.load_catalog(str(path))
+    assert c.tables == {}
+    p, out, err = do_cli('love me do', {'BS_DATA_PATH': str(path), 'BS_FMT': '{title}', 'BS_DEBUG': '1'},
+                         with_coverage=False)
+    assert out.strip().endswith(b'Love Me Do')
+    assert b'build table' not in out
+    assert c.table('similar') == {'lovemedo': []}
+    assert sorted(c.tables) == ['similar']
+    assert sorted(c.build_tables()) == sorted(beatles_song.table_keys)
@@ -0,0 +1,101 @@
+# bash completion for bts
+#
+# Add this to ~/.bashrc:
+#
+#   source /path/to/completion/bts.bash
+#
+# Song titles are completed from `titles.txt` next to this file without
+# running python, set BTS_COMPLETION_FILE to use another file.
+# `fold.sed` must be in the same directory as the titles file.
+
+BTS_COMPLETION_FILE=${BTS_COMPLETION_FILE:-$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)/titles.txt}
+
+_bts_sig() {
+    # same as the signature of song title: fold.sed folds non-ascii characters
+    # like python normalize(), then ascii non-letters are deleted and
+    # letters lowered, all bytewise in C locale
+    printf '%s' "$1" \
+        | LC_ALL=C sed -f "$(dirname "$BTS_COMPLETION_FILE")/fold.sed" \
+        | LC_ALL=C tr -d '\000-\100\133-\140\173-\177' \
+        | LC_ALL=C tr 'A-Z' 'a-z'
+}
+
+_bts_titles() {
+    # titles.txt is sorted by signature, `look` does a binary search on it
+    if [ -z "$1" ]; then
+        cut -f2 "$BTS_COMPLETION_FILE"
+    elif command -v look >/dev/null 2>&1; then
+        look "$1" "$BTS_COMPLETION_FILE" | cut -f2
+    else
+        grep "^$1" "$BTS_COMPLETION_FILE" | cut -f2
+    fi
+}
+
+_bts_open_quote() {
+    # print the index of the quote left open in $1, nothing if all are closed
+    local i c q n
+    for ((i = 0; i < ${#1}; i++)); do
+        c=${1:i:1}
+        if [ -z "$q" ]; then
+            if [ "$c" = '\' ]; then
+                ((i++))
+            elif [ "$c" = "'" ] || [ "$c" = '"' ]; then
+                q=$c
+                n=$i
+            fi
+        elif [ "$c" = "$q" ]; then
+            q=
+        elif [ "$q" = '"' ] && [ "$c" = '\' ]; then
+            ((i++))
+        fi
+    done
+    [ -n "$q" ] && printf '%s' "$n"
+}
+
+_bts() {
+    local cur prev sig title quoted n q
+    cur=${COMP_WORDS[COMP_CWORD]}
+    prev=${COMP_WORDS[COMP_CWORD-1]}
+    COMPREPLY=()
+
+    if [ "$prev" = "--stats" ]; then
+        COMPREPLY=($(compgen -W "year album lead_vocal vocals songwriters" -- "$cur"))
+        return
+    fi
+    # a title is the first argument, or the one after --related
+    if [ "$COMP_CWORD" -eq 2 ] && [ "$prev" = "--related" ]; then
+        :
+    elif [ "$COMP_CWORD" -ne 1 ]; then
+        return
+    elif [[ "$cur" == -* ]]; then
+        COMPREPLY=($(compgen -W "--stats --related" -- "$cur"))
+        return
+    fi
+
+    # readline replaces only the text after a quote left open in cur,
+    # and closes the quote itself when there is one match
+    n=$(_bts_open_quote "$cur")
+    q=${n:+${cur:n:1}}
+    sig=$(_bts_sig "$cur")
+    while IFS= read -r title; do
+        # text before the quote is kept, e.g. `don't let` is completed
+        # from the same quote in `Don't Let Me Down`
+        if [ -n "$n" ] && [ "$n" -gt 0 ]; then
+            [[ "$title" == *"$q"* ]] || continue
+            title=${title#*"$q"}
+        fi
+        if [ "$q" = "'" ]; then
+            quoted=${title//\'/\'\\\'\'}
+        elif [ "$q" = '"' ]; then
+            quoted=${title//\\/\\\\}
+            quoted=${quoted//\"/\\\"}
+            quoted=${quoted//\$/\\\$}
+            quoted=${quoted//\`/\\\`}
+        else
+            printf -v quoted '%q' "$title"
+        fi
+        COMPREPLY+=("$quoted")
+    done < <(_bts_titles "$sig")
+}
+
+complete -F _bts bts
@@ -3,57 +3,103 @@
 import os
 import csv
 import json
+import hashlib
 from format_data import read_songs_wikipedia, to_song_dict
 
 
-def to_alfred_dict(sd):
-    """
-    - title
-    - subtitle
-    - arg
-    """
-    subtitle = '{} / {} / {}'.format(sd['vocals'], sd['year'], sd['album'])
-
-    return {
-        'title': sd['title'],
-        'subtitle': subtitle,
-        'arg': subtitle,
-    }
-
-
 ALFRED_CSV_PATH = './plugins/alfred/list_filter.csv'
 PY_CLI_PATH = './beatles_song/beatles_song.py'
 PY_CLI_TMPL_PATH = './beatles_song/code_template.txt'
+DATA_JSON_PATH = './data/songs.json'
+COMPLETION_DATA_PATH = './beatles_song/completion/titles.txt'
+COMPLETION_FOLD_PATH = './beatles_song/completion/fold.sed'
+
+
+def write_atomic(path, content):
+    # write to a temp file then rename, so that a reloading process
+    # never reads a half written file
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as fo:
+        fo.write(content)
+    os.rename(tmp_path, path)
+
+
+def load_cli(code_tmpl):
+    """
+    Run the cli code without songs, so that the converter shares
+    normalization and table building with it.
+    """
+    code = code_tmpl.format(version='', data_version='', songs='{}', tables='None')
+    ns = {'__name__': 'beatles_song_build'}
+    exec(compile(code, PY_CLI_PATH, 'exec'), ns)
+    return ns
 
 
 def main():
     py_cli_version = os.environ.get('PY_CLI_VERSION', '0.1.0')
     sd_list = []
-    rows = []
     for i in read_songs_wikipedia():
-        sd = to_song_dict(i)
-        sd_list.append(sd)
-        rows.append(to_alfred_dict(sd))
-    sd_list = sorted(sd_list, key=lambda x: x['title'])
+        sd_list.append(to_song_dict(i))
+    sorted_sd_list = sorted(sd_list, key=lambda x: x['title'])
+
+    with open(PY_CLI_TMPL_PATH, 'r') as ftmpl:
+        code_tmpl = ftmpl.read()
+    cli = load_cli(code_tmpl)
+
+    songs = {}
+    songs_lines = []
+    for sd in sorted_sd_list:
+        signature = cli['normalize'](sd['title'])
+        songs[signature] = sd
+        songs_lines.append('"{}": {}'.format(signature, json.dumps(sd, ensure_ascii=False, sort_keys=True)))
+    # valid as both json and python literal
+    songs_def = '{\n' + ',\n'.join(songs_lines) + '\n}'
+    songs_data = (songs_def + '\n').encode('utf-8')
+    data_version = hashlib.md5(songs_data).hexdigest()
+    tables = cli['Catalog'](songs, data_version).build_tables()
 
     print('Writing {}'.format(ALFRED_CSV_PATH))
     with open(ALFRED_CSV_PATH, 'w') as fo:
-        w = csv.DictWriter(fo, fieldnames=['title', 'subtitle', 'arg'])
+        w = csv.DictWriter(fo, fieldnames=['title', 'subtitle', 'arg'], extrasaction='ignore')
         w.writeheader()
-        for row in rows:
-            w.writerow(row)
+        for sd in sd_list:
+            w.writerow(cli['to_alfred_item'](sd))
+
+    # tables first, a reloading process that sees the new data file
+    # then finds tables of the same version next to it
+    tables_path = cli['tables_path_of'](DATA_JSON_PATH)
+    print('Writing {}'.format(tables_path))
+    tables_data = json.dumps(
+        {'data_version': data_version, 'tables': tables},
+        ensure_ascii=False, sort_keys=True,
+    )
+    write_atomic(tables_path, tables_data.encode('utf-8'))
+
+    print('Writing {}'.format(DATA_JSON_PATH))
+    write_atomic(DATA_JSON_PATH, songs_data)
+
+    # sorted by signature, so that completion scripts can do prefix search by `look`
+    print('Writing {}'.format(COMPLETION_DATA_PATH))
+    completion_data = ''.join('{}\t{}\n'.format(k, v['title']) for k, v in sorted(songs.items()))
+    write_atomic(COMPLETION_DATA_PATH, completion_data.encode('utf-8'))
+
+    # non-ascii part of the normalize table as a sed script, completion scripts
+    # run it in C locale to get the same signature regardless of user locale
+    print('Writing {}'.format(COMPLETION_FOLD_PATH))
+    fold_data = ''.join(
+        's/{}/{}/g\n'.format(chr(k), v or '')
+        for k, v in sorted(cli['normalize_table'].items()) if k >= 0x80
+    )
+    write_atomic(COMPLETION_FOLD_PATH, fold_data.encode('utf-8'))
 
     print('Writing {}'.format(PY_CLI_PATH))
-    with open(PY_CLI_TMPL_PATH, 'r') as ftmpl:
-        code_tmpl = ftmpl.read()
     with open(PY_CLI_PATH, 'w') as fpy:
-        songs_def = '{\n'
-        for sd in sd_list:
-            # keep only letter
-            signature = ''.join(i for i in sd['title'] if i.isalpha()).lower()
-            songs_def += '"{}": {},\n'.format(signature, json.dumps(sd, ensure_ascii=False, sort_keys=True))
-        songs_def += '}'
-        code = code_tmpl.format(py_cli_version, songs_def)
+        code = code_tmpl.format(
+            version=py_cli_version,
+            data_version=data_version,
+            songs=songs_def,
+            tables=json.dumps(tables, ensure_ascii=False, sort_keys=True, indent=1),
+        )
         fpy.write(code)
 
 
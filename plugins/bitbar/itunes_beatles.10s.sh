@@ -146,6 +146,11 @@ if [ "$track" != "no track selected" ]; then
         if [ $rc -eq 0 ]; then
             song_str="$beatles_info"
             #echo "set song str, $song_str"
+            beatles_related=$(BS_PURGE_QUERY=1 \
+                BS_FMT='{title} - {vocals}, {year}' \
+                BS_LIMIT=5 \
+                BS_MODE='rank,fuzzy' \
+                "$BTS_PATH" --related "$track" 2>/dev/null)
         else
             song_str="$song_str (bts failed $rc)"
             echo "bts result: $beatles_info"
@@ -174,4 +179,12 @@ if [ "$track" != "no track selected" ]; then
     echo "$album | size=12 color=$COLOR3 length=30"
 fi
 
+if [ -n "$beatles_related" ]; then
+    echo "---"
+    echo "Related songs | color=$COLOR2"
+    while IFS= read -r line; do
+        echo "$line | size=12 color=$COLOR3"
+    done <<< "$beatles_related"
+fi
+
 echo '---'